@@ -14,6 +14,7 @@ export default function BlogsPage() {
   const [showCreateBlog, setShowCreateBlog] = useState(false);
   const [newBlog, setNewBlog] = useState({ title: "", content: "" });
   const [creatingBlog, setCreatingBlog] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
 
   useEffect(() => {
     fetchUserProfile();
@@ -42,17 +43,21 @@ const fetchUserProfile = async () => {
 };
 
 
-  const fetchBlogs = async () => {
+  const fetchBlogs = async (cursor = null) => {
     try {
       const token = localStorage.getItem("token");
       const response = await axios.get("http://localhost:8000/api/blog/", {
+        params: cursor ? { cursor } : {},
         headers: {
           Authorization: `Bearer ${token}`,
         },
       });
 
       if (response.data.code === 0) {
-        setBlogs(response.data.data || []);
+        const page = response.data.data || [];
+        // A cursor means we are appending the next page, otherwise start over
+        setBlogs(prev => (cursor ? [...prev, ...page] : page));
+        setNextCursor(response.data.next || null);
       } else {
         setError(response.data.message || "Failed to fetch blogs");
       }
@@ -99,16 +104,38 @@ const fetchUserProfile = async () => {
     }
   };
 
+  // The reaction endpoints return the new likes/dislikes, so patch them in place instead of refetching
+  const applyReactionCounts = (response, kind, id) => {
+    if (response.data.code !== 0) {
+      alert(response.data.message);
+      return;
+    }
+    const counts = response.data.data;
+    const patch = (item) => (item.id === id ? { ...item, ...counts } : item);
+    setBlogs(prev => prev.map(blog => {
+      if (kind === 'blog') {
+        return patch(blog);
+      }
+      return {
+        ...blog,
+        comments: (blog.comments || []).map(comment => (
+          kind === 'comment'
+            ? patch(comment)
+            : { ...comment, replies: (comment.replies || []).map(patch) }
+        )),
+      };
+    }));
+  };
+
   const handleBlogReaction = async (blogId, action) => {
     try {
       const token = localStorage.getItem("token");
-      await axios.post(`http://localhost:8000/api/blog/${action}/${blogId}/`, {}, {
+      const response = await axios.post(`http://localhost:8000/api/blog/${action}/${blogId}/`, {}, {
         headers: {
           Authorization: `Bearer ${token}`,
         },
       });
-      // Refresh blogs to get updated counts
-      fetchBlogs();
+      applyReactionCounts(response, 'blog', blogId);
     } catch (error) {
       console.error(`Error ${action}ing blog:`, error);
       alert(`Failed to ${action} blog: ${error.response?.data?.message || error.message}`);
@@ -118,13 +145,12 @@ const fetchUserProfile = async () => {
   const handleCommentReaction = async (commentId, action) => {
     try {
       const token = localStorage.getItem("token");
-      await axios.post(`http://localhost:8000/api/comment/${action}/${commentId}/`, {}, {
+      const response = await axios.post(`http://localhost:8000/api/comment/${action}/${commentId}/`, {}, {
         headers: {
           Authorization: `Bearer ${token}`,
         },
       });
-      // Refresh blogs to get updated counts
-      fetchBlogs();
+      applyReactionCounts(response, 'comment', commentId);
     } catch (error) {
       console.error(`Error ${action}ing comment:`, error);
       alert(`Failed to ${action} comment: ${error.response?.data?.message || error.message}`);
@@ -134,13 +160,12 @@ const fetchUserProfile = async () => {
   const handleReplyReaction = async (replyId, action) => {
     try {
       const token = localStorage.getItem("token");
-      await axios.post(`http://localhost:8000/api/reply/${action}/${replyId}/`, {}, {
+      const response = await axios.post(`http://localhost:8000/api/reply/${action}/${replyId}/`, {}, {
         headers: {
           Authorization: `Bearer ${token}`,
         },
       });
-      // Refresh blogs to get updated counts
-      fetchBlogs();
+      applyReactionCounts(response, 'reply', replyId);
     } catch (error) {
       console.error(`Error ${action}ing reply:`, error);
       alert(`Failed to ${action} reply: ${error.response?.data?.message || error.message}`);
@@ -839,6 +864,23 @@ const fetchUserProfile = async () => {
               )}
             </div>
           ))}
+          {nextCursor && (
+            <div style={{ textAlign: "center", margin: "25px 0" }}>
+              <button
+                onClick={() => fetchBlogs(nextCursor)}
+                style={{
+                  padding: "10px 20px",
+                  backgroundColor: "#007bff",
+                  color: "white",
+                  border: "none",
+                  borderRadius: "5px",
+                  cursor: "pointer"
+                }}
+              >
+                Load more
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
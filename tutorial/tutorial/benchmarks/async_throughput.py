@@ -0,0 +1,156 @@
+"""
+Throughput of the blog list and detail endpoints, sync views under WSGI vs the async views under ASGI.
+
+    python -m benchmarks.async_throughput --connections 200 --requests 2000 --threads 8
+
+No server is needed (nor installed): the WSGI application serves --threads requests at a time, as a
+threaded WSGI server would, with --connections clients queueing on it, and the ASGI application
+is called from --connections concurrent clients on one event loop, as uvicorn would. Both run against
+the same seeded SQLite file (WAL, see SQLITE_PRODUCTION_OPTIONS) with the same reader's JWT.
+The server side only is measured, the network and the HTTP parsing are left out.
+"""
+import argparse
+import asyncio
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.django_setup import setup_django, use_database
+
+ENDPOINTS = {
+    'list': ('/api/blog/', '/api/async/blog/'),
+    'detail': ('/api/blog/{pk}/', '/api/async/blog/{pk}/'),
+}
+
+
+def report(name, latencies, statuses, elapsed):
+    latencies = sorted(latencies)
+    errors = sum(1 for status in statuses if status != 200)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f'{name:14} {len(latencies) / elapsed:8.0f} req/s  {errors:5} errors  '
+          f'p50 {p50:8.2f} ms  p99 {p99:8.2f} ms')
+
+
+def run_wsgi(paths, authorization, connections, threads):
+    from tutorial.wsgi import application
+    # Only `threads` requests are served at a time, the other clients wait (that is in their latency)
+    workers = threading.BoundedSemaphore(threads)
+
+    def call(path):
+        environ = {
+            'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SERVER_NAME': 'localhost',
+            'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1', 'HTTP_AUTHORIZATION': authorization,
+            'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(), 'wsgi.errors': io.StringIO(),
+            'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+        }
+        status = []
+        started = time.perf_counter()
+        with workers:
+            body = application(environ, lambda response_status, headers: status.append(response_status))
+            b''.join(body)
+            body.close()
+        return time.perf_counter() - started, int(status[0].split()[0])
+
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(call, paths))
+        elapsed = time.perf_counter() - started
+    return [latency for latency, _ in results], [status for _, status in results], elapsed
+
+
+def run_asgi(paths, authorization, connections):
+    from tutorial.asgi import application
+
+    async def call(path):
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+            'headers': [(b'host', b'localhost'), (b'authorization', authorization.encode())],
+            'client': ('127.0.0.1', 0), 'server': ('localhost', 80),
+        }
+        status, messages = [], [{'type': 'http.request', 'body': b'', 'more_body': False}]
+        done = asyncio.Event()
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # Django listens for the client going away until the response is sent
+            await done.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status.append(message['status'])
+
+        started = time.perf_counter()
+        await application(scope, receive, send)
+        done.set()
+        return time.perf_counter() - started, status[0]
+
+    async def client(queue, results):
+        while queue:
+            results.append(await call(queue.pop()))
+
+    async def main():
+        queue, results = list(paths), []
+        started = time.perf_counter()
+        await asyncio.gather(*(client(queue, results) for _ in range(connections)))
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(main())
+    return [latency for latency, _ in results], [status for _, status in results], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--connections', type=int, default=200, help='Concurrent clients')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per endpoint and server')
+    parser.add_argument('--threads', type=int, default=8, help='WSGI worker threads')
+    parser.add_argument('--blogs', type=int, default=200)
+    args = parser.parse_args()
+
+    # Under this load every request is "slow", keep the timing log quiet
+    os.environ.setdefault('REQUEST_TIMING_SLOW_MS', '1e9')
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.db import connections
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from quickstart.models.blog_models import BlogModel
+    from quickstart.permissions.roles import ROLE_CLAIM
+    from quickstart.utils.seed_data import seed_blog_data
+
+    directory = tempfile.mkdtemp(prefix='async-bench-')
+    try:
+        use_database(os.path.join(directory, 'bench.sqlite3'), settings.SQLITE_PRODUCTION_OPTIONS)
+        call_command('migrate', verbosity=0)
+        seed_blog_data(users=200, writers=20, blogs=args.blogs, comments_per_blog=5, replies_per_comment=1,
+                       reactions_per_blog=5, reactions_per_comment=1, subscriptions_per_user=5)
+        reader = User.objects.select_related('profile').filter(profile__role='viewer').first()
+        refresh = RefreshToken.for_user(reader)
+        refresh[ROLE_CLAIM] = reader.profile.role
+        authorization = f'Bearer {refresh.access_token}'
+        blog_ids = list(BlogModel.objects.values_list('id', flat=True))
+        connections.close_all()
+
+        print(f'{args.requests} requests per run, {args.connections} connections, '
+              f'{args.threads} WSGI threads, {args.blogs} blogs')
+        for endpoint, (sync_path, async_path) in ENDPOINTS.items():
+            pks = [blog_ids[i % len(blog_ids)] for i in range(args.requests)]
+            report(f'{endpoint} wsgi',
+                   *run_wsgi([sync_path.format(pk=pk) for pk in pks], authorization, args.connections, args.threads))
+            report(f'{endpoint} asgi',
+                   *run_asgi([async_path.format(pk=pk) for pk in pks], authorization, args.connections))
+    finally:
+        connections.close_all()
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+import os
+import sys
+from pathlib import Path
+
+# Standalone benchmark scripts: make the project importable and load the Django settings
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    sys.path.insert(0, str(PROJECT_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tutorial.settings')
+    os.environ.setdefault('EMAIL_HOST_USER', 'benchmark@example.com')
+    os.environ.setdefault('EMAIL_HOST_PASSWORD', 'benchmark')
+
+    import django
+    django.setup()
+
+
+def use_database(path, options):
+    """Points the default connection at `path` before it is opened"""
+    from django.db import connections
+    connections['default'].close()
+    settings_dict = connections['default'].settings_dict
+    settings_dict['NAME'] = path
+    settings_dict['OPTIONS'] = dict(options)
+    settings_dict['CONN_MAX_AGE'] = None
@@ -0,0 +1,109 @@
+"""
+Messages per second of the blog notification delivery against a local debugging SMTP server.
+
+    python -m benchmarks.email_throughput --messages 2000 --connect-latency 50
+
+Compares the old one-send_mail-per-subscriber loop with the pooled, chunked send_email_chunk.
+--connect-latency adds a delay to every new SMTP connection to stand in for the TCP + TLS handshake
+of a real provider (the local server itself speaks plain SMTP).
+"""
+import argparse
+import socketserver
+import threading
+import time
+
+from benchmarks.django_setup import setup_django
+
+
+class SinkSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept and discard messages"""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        time.sleep(self.server.connect_latency)
+        self.reply('220 localhost benchmark sink')
+        in_data = False
+        for raw in self.rfile:
+            line = raw.decode(errors='replace').rstrip('\r\n')
+            if in_data:
+                if line == '.':
+                    in_data = False
+                    self.server.delivered += 1
+                    self.reply('250 OK')
+                continue
+
+            command = line[:4].upper()
+            if command == 'EHLO':
+                self.reply('250-localhost')
+                self.reply('250 8BITMIME')
+            elif command == 'DATA':
+                in_data = True
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+class SinkSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, connect_latency):
+        super().__init__(('127.0.0.1', 0), SinkSMTPHandler)
+        self.connect_latency = connect_latency
+        self.delivered = 0
+
+
+def per_message(subject, body, recipients):
+    from django.conf import settings
+    from django.core.mail import send_mail
+
+    for email in recipients:
+        send_mail(subject, body, settings.EMAIL_HOST_USER, [email], fail_silently=False)
+
+
+def chunked(subject, body, recipients):
+    from django.conf import settings
+    from quickstart.tasks.email_tasks import send_email_chunk
+
+    batch_size = settings.EMAIL_BATCH_SIZE
+    for start in range(0, len(recipients), batch_size):
+        send_email_chunk(subject, body, recipients[start:start + batch_size])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--messages', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--connect-latency', type=float, default=0, help='milliseconds per new connection')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+
+    server = SinkSMTPServer(args.connect_latency / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    settings.EMAIL_HOST, settings.EMAIL_PORT = server.server_address
+    settings.EMAIL_USE_TLS = False
+    settings.EMAIL_HOST_PASSWORD = ''
+    settings.EMAIL_BATCH_SIZE = args.batch_size
+
+    recipients = [f'reader{i}@example.com' for i in range(args.messages)]
+    for name, deliver in (('per-message send_mail', per_message), ('pooled chunks', chunked)):
+        server.delivered = 0
+        started = time.perf_counter()
+        deliver('Benchmark', 'Hello Subscriber', recipients)
+        elapsed = time.perf_counter() - started
+        print(f'{name:>22}: {server.delivered} messages in {elapsed:.2f}s -> {server.delivered / elapsed:,.0f} msg/s')
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
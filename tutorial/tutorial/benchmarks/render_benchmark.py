@@ -0,0 +1,101 @@
+"""
+Encode time and payload size of a blog list envelope with the different encoders.
+
+    python -m benchmarks.render_benchmark --blogs 100 --comments 10 --replies 2 --rounds 50
+
+The payload has the same shape as GET /api/blog/ (blog fields, author, subscription fields and the
+comment tree with serializer output), no database is needed.
+stdlib is what JsonResponse + DjangoJSONEncoder did before; msgpack is skipped when it is not installed.
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.django_setup import setup_django
+
+
+def build_blog_list(blogs, comments, replies):
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    data = []
+    for blog_id in range(1, blogs + 1):
+        blog_comments = []
+        for c in range(comments):
+            comment_id = blog_id * 1000 + c
+            blog_comments.append({
+                'id': comment_id,
+                'user': f'viewer{c % 50}',
+                'blog': blog_id,
+                'comment': f'Comment {c} on blog {blog_id}, ' + 'some text ' * 8,
+                'likes': c % 7,
+                'dislikes': c % 3,
+                'created': (created + timedelta(minutes=c)).isoformat(),
+                'replies': [{
+                    'id': comment_id * 10 + r,
+                    'user': f'writer{r}',
+                    'comment': comment_id,
+                    'reply': f'Reply {r} ' + 'more text ' * 5,
+                    'likes': r,
+                    'dislikes': 0,
+                    'created': (created + timedelta(minutes=c, seconds=r)).isoformat(),
+                } for r in range(replies)],
+            })
+        data.append({
+            'id': blog_id,
+            'title': f'Blog post number {blog_id}',
+            'content': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 20,
+            'likes': blog_id % 40,
+            'dislikes': blog_id % 9,
+            'author': f'writer{blog_id % 20}',
+            'author_id': blog_id % 20 + 1,
+            'is_subscribed': blog_id % 2 == 0,
+            'author_subscribers_count': blog_id * 3,
+            'comments': blog_comments,
+        })
+    return {
+        'code': 0,
+        'status': 'success',
+        'message': 'Blog Post Successfully Fetched',
+        'data': data,
+        'next': 'MjAyNC0wMS0wMVQwMDowMDowMCswMDowMA',
+    }
+
+
+def measure(encode, payload, rounds):
+    body = encode(payload)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        encode(payload)
+    elapsed = (time.perf_counter() - started) / rounds
+    return elapsed * 1000, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blogs', type=int, default=100)
+    parser.add_argument('--comments', type=int, default=10)
+    parser.add_argument('--replies', type=int, default=2)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.serializers.json import DjangoJSONEncoder
+    from quickstart.utils import renderers
+
+    payload = build_blog_list(args.blogs, args.comments, args.replies)
+    encoders = {'stdlib json (JsonResponse)': lambda data: json.dumps(data, cls=DjangoJSONEncoder).encode()}
+    if renderers.orjson is not None:
+        encoders['orjson'] = renderers.dumps_json
+    if renderers.msgpack_available():
+        encoders['msgpack'] = renderers.dumps_msgpack
+
+    print(f"{args.blogs} blogs x {args.comments} comments x {args.replies} replies, {args.rounds} rounds")
+    baseline = None
+    for name, encode in encoders.items():
+        ms, size = measure(encode, payload, args.rounds)
+        baseline = baseline or ms
+        print(f"{name:28} {ms:8.2f} ms/encode  {size / 1024:9.1f} KiB  x{baseline / ms:5.1f}")
+
+
+if __name__ == '__main__':
+    main()
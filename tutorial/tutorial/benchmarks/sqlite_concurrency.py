@@ -0,0 +1,99 @@
+"""
+Write throughput of SQLite under parallel writers, default settings vs SQLITE_PRODUCTION_OPTIONS.
+
+    python -m benchmarks.sqlite_concurrency --workers 8 --requests 200
+
+Every worker is a separate process (as gunicorn workers are) and plays requests against a fresh copy
+of the schema: a transaction that reads (like the views do) and then writes an ActivityLog and an
+ErrorLog row. With the default DEFERRED transactions and rollback journal, two of them upgrading
+their read lock at the same time end in "database is locked". The production options (WAL,
+IMMEDIATE, busy_timeout, ...) make them queue for the write lock instead.
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.django_setup import setup_django, use_database
+
+
+def worker(path, options, requests, start, results):
+    setup_django()
+    from django.db import OperationalError, transaction
+    from quickstart.models.signals_model import ActivityLog, ErrorLog
+
+    use_database(path, options)
+    pid = os.getpid()
+    latencies, errors = [], 0
+    start.wait()
+    for i in range(requests):
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                ActivityLog.objects.filter(instance_id=i, model_name='benchmark').exists()
+                ActivityLog.objects.create(action='created', model_name='benchmark', instance_id=i)
+                ErrorLog.objects.create(path=f'/bench/{pid}/', method='GET', message='benchmark', status_code=200)
+        except OperationalError:
+            errors += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+    results.put((latencies, errors))
+
+
+def run(name, template, directory, options, workers, requests):
+    path = os.path.join(directory, f'{name}.sqlite3')
+    shutil.copy(template, path)
+    start = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=worker, args=(path, options, requests, start, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    # Let every worker import Django before the clock starts
+    time.sleep(2)
+    started = time.perf_counter()
+    start.set()
+    collected = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+
+    latencies = sorted(latency for worker_latencies, _ in collected for latency in worker_latencies)
+    errors = sum(worker_errors for _, worker_errors in collected)
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0
+    print(f'{name:12} {len(latencies) / elapsed:9.0f} req/s  {errors:6} locked  '
+          f'p50 {p50:7.2f} ms  p99 {p99:8.2f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='Write transactions per worker')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.management import call_command
+
+    directory = tempfile.mkdtemp(prefix='sqlite-bench-')
+    try:
+        template = os.path.join(directory, 'template.sqlite3')
+        use_database(template, {})
+        call_command('migrate', verbosity=0)
+        from django.db import connections
+        connections['default'].close()
+
+        print(f'{args.workers} processes x {args.requests} write transactions')
+        run('default', template, directory, {}, args.workers, args.requests)
+        run('production', template, directory, settings.SQLITE_PRODUCTION_OPTIONS, args.workers, args.requests)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 from django.urls import path
-from profile_api.views import ProfileAPIView
+from profile_api.views import AsyncProfileAPIView, ProfileAPIView
 
 urlpatterns = [
-    path('profile/', ProfileAPIView.as_view(), name='profile')
+    path('profile/', ProfileAPIView.as_view(), name='profile'),
+    path('async/profile/', AsyncProfileAPIView.as_view(), name='asyncprofile'),
 ]
\ No newline at end of file
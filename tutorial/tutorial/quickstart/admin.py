@@ -2,8 +2,8 @@ from django.contrib import admin
 from quickstart.models.blog_models import BlogModel, BlogPostCommentModel, ReplyCommentModel
 from quickstart.models.authentication_models import User_Data, LoginModel
 from quickstart.models.reaction_models import BlogReactionModel, CommentReactionModel, ReplyReactionModel
-from quickstart.models.signals_model import ActivityLog, BlogActivityMap, ErrorLog
-from quickstart.models.subscription_models import SubscribeTable, UnsubscribeTable
+from quickstart.models.signals_model import ActivityLog, ErrorLog
+from quickstart.models.subscription_models import SubscribeTable, UnsubscribeTable, AuthorSubscriptionStats
 
 admin.site.register(User_Data)
 admin.site.register(BlogModel)
@@ -15,6 +15,6 @@ admin.site.register(LoginModel)
 admin.site.register(BlogPostCommentModel)
 admin.site.register(SubscribeTable)
 admin.site.register(UnsubscribeTable)
+admin.site.register(AuthorSubscriptionStats)
 admin.site.register(ActivityLog)
-admin.site.register(BlogActivityMap)
 admin.site.register(ErrorLog)
\ No newline at end of file
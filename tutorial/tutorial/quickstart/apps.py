@@ -5,4 +5,6 @@ class QuickstartConfig(AppConfig):
     name = 'quickstart'
 
     def ready(self):
-        import quickstart.signals
\ No newline at end of file
+        import quickstart.signals
+        # Connects the per-request query timer to every new database connection
+        import quickstart.utils.request_timing
\ No newline at end of file
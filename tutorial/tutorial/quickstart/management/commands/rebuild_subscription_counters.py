@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from quickstart.utils.subscription_counters import rebuild_subscription_counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-author active/total subscription counters from SubscribeTable'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        authors = rebuild_subscription_counters(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt subscription counters for {authors} authors'))
@@ -0,0 +1,33 @@
+import json
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from quickstart.utils.request_timing import METRICS, load_timing_summary
+
+
+class Command(BaseCommand):
+    help = 'Per-view p50/p90/p99 of the rolling request timings written by RequestTimingMiddleware'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', default=None, help='Defaults to REQUEST_TIMING_SUMMARY_DIR')
+        parser.add_argument('--json', action='store_true', help='Dump the summary as JSON')
+
+    def handle(self, *args, **options):
+        directory = options['dir'] or settings.REQUEST_TIMING_SUMMARY_DIR
+        if not directory:
+            raise CommandError('Set REQUEST_TIMING_SUMMARY_DIR (or pass --dir) to collect request timings')
+
+        summary = load_timing_summary(directory)
+        if options['json']:
+            self.stdout.write(json.dumps(summary, indent=2))
+            return
+        if not summary:
+            self.stdout.write(f'No request timings in {directory}')
+            return
+
+        self.stdout.write(f'{"view":40} {"requests":>8}  ' + '  '.join(f'{m + " p50/p90/p99":>26}' for m in METRICS))
+        for view, stats in summary.items():
+            columns = []
+            for metric in METRICS:
+                values = (stats[metric]['p50'], stats[metric]['p90'], stats[metric]['p99'])
+                columns.append(f'{"/".join(f"{value:.1f}" for value in values):>26}')
+            self.stdout.write(f'{view:40} {stats["requests"]:>8}  ' + '  '.join(columns))
@@ -0,0 +1,54 @@
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from quickstart.utils.seed_data import seed_blog_data
+
+
+class Command(BaseCommand):
+    help = 'Fill the database with a reproducible synthetic dataset (users, blogs, comments, reactions, subscriptions)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--writers', type=int, default=None, help='Users with the writer role (default 10%%)')
+        parser.add_argument('--blogs', type=int, default=2000)
+        parser.add_argument('--comments-per-blog', type=int, default=5)
+        parser.add_argument('--replies-per-comment', type=int, default=1)
+        parser.add_argument('--reactions-per-blog', type=int, default=5)
+        parser.add_argument('--reactions-per-comment', type=int, default=1)
+        parser.add_argument('--subscriptions-per-user', type=int, default=3)
+        parser.add_argument('--skew', type=float, default=1.0, help='Zipf exponent of popularity, 0 is uniform')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--prefix', default='seed', help='Username prefix of the seeded users')
+        parser.add_argument('--password', default='seedpass123', help='Password of every seeded user')
+
+    def handle(self, *args, **options):
+        if User.objects.filter(username__startswith=options['prefix']).exists():
+            raise CommandError(f"Users starting with '{options['prefix']}' already exist, pick another --prefix")
+
+        writers = options['writers']
+        if writers is None:
+            writers = max(1, options['users'] // 10)
+
+        started = time.perf_counter()
+        created = seed_blog_data(
+            users=options['users'],
+            writers=writers,
+            blogs=options['blogs'],
+            comments_per_blog=options['comments_per_blog'],
+            replies_per_comment=options['replies_per_comment'],
+            reactions_per_blog=options['reactions_per_blog'],
+            reactions_per_comment=options['reactions_per_comment'],
+            subscriptions_per_user=options['subscriptions_per_user'],
+            skew=options['skew'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            prefix=options['prefix'],
+            password=options['password'],
+            log=self.stdout.write
+        )
+        rows = sum(created.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {rows} rows in {time.perf_counter() - started:.1f}s: '
+            + ', '.join(f'{count} {table}' for table, count in created.items())
+        ))
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_subscription_stats(apps, schema_editor):
+    SubscribeTable = apps.get_model('quickstart', 'SubscribeTable')
+    AuthorSubscriptionStats = apps.get_model('quickstart', 'AuthorSubscriptionStats')
+    db_alias = schema_editor.connection.alias
+
+    rows = SubscribeTable.objects.using(db_alias).values('author_id').annotate(
+        active=Count('id', filter=Q(is_active=True)),
+        total=Count('id'),
+    )
+    AuthorSubscriptionStats.objects.using(db_alias).bulk_create([
+        AuthorSubscriptionStats(
+            author_id=row['author_id'],
+            active_subscribers=row['active'],
+            total_subscriptions_ever=row['total'],
+        )
+        for row in rows
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quickstart', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthorSubscriptionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('active_subscribers', models.PositiveIntegerField(default=0)),
+                ('total_subscriptions_ever', models.PositiveIntegerField(default=0)),
+                ('author', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='subscription_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RunPython(backfill_subscription_stats, migrations.RunPython.noop),
+    ]
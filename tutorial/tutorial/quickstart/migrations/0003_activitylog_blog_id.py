@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:57
+
+from django.db import migrations, models
+
+
+def backfill_activity_blog_id(apps, schema_editor):
+    BlogActivityMap = apps.get_model('quickstart', 'BlogActivityMap')
+    ActivityLog = apps.get_model('quickstart', 'ActivityLog')
+    Through = BlogActivityMap.activity_logs.through
+    db_alias = schema_editor.connection.alias
+
+    for blog_id, activity_map_id in BlogActivityMap.objects.using(db_alias).values_list('blog_id', 'id').iterator():
+        ActivityLog.objects.using(db_alias).filter(
+            id__in=Through.objects.using(db_alias).filter(blogactivitymap_id=activity_map_id).values('activitylog_id')
+        ).update(blog_id=blog_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quickstart', '0002_author_subscription_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activitylog',
+            name='blog_id',
+            field=models.BigIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_activity_blog_id, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='BlogActivityMap',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quickstart', '0003_activitylog_blog_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='errorlog',
+            name='occurrences',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
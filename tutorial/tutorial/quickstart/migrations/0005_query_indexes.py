@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quickstart', '0004_errorlog_occurrences'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['timestamp'], name='activitylog_timestamp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogmodel',
+            index=models.Index(fields=['created', 'id'], name='blog_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpostcommentmodel',
+            index=models.Index(fields=['blog', 'created'], name='comment_blog_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogreactionmodel',
+            index=models.Index(fields=['blog', 'reaction'], name='blogreact_blog_reaction_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='commentreactionmodel',
+            index=models.Index(fields=['comment', 'reaction'], name='commentreact_reaction_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='errorlog',
+            index=models.Index(fields=['created'], name='errorlog_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='replycommentmodel',
+            index=models.Index(fields=['comment', 'created'], name='reply_comment_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='replyreactionmodel',
+            index=models.Index(fields=['reply', 'reaction'], name='replyreact_reaction_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscribetable',
+            index=models.Index(fields=['author', 'is_active'], name='sub_author_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscribetable',
+            index=models.Index(fields=['subscriber', 'author', 'is_active'], name='sub_subscriber_author_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:35
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def deactivate_duplicate_subscriptions(apps, schema_editor):
+    # Concurrent subscribe clicks could leave several active rows for one (subscriber, author):
+    # keep the oldest one active, then recount the active subscribers of the authors involved
+    SubscribeTable = apps.get_model('quickstart', 'SubscribeTable')
+    AuthorSubscriptionStats = apps.get_model('quickstart', 'AuthorSubscriptionStats')
+    db_alias = schema_editor.connection.alias
+
+    duplicates = (
+        SubscribeTable.objects.using(db_alias).filter(is_active=True)
+        .values('subscriber_id', 'author_id')
+        .annotate(rows=Count('id'), keep_id=Min('id'))
+        .filter(rows__gt=1)
+    )
+    authors = set()
+    for group in duplicates:
+        SubscribeTable.objects.using(db_alias).filter(
+            subscriber_id=group['subscriber_id'],
+            author_id=group['author_id'],
+            is_active=True
+        ).exclude(id=group['keep_id']).update(is_active=False)
+        authors.add(group['author_id'])
+
+    for author_id in authors:
+        AuthorSubscriptionStats.objects.using(db_alias).filter(author_id=author_id).update(
+            active_subscribers=SubscribeTable.objects.using(db_alias).filter(author_id=author_id, is_active=True).count()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quickstart', '0005_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(deactivate_duplicate_subscriptions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='subscribetable',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('subscriber', 'author'), name='unique_active_subscription'),
+        ),
+    ]
@@ -16,6 +16,10 @@ class BlogModel(models.Model):
 
     class Meta:
         ordering = ['created']
+        indexes = [
+            # Keyset pagination of the feed walks (created, id)
+            models.Index(fields=['created', 'id'], name='blog_created_id_idx'),
+        ]
 
 
 class BlogPostCommentModel(models.Model):
@@ -28,6 +32,10 @@ class BlogPostCommentModel(models.Model):
 
     class Meta:
         ordering = ['created']
+        indexes = [
+            # Comment trees: comments of a set of blogs in (created, id) order
+            models.Index(fields=['blog', 'created'], name='comment_blog_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} commented on '{self.blog.title}'"
@@ -45,6 +53,10 @@ class ReplyCommentModel(models.Model):
 
     class Meta:
         ordering = ['created']
+        indexes = [
+            # Replies of a set of comments in (created, id) order
+            models.Index(fields=['comment', 'created'], name='reply_comment_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} replied on '{self.comment.blog.title}'"
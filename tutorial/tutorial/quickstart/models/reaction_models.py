@@ -18,6 +18,9 @@ class BlogReactionModel(models.Model):
 
     class Meta:
         unique_together = ('user', 'blog')  # One reaction per user per blog
+        indexes = [
+            models.Index(fields=['blog', 'reaction'], name='blogreact_blog_reaction_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} reacted {self.reaction} to '{self.blog.title}'"
@@ -36,6 +39,10 @@ class CommentReactionModel(models.Model):
 
     class Meta:
         unique_together = ('user', 'comment')  # One reaction per user per comment
+        indexes = [
+            # Like / dislike counts of the comment trees
+            models.Index(fields=['comment', 'reaction'], name='commentreact_reaction_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} reacted {self.reaction} to comment on '{self.comment.blog.title}'"
@@ -54,6 +61,9 @@ class ReplyReactionModel(models.Model):
 
     class Meta:
         unique_together = ('user', 'reply')  # One reaction per user per reply
+        indexes = [
+            models.Index(fields=['reply', 'reaction'], name='replyreact_reaction_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} reacted {self.reaction} to reply"
@@ -18,7 +18,14 @@ class ActivityLog(models.Model):
         (2, 'Deleted'),
     )
     status = models.IntegerField(default=1, choices=STATUS_CHOICES)
+    # Blog the activity belongs to, plain indexed column (not a FK) so the logs outlive the blog
+    blog_id = models.BigIntegerField(null=True, blank=True, db_index=True)
 
+    class Meta:
+        indexes = [
+            # Audit views and clean-up jobs read the log by time
+            models.Index(fields=['timestamp'], name='activitylog_timestamp_idx'),
+        ]
 
     def __str__(self):
         status_str = dict(self.STATUS_CHOICES).get(self.status, 'Unknown')
@@ -30,16 +37,6 @@ class ActivityLog(models.Model):
         return f"[{status_str}] {username} {self.action} {self.model_name}(#{self.instance_id})"
 
 
-# This model is solely for saving the instances of blogs for specific status updates when blog deleted
-
-class BlogActivityMap(models.Model):
-    blog = models.OneToOneField('BlogModel', on_delete=models.CASCADE, related_name='activity_map')
-    activity_logs = models.ManyToManyField('ActivityLog')
-
-    def __str__(self):
-        return f"Activity Map for Blog #{self.blog.id}"
-
-
 # This model is for the Error Logs for Blog API
 class ErrorLog(models.Model):
     user = models.ForeignKey(User, null = True, blank = True, on_delete=models.SET_NULL)
@@ -48,6 +45,13 @@ class ErrorLog(models.Model):
     message = models.TextField()
     status_code = models.IntegerField(null=True, blank=True)
     created = models.DateTimeField(auto_now_add=True)
+    # More than 1 when this row also stands for identical errors dropped by sampling
+    occurrences = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created'], name='errorlog_created_idx'),
+        ]
 
     def __str__(self):
         return f"Error Log, message: {self.message}, status_code: {self.status_code} at path: {self.path}, method: {self.method}, created:{timing}"
@@ -9,6 +9,20 @@ class SubscribeTable(models.Model):
 
     class Meta:
         ordering = ['subscribed_at']
+        indexes = [
+            # Active subscribers of an author (counters, notification fan-out)
+            models.Index(fields=['author', 'is_active'], name='sub_author_active_idx'),
+            # Is this user subscribed to these authors (feed, subscribe / unsubscribe)
+            models.Index(fields=['subscriber', 'author', 'is_active'], name='sub_subscriber_author_idx'),
+        ]
+        constraints = [
+            # At most one active subscription per (subscriber, author), past inactive ones are kept as history
+            models.UniqueConstraint(
+                fields=['subscriber', 'author'],
+                condition=models.Q(is_active=True),
+                name='unique_active_subscription'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.subscriber.username} subscribed to '{self.author.username}' BlogPosts"
@@ -28,3 +42,12 @@ class UnsubscribeTable(models.Model):
 
 
 
+# Denormalized per-author counters, kept in step by SubscribeView/UnsubscribeView
+# so reads are a single row lookup instead of a COUNT over SubscribeTable
+class AuthorSubscriptionStats(models.Model):
+    author = models.OneToOneField(User, on_delete=models.CASCADE, related_name='subscription_stats')
+    active_subscribers = models.PositiveIntegerField(default=0)
+    total_subscriptions_ever = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.author.username} has {self.active_subscribers} active subscribers"
@@ -0,0 +1,94 @@
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import BasePermission
+from quickstart.models.authentication_models import User_Data
+
+"""
+Role checks from the JWT claims.
+
+LoginViewSet puts the user's role into the tokens under ROLE_CLAIM, so authorizing a request is a dict lookup.
+Tokens issued before the claim existed (or requests authenticated another way, e.g. in tests)
+fall back to the profile row. A role change takes effect for new tokens, old ones keep their claim until they expire.
+    'writer' -> can post and manage own blogs
+    'viewer' -> the reader role, can read blogs
+Views put RolePermission on their permission_classes (or MethodRolePermission when the role depends on the
+method). A request with another role gets the view's usual error envelope, not DRF's 403 (see RoleDenied).
+"""
+
+ROLE_CLAIM = 'role'
+WRITER = 'writer'
+READER = 'viewer'
+
+
+def get_request_role(request):
+    if not hasattr(request, '_role'):
+        request._role = _resolve_role(request)
+    return request._role
+
+
+def _resolve_role(request):
+    token = getattr(request, 'auth', None)
+    if token is not None and hasattr(token, 'get'):
+        role = token.get(ROLE_CLAIM)
+        if role:
+            return role.lower()
+
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        return None
+    try:
+        return user.profile.role.lower()
+    except User_Data.DoesNotExist:
+        return None
+
+
+class RoleDenied(PermissionDenied):
+    """Rendered by custom_exception_handler as the error envelope of the permission that raised it"""
+
+    def __init__(self, permission):
+        super().__init__(detail=permission.message)
+        self.permission = permission
+
+
+class RolePermission(BasePermission):
+    allowed_roles = ()
+    message = 'No other Roles are Allowed'
+    code = -1
+    errors = None
+    # Written to the ErrorLog when a request is turned away, '' to not log it (None keeps the class default)
+    log_message = 'Other roles are trying to access'
+
+    def __init__(self, message=None, code=None, errors=None, log_message=None):
+        if message is not None:
+            self.message = message
+        if code is not None:
+            self.code = code
+        if errors is not None:
+            self.errors = errors
+        if log_message is not None:
+            self.log_message = log_message
+
+    def has_permission(self, request, view):
+        if get_request_role(request) in self.allowed_roles:
+            return True
+        raise RoleDenied(self)
+
+
+class IsWriter(RolePermission):
+    message = 'Only Writers are allowed'
+    allowed_roles = (WRITER,)
+
+
+class IsReaderOrWriter(RolePermission):
+    message = 'No other Roles are Allowed'
+    allowed_roles = (READER, WRITER)
+
+
+class MethodRolePermission(BasePermission):
+    """
+    For views whose handlers need different roles: `role_permissions` on the view maps the HTTP method
+    to a RolePermission instance, methods without one are not role checked
+    """
+
+    def has_permission(self, request, view):
+        permission = getattr(view, 'role_permissions', {}).get(request.method)
+        return permission is None or permission.has_permission(request, view)
@@ -1,10 +1,14 @@
 from datetime import datetime
+from django.contrib.auth.models import User
 from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from quickstart.models.authentication_models import User_Data
 from quickstart.models.blog_models import BlogModel, BlogPostCommentModel, ReplyCommentModel
 from quickstart.models.reaction_models import ReplyReactionModel, BlogReactionModel, CommentReactionModel
-from quickstart.models.signals_model import ActivityLog, BlogActivityMap
+from quickstart.models.signals_model import ActivityLog
+from quickstart.utils.activity_pipeline import record_activity
+from quickstart.utils.authentication import invalidate_cached_user
+from quickstart.utils.blog_cache import invalidate_blog
 
 
 # === Utility Functions ===
@@ -12,20 +16,11 @@ def get_current_time():
     now = datetime.now()
     return now.strftime("%B %d, %Y at %I:%M %p")
 
-def track_activity(blog_id, activity_id):
-    try:
-        blog = BlogModel.objects.get(id=blog_id)
-        activity = ActivityLog.objects.get(id=activity_id)
-        blog_map, created = BlogActivityMap.objects.get_or_create(blog=blog)
-        blog_map.activity_logs.add(activity)
-    except (BlogModel.DoesNotExist, ActivityLog.DoesNotExist):
-        pass  # Optional: log error or raise
-
 # === USER REGISTERED ===
 @receiver(post_save, sender=User_Data)
 def user_register_handler(sender, instance, created, **kwargs):
     if created:
-        ActivityLog.objects.create(
+        record_activity(
             user=instance.user,
             action='User registered',
             model_name=sender.__name__,
@@ -43,14 +38,14 @@ def blog_created_handler(sender, instance, created, **kwargs):
         action = 'Blog updated'
         description = f"Blog '{instance.title}' was edited at {get_current_time()} by '{instance.user}'"
 
-    activity = ActivityLog.objects.create(
+    record_activity(
         user=instance.user,
         action=action,
         model_name=sender.__name__,
         instance_id=instance.id,
-        description=description
+        description=description,
+        blog_id=instance.id
     )
-    track_activity(instance.id, activity.id)
 
 
 # === COMMENT CREATED AND UPDATED ===
@@ -64,14 +59,14 @@ def comment_created_handler(sender, instance, created, **kwargs):
         action = 'Comment updated'
         description = f"{instance.user}! Updated comment on blogpost '{blog.title}' at {get_current_time()}"
 
-    activity = ActivityLog.objects.create(
+    record_activity(
         user=instance.user,
         action=action,
         model_name=sender.__name__,
         instance_id=instance.id,
-        description=description
+        description=description,
+        blog_id=blog.id
     )
-    track_activity(blog.id, activity.id)
 
 # === REPLY CREATED AND UPDATED ===
 @receiver(post_save, sender=ReplyCommentModel)
@@ -84,14 +79,14 @@ def reply_created_handler(sender, instance, created, **kwargs):
         action = 'Reply updated'
         description = f"{instance.user}! Updated reply on '{blog.title}' at {get_current_time()}"
 
-    activity = ActivityLog.objects.create(
+    record_activity(
         user=instance.user,
         action=action,
         model_name=sender.__name__,
         instance_id=instance.id,
-        description=description
+        description=description,
+        blog_id=blog.id
     )
-    track_activity(blog.id, activity.id)
 
 # === BLOG REACTIONS (LIKE/DISLIKE) ===
 @receiver(post_save, sender=BlogReactionModel)
@@ -105,14 +100,14 @@ def blog_reaction_handler(sender, instance, created, **kwargs):
         action = f'Blog reaction changed'
         description = f"{instance.user} changed reaction to {reaction_type} on '{blog.title}' at {get_current_time()}"
 
-    activity = ActivityLog.objects.create(
+    record_activity(
         user=instance.user,
         action=action,
         model_name=sender.__name__,
         instance_id=instance.id,
-        description=description
+        description=description,
+        blog_id=blog.id
     )
-    track_activity(blog.id, activity.id)
 
 # === COMMENT REACTIONS ===
 @receiver(post_save, sender=CommentReactionModel)
@@ -126,14 +121,14 @@ def comment_reaction_handler(sender, instance, created, **kwargs):
         action = f'Comment reaction changed'
         description = f"{instance.user} changed reaction to {reaction_type} on comment at {get_current_time()}"
 
-    activity = ActivityLog.objects.create(
+    record_activity(
         user=instance.user,
         action=action,
         model_name=sender.__name__,
         instance_id=instance.id,
-        description=description
+        description=description,
+        blog_id=blog.id
     )
-    track_activity(blog.id, activity.id)
 
 # === REPLY REACTIONS ===
 @receiver(post_save, sender=ReplyReactionModel)
@@ -147,14 +142,14 @@ def reply_reaction_handler(sender, instance, created, **kwargs):
         action = f'Reply reaction changed'
         description = f"{instance.user} changed reaction to {reaction_type} on reply at {get_current_time()}"
 
-    activity = ActivityLog.objects.create(
+    record_activity(
         user=instance.user,
         action=action,
         model_name=sender.__name__,
         instance_id=instance.id,
-        description=description
+        description=description,
+        blog_id=blog.id
     )
-    track_activity(blog.id, activity.id)
 
 # === BLOG DELETION ONLY CHANGES STATUS TECHNICALLY DOESN'T DELETES THE ACTIVITY ====
 @receiver(pre_delete, sender=BlogModel)
@@ -163,22 +158,61 @@ def blog_delete_handler(sender, instance, **kwargs):
     description = f"Blog '{instance.title}' was deleted at {get_current_time()} by '{instance.user}'"
 
     # Create deletion log (status = 2)
-    activity = ActivityLog.objects.create(
+    record_activity(
         user=instance.user,
         action='Blog deleted',
         model_name=sender.__name__,
         instance_id=instance.id,
         description=description,
-        status=2
+        status=2,
+        blog_id=blog_id
     )
 
-    # Track the deletion log for the function to highlight that part
-    track_activity(blog_id, activity.id)
-
     # Just updates status related to that blog, but don't delete from activity log
-    try:
-        activity_map = BlogActivityMap.objects.get(blog_id=blog_id)
-        related_logs = activity_map.activity_logs.exclude(id=activity.id)
-        related_logs.update(status=2)
-    except BlogActivityMap.DoesNotExist:
-        pass  # IF NOTHING FOUND
+    # (logs still waiting in the buffer are stored as Deleted by the writer once the blog is gone)
+    ActivityLog.objects.filter(blog_id=blog_id).update(status=2)
+
+
+# === BLOG CACHE INVALIDATION ===
+# Anything that shows up in a blog's cached payload bumps that blog's version
+def _cached_blog_id(instance):
+    if isinstance(instance, BlogModel):
+        return instance.id
+    if isinstance(instance, (BlogPostCommentModel, BlogReactionModel)):
+        return instance.blog_id
+    if isinstance(instance, (ReplyCommentModel, CommentReactionModel)):
+        return instance.comment.blog_id
+    return instance.reply.comment.blog_id
+
+
+def _deleted_with_parent(instance, origin):
+    # Cascaded from a blog / comment / reply being deleted: the parent's own handler covers it
+    return origin is not instance and isinstance(origin, (BlogModel, BlogPostCommentModel, ReplyCommentModel))
+
+
+def blog_cache_save_handler(sender, instance, **kwargs):
+    invalidate_blog(_cached_blog_id(instance))
+
+
+def blog_cache_delete_handler(sender, instance, origin=None, **kwargs):
+    if not _deleted_with_parent(instance, origin):
+        invalidate_blog(_cached_blog_id(instance))
+
+
+for cached_model in (BlogModel, BlogPostCommentModel, ReplyCommentModel,
+                     BlogReactionModel, CommentReactionModel, ReplyReactionModel):
+    post_save.connect(blog_cache_save_handler, sender=cached_model)
+    pre_delete.connect(blog_cache_delete_handler, sender=cached_model)
+
+
+# === AUTHENTICATION CACHE INVALIDATION ===
+# Cached user + profile of the JWT authentication is dropped whenever either of them changes
+@receiver(post_save, sender=User)
+@receiver(pre_delete, sender=User)
+def auth_user_cache_handler(sender, instance, **kwargs):
+    invalidate_cached_user(instance.id)
+
+@receiver(post_save, sender=User_Data)
+@receiver(pre_delete, sender=User_Data)
+def auth_profile_cache_handler(sender, instance, **kwargs):
+    invalidate_cached_user(instance.user_id)
@@ -0,0 +1,4 @@
+# Celery's autodiscover only imports this package, so the task modules are pulled in here
+from quickstart.tasks.email_tasks import send_blog_notification_email, fan_out_blog_notification
+from quickstart.tasks.activity_tasks import ingest_activity_logs
+from quickstart.tasks.maintenance_tasks import refresh_subscription_counters
@@ -0,0 +1,11 @@
+import logging
+from celery import shared_task
+from quickstart.utils.activity_pipeline import write_activity_batch
+
+logger = logging.getLogger(__name__)
+
+# acks_late off: a redelivered batch would insert its rows a second time
+@shared_task(ignore_result=True, acks_late=False)
+def ingest_activity_logs(events):
+    write_activity_batch(events)
+    logger.info(f"Stored {len(events)} activity logs")
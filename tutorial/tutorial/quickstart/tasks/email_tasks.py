@@ -1,11 +1,59 @@
 import logging
+import smtplib
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
+from quickstart.models.blog_models import BlogModel
+from quickstart.models.subscription_models import SubscribeTable
 
 logger = logging.getLogger(__name__)
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+
+def send_email_chunk(subject, body, recipients):
+    """
+    Send one message per recipient over a single SMTP connection (one connect + TLS handshake per chunk
+    instead of per email). If the server drops the connection we reconnect once and carry on.
+    Returns (sent_emails, failed_emails)
+    """
+    sent = []
+    failed = []
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+        for email in recipients:
+            message = EmailMessage(
+                subject=subject,
+                body=body,
+                from_email=settings.EMAIL_HOST_USER,
+                to=[email],
+                connection=connection,
+            )
+            try:
+                try:
+                    connection.send_messages([message])
+                except (smtplib.SMTPServerDisconnected, ConnectionError):
+                    # Only a dropped connection is worth a reconnect, any other SMTP error is this recipient's
+                    logger.warning("SMTP connection lost, reconnecting")
+                    connection.close()
+                    connection.open()
+                    connection.send_messages([message])
+                sent.append(email)
+            except Exception as email_error:
+                logger.error(f"Failed to send email to {email}: {str(email_error)}")
+                failed.append({"email": email, "error": str(email_error)})
+    except Exception as connection_error:
+        # Could not even connect: the whole remaining chunk failed
+        logger.error(f"Failed to open SMTP connection: {str(connection_error)}")
+        done = set(sent) | {failure["email"] for failure in failed}
+        failed.extend({"email": email, "error": str(connection_error)} for email in recipients if email not in done)
+    finally:
+        connection.close()
+
+    logger.info(f"Email chunk done: {len(sent)} sent, {len(failed)} failed")
+    return sent, failed
+
+# acks_late stays off whatever the worker profile: a redelivered chunk would mail everyone in it again
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=True, acks_late=False)
 def send_blog_notification_email(self, current_user_username, blog_title, subscribers_emails):
     try:
         if not subscribers_emails:
@@ -37,20 +85,13 @@ def send_blog_notification_email(self, current_user_username, blog_title, subscr
 
         successful_emails = []
         failed_emails = []
-        for email in valid_emails:
-            try:
-                send_mail(
-                    subject=subject,
-                    message=body,
-                    from_email=settings.EMAIL_HOST_USER,
-                    recipient_list=[email],
-                    fail_silently=False,
-                )
-                successful_emails.append(email)
-                logger.info(f"Email sent successfully to {email}")
-            except Exception as email_error:
-                logger.error(f"Failed to send email to {email}: {str(email_error)}")
-                failed_emails.append({"email": email, "error": str(email_error)})
+        batch_size = getattr(settings, 'EMAIL_BATCH_SIZE', 100)
+        for start in range(0, len(valid_emails), batch_size):
+            chunk = valid_emails[start:start + batch_size]
+            sent, failed = send_email_chunk(subject, body, chunk)
+            successful_emails.extend(sent)
+            failed_emails.extend(failed)
+
         result = {
             "status": "completed",
             "successful_emails": len(successful_emails),
@@ -72,3 +113,54 @@ def send_blog_notification_email(self, current_user_username, blog_title, subscr
             logger.error(f"Max retries exceeded for email task: {str(exc)}")
             return {"status": "failed", "error": str(exc)}
 
+
+def iter_subscriber_email_chunks(author_id, chunk_size, after_id=0):
+    """
+    Stream the active subscribers' emails from the database in lists of chunk_size, starting after the
+    subscription `after_id`. Yields (id of the chunk's last subscription, emails)
+    """
+    rows = (
+        SubscribeTable.objects
+        .filter(author_id=author_id, is_active=True, id__gt=after_id)
+        .exclude(subscriber__email='')
+        .order_by('id')
+        .values_list('id', 'subscriber__email')
+        .iterator(chunk_size=chunk_size)
+    )
+    last_id, chunk = after_id, []
+    for last_id, email in rows:
+        chunk.append(email)
+        if len(chunk) == chunk_size:
+            yield last_id, chunk
+            chunk = []
+    if chunk:
+        yield last_id, chunk
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, ignore_result=True, acks_late=False)
+def fan_out_blog_notification(self, author_id, blog_id, after_id=0):
+    """
+    Enqueued by BlogPostAPIView.post with ids only. Streams the author's active subscribers here on
+    the worker and dispatches one send_blog_notification_email subtask per chunk as soon as it is read,
+    so neither the web request nor a single broker message grows with the audience.
+    A failure part way through is retried from the subscription after the last dispatched chunk
+    (`after_id`): the chunks already sent are not sent again.
+    """
+    dispatched_until = after_id
+    try:
+        blog = BlogModel.objects.select_related('user').filter(pk=blog_id, user_id=author_id).first()
+        if blog is None:
+            logger.warning(f"Blog {blog_id} of author {author_id} not found, nothing to notify")
+            return {"status": "warning", "message": "Blog not found"}
+
+        chunk_size = getattr(settings, 'NOTIFICATION_FANOUT_CHUNK_SIZE', 500)
+        for last_id, chunk in iter_subscriber_email_chunks(author_id, chunk_size, after_id=after_id):
+            send_blog_notification_email.delay(blog.user.username, blog.title, chunk)
+            dispatched_until = last_id
+
+        logger.info(f"Notification fan-out dispatched for blog {blog_id}")
+        return {"status": "dispatched", "blog_id": blog_id}
+
+    except Exception as exc:
+        logger.error(f"Notification fan-out failed after subscription {dispatched_until}: {str(exc)}")
+        raise self.retry(exc=exc, args=(author_id, blog_id), kwargs={"after_id": dispatched_until})
@@ -0,0 +1,11 @@
+import logging
+from celery import shared_task
+from quickstart.utils.subscription_counters import rebuild_subscription_counters
+
+logger = logging.getLogger(__name__)
+
+@shared_task(ignore_result=True)
+def refresh_subscription_counters(batch_size=1000):
+    """Same as the rebuild_subscription_counters command, for a periodic run on the maintenance queue"""
+    authors = rebuild_subscription_counters(batch_size=batch_size)
+    logger.info(f"Rebuilt subscription counters for {authors} authors")
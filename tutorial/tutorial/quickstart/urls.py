@@ -3,15 +3,18 @@ from quickstart.views.reply_comment_view import ReplyCommentBlogPost
 from quickstart.views.authentication_views import RegisterAPIView
 from quickstart.views.authentication_views import LoginViewSet
 from quickstart.views.blog_posts import BlogPostAPIView
+from quickstart.views.blog_export import BlogExportAPIView
 from quickstart.views.detail_blog_posts import DetailBlogPost
 from quickstart.views.comment_blog_posts import CommentBlogPost
 from quickstart.views.reaction_views import BlogReaction, CommentBlogPostReaction, ReplyReactionView
 from quickstart.views.subscription_views import SubscribeView, UnsubscribeView
+from quickstart.views.async_blog_views import AsyncBlogPostView, AsyncDetailBlogPost
 
 urlpatterns = [
     path('register/', RegisterAPIView.as_view(), name='registering'),
     path('login/', LoginViewSet.as_view({'post': 'create'}), name='login'),
     path('blog/', BlogPostAPIView.as_view(), name='blogpost'),
+    path('blog/export/', BlogExportAPIView.as_view(), name='blogexport'),
     path('blog/<int:pk>/', DetailBlogPost.as_view(), name='detailblogpost'),
     path('blog/like/<int:pk>/', BlogReaction.as_view(), name='likeblog'),
     path('blog/dislike/<int:pk>/', BlogReaction.as_view(), name='dislikeblog'),
@@ -23,4 +26,7 @@ urlpatterns = [
     path('reply/like/<int:pk>/', ReplyReactionView.as_view(), name='likereply'),
     path('subscribe/<str:pk>/', SubscribeView.as_view(), name='subscribe'),
     path('unsubscribe/<str:pk>/', UnsubscribeView.as_view(), name='unsubscribe'),
+    # Async (ASGI) versions of the read endpoints
+    path('async/blog/', AsyncBlogPostView.as_view(), name='asyncblogpost'),
+    path('async/blog/<int:pk>/', AsyncDetailBlogPost.as_view(), name='asyncdetailblogpost'),
 ]
@@ -0,0 +1,85 @@
+import logging
+from django.conf import settings
+from django.db import transaction
+from quickstart.models.blog_models import BlogModel
+from quickstart.models.signals_model import ActivityLog
+from quickstart.utils.buffered_writer import BufferedBulkWriter
+
+logger = logging.getLogger(__name__)
+
+"""
+Activity (audit) log pipeline used by the signal receivers and the login view.
+
+record_activity() only queues the event once the surrounding transaction commits; the rows are
+written later with bulk_create, either by the background writer thread or by a Celery task.
+    ACTIVITY_LOG_MODE = 'thread'  -> background thread drains the buffer (default)
+    ACTIVITY_LOG_MODE = 'celery'  -> background thread ships each batch to ingest_activity_logs
+    ACTIVITY_LOG_MODE = 'sync'    -> written straight away, for tests and management scripts
+"""
+
+
+def get_activity_log_mode():
+    return getattr(settings, 'ACTIVITY_LOG_MODE', 'thread')
+
+
+def record_activity(user, action, model_name, instance_id, description=None, status=1, blog_id=None):
+    event = {
+        'user_id': user.id if user else None,
+        'action': action,
+        'model_name': model_name,
+        'instance_id': instance_id,
+        'description': description,
+        'status': status,
+        'blog_id': blog_id,
+    }
+    if get_activity_log_mode() == 'sync':
+        write_activity_batch([event])
+        return
+    transaction.on_commit(lambda: activity_writer.put(event))
+
+
+def write_activity_batch(events):
+    """
+    Insert a batch of events with one bulk insert.
+    Events of a blog that has been deleted in the meantime are stored as Deleted,
+    the same status the deletion handler gives to the rest of that blog's activity.
+    """
+    blog_ids = {event['blog_id'] for event in events if event['blog_id']}
+    live_blog_ids = set(BlogModel.objects.filter(id__in=blog_ids).values_list('id', flat=True))
+
+    logs = []
+    for event in events:
+        status = event['status']
+        if event['blog_id'] and event['blog_id'] not in live_blog_ids:
+            status = 2
+        logs.append(ActivityLog(
+            user_id=event['user_id'],
+            action=event['action'],
+            model_name=event['model_name'],
+            instance_id=event['instance_id'],
+            description=event['description'],
+            status=status,
+            blog_id=event['blog_id']
+        ))
+    ActivityLog.objects.bulk_create(logs)
+
+
+def _drain_batch(events):
+    if get_activity_log_mode() == 'celery':
+        from quickstart.tasks.activity_tasks import ingest_activity_logs
+        try:
+            ingest_activity_logs.delay(events)
+            return
+        except Exception as exc:
+            # Broker down: keep the audit trail by writing the batch from here
+            logger.error(f"Could not queue {len(events)} activity logs, writing them directly: {exc}")
+    write_activity_batch(events)
+
+
+activity_writer = BufferedBulkWriter(
+    name='activity-log',
+    write_batch=_drain_batch,
+    batch_size=getattr(settings, 'ACTIVITY_LOG_BATCH_SIZE', 200),
+    max_queue=getattr(settings, 'ACTIVITY_LOG_MAX_QUEUE', 10000),
+    flush_interval=getattr(settings, 'ACTIVITY_LOG_FLUSH_INTERVAL', 1.0),
+)
@@ -0,0 +1,72 @@
+from asgiref.sync import sync_to_async
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from quickstart.permissions.roles import get_request_role
+from quickstart.utils.authentication import CachedJWTAuthentication
+from quickstart.utils.db_router import choose_read_alias, reset_read_alias, set_read_alias
+from quickstart.utils.logger import log_error
+from quickstart.utils.response_handler import ResponseHandler
+
+"""
+Base of the async (ASGI) read endpoints. DRF's APIView has no async handlers, so these are plain Django
+views with `async def` handlers. They give the same responses as the DRF views they mirror:
+    - JWT authentication with CachedJWTAuthentication, with the same error envelope for a missing or bad token
+    - request.user / request.auth set as DRF would, so get_request_role works unchanged
+    - safe requests read from the replica like ReplicaReadMixin does (see db_router.py)
+The synchronous helpers (authentication, role lookup, log_error, blog payload cache) run through sync_to_async.
+"""
+
+alog_error = sync_to_async(log_error)
+arequest_role = sync_to_async(get_request_role)
+
+
+def _authenticate(request):
+    """(user, token) or None, like DRF's Request does it"""
+    return CachedJWTAuthentication().authenticate(request)
+
+
+class AsyncAPIView(View):
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Token authenticated like the DRF views, so no CSRF check either
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            authenticated = await sync_to_async(_authenticate)(request)
+        except (AuthenticationFailed, InvalidToken, TokenError) as exc:
+            return await self.authentication_failed(request, str(exc))
+        if authenticated is None:
+            return await self.authentication_failed(request, 'Authentication credentials were not provided.')
+        request.user, request.auth = authenticated
+
+        token = None
+        if request.method in SAFE_METHODS:
+            alias = await sync_to_async(choose_read_alias)(request.user)
+            if alias is not None:
+                token = set_read_alias(alias)
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        finally:
+            if token is not None:
+                reset_read_alias(token)
+
+    async def authentication_failed(self, request, errors):
+        await alog_error(request, "Authentication credentials are missing or invalid", 200)
+        return ResponseHandler.error(
+            message="Authentication credentials are missing or invalid.",
+            code=-1,
+            errors=errors
+        )
+
+    async def http_method_not_allowed(self, request, *args, **kwargs):
+        await alog_error(request, 'Other than GET is used on an async endpoint', 200)
+        return ResponseHandler.error(
+            message='No other Methods Allowed',
+            code=-1,
+            errors="NONE"
+        )
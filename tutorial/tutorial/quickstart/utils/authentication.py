@@ -0,0 +1,90 @@
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+"""
+JWT authentication that loads the user together with its profile (User_Data) in one query
+and keeps them in the cache for a short time, keyed by user id and the token's `iat`.
+Warm requests do no user / profile query at all; the role checks in the views read the cached profile.
+
+Saving a User or User_Data bumps that user's cache version (see signals.py), which drops every cached
+copy of it at once. AUTH_USER_CACHE_TIMEOUT = 0 turns the cache off.
+"""
+
+
+def get_auth_cache():
+    return caches[getattr(settings, 'AUTH_USER_CACHE_ALIAS', 'default')]
+
+
+def _version_key(user_id):
+    return f'auth_user:{user_id}:version'
+
+
+def _user_key(user_id, version, issued_at):
+    return f'auth_user:{user_id}:{version}:{issued_at}'
+
+
+def _bump_user_version(user_id):
+    cache = get_auth_cache()
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.set(_version_key(user_id), time.time_ns(), None)
+
+
+def invalidate_cached_user(user_id):
+    # Bump now and again after commit, so a copy loaded before the commit is not kept either
+    _bump_user_version(user_id)
+    transaction.on_commit(lambda: _bump_user_version(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        timeout = getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 60)
+        if timeout <= 0:
+            return self.check_user(self.load_user(user_id), validated_token)
+
+        cache = get_auth_cache()
+        version = cache.get(_version_key(user_id))
+        if version is None:
+            # Fresh version for unknown (or evicted) users so an older cached copy never matches
+            cache.add(_version_key(user_id), time.time_ns(), None)
+            version = cache.get(_version_key(user_id))
+
+        key = _user_key(user_id, version, validated_token.get('iat'))
+        user = cache.get(key)
+        if user is None:
+            user = self.load_user(user_id)
+            cache.set(key, user, timeout)
+
+        return self.check_user(user, validated_token)
+
+    def load_user(self, user_id):
+        try:
+            return self.user_model.objects.select_related('profile').get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+    def check_user(self, user, validated_token):
+        # Same checks as JWTAuthentication.get_user, they also run on cached users
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
@@ -0,0 +1,144 @@
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from quickstart.serializers.blog_post_serializer import BlogPostSerializer
+from quickstart.utils.comment_tree import load_comment_trees
+from quickstart.utils.db_router import PRIMARY, current_read_alias
+
+"""
+Versioned cache of the user-independent part of a blog's payload (blog fields, author, comment tree).
+
+Every blog has a version key; the payload is stored under the current version, so invalidating is just
+bumping the version (the old entry is never read again and expires on its own). The signal receivers
+bump it whenever the blog, one of its comments/replies or any reaction on them changes.
+Per-user fields (is_subscribed, author_subscribers_count) are merged in by the views at response time.
+
+Configured through CACHES[BLOG_CACHE_ALIAS]. The default local memory cache is per process, so it is only right
+for a single worker: a version bumped by one worker is not seen by the others, which keep serving their old payload
+for up to BLOG_CACHE_TIMEOUT seconds. With several workers set CACHE_BACKEND to a shared backend (redis, memcached).
+
+With a read replica (see db_router.py) a payload built from the replica may miss the latest write even under
+the new version: those are kept only for READ_REPLICA_PIN_SECONDS, and users pinned to the primary
+skip cached entries and store fresh ones in their place.
+"""
+
+HITS_KEY = 'blog_cache:hits'
+MISSES_KEY = 'blog_cache:misses'
+
+
+def get_blog_cache():
+    return caches[getattr(settings, 'BLOG_CACHE_ALIAS', 'default')]
+
+
+def _version_key(blog_id):
+    return f'blog:{blog_id}:version'
+
+
+def _payload_key(blog_id, version, variant):
+    return f'blog:{blog_id}:payload:{version}:{variant}'
+
+
+def _get_versions(cache, blog_ids):
+    keys = {_version_key(blog_id): blog_id for blog_id in blog_ids}
+    found = cache.get_many(keys.keys())
+    versions = {}
+    for key, blog_id in keys.items():
+        if key not in found:
+            # Unknown (or evicted) version: start from a fresh value so no older payload can match it
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key)
+        versions[blog_id] = found[key]
+    return versions
+
+
+def bump_blog_version(blog_id):
+    cache = get_blog_cache()
+    try:
+        cache.incr(_version_key(blog_id))
+    except ValueError:
+        cache.set(_version_key(blog_id), time.time_ns(), None)
+
+
+def invalidate_blog(blog_id):
+    """
+    Bump now, so nothing later in this request is served the old payload, and again after commit,
+    so a payload another request built from the pre-commit rows is not kept either
+    """
+    if blog_id is None:
+        return
+    bump_blog_version(blog_id)
+    transaction.on_commit(lambda: bump_blog_version(blog_id))
+
+
+def _count(cache, key, amount):
+    if not amount:
+        return
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key, amount)
+
+
+def build_blog_payloads(blogs, count_reactions=False):
+    comment_trees = load_comment_trees([blog.id for blog in blogs], count_reactions=count_reactions)
+    payloads = {}
+    for blog in blogs:
+        payload = BlogPostSerializer(blog).data.copy()
+        payload['author'] = blog.user.username
+        payload['author_id'] = blog.user.id
+        payload['comments'] = comment_trees[blog.id]
+        payloads[blog.id] = payload
+    return payloads
+
+
+def get_blog_payloads(blogs, count_reactions=False):
+    """
+    Returns {blog_id: payload} for the given blogs (with user already selected),
+    building and storing only the ones that are not cached under their current version.
+    """
+    if not blogs:
+        return {}
+    cache = get_blog_cache()
+    variant = 'detail' if count_reactions else 'list'
+    versions = _get_versions(cache, [blog.id for blog in blogs])
+    keys = {blog.id: _payload_key(blog.id, versions[blog.id], variant) for blog in blogs}
+
+    read_alias = current_read_alias()
+    cached = {} if read_alias == PRIMARY else cache.get_many(keys.values())
+    payloads = {blog_id: cached[key] for blog_id, key in keys.items() if key in cached}
+    missing = [blog for blog in blogs if blog.id not in payloads]
+
+    _count(cache, HITS_KEY, len(payloads))
+    _count(cache, MISSES_KEY, len(missing))
+
+    if missing:
+        built = build_blog_payloads(missing, count_reactions=count_reactions)
+        timeout = getattr(settings, 'BLOG_CACHE_TIMEOUT', 300)
+        if read_alias not in (None, PRIMARY):
+            timeout = min(timeout, getattr(settings, 'READ_REPLICA_PIN_SECONDS', 5))
+        cache.set_many({keys[blog_id]: payload for blog_id, payload in built.items()}, timeout)
+        payloads.update(built)
+    return payloads
+
+
+def with_user_fields(payload, is_subscribed, author_subscribers_count):
+    """Merge the per-user fields in, keeping the key order of the original response"""
+    data = {key: value for key, value in payload.items() if key != 'comments'}
+    data['is_subscribed'] = is_subscribed
+    data['author_subscribers_count'] = author_subscribers_count
+    data['comments'] = payload['comments']
+    return data
+
+
+def cache_stats():
+    cache = get_blog_cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None
+    }
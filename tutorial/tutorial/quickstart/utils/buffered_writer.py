@@ -0,0 +1,134 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+"""
+Bounded in-memory buffer drained in batches by a background thread.
+Used for the audit tables (activity / error logs) so the request only pays for a queue put,
+the rows are written later with one bulk insert per batch.
+
+- the queue is bounded: when it is full the caller drains it synchronously (back-pressure), if the database
+  still does not take the rows the new one is dropped with a warning
+- the thread wakes up every flush_interval seconds or as soon as a full batch is waiting
+- a batch that fails to write goes back to the front (order is kept) and is retried after retry_backoff seconds,
+  doubling at each failure, it is dropped with a warning after max_attempts
+- whatever is still queued is flushed when the process exits, unless the default database is not the one the
+  rows were queued for any more (e.g. the test database is gone), then they are dropped with a warning
+- collect(final) lets the owner add rows of its own (e.g. aggregated summaries) at every flush
+"""
+
+
+class BufferedBulkWriter:
+    def __init__(self, name, write_batch, batch_size=200, max_queue=10000, flush_interval=1.0, collect=None,
+                 max_attempts=5, retry_backoff=1.0):
+        self.name = name
+        self.write_batch = write_batch
+        self.collect = collect
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._queue = queue.Queue(maxsize=max_queue)
+        # (batch, failed attempts) written before the queue: failed batches and the collected rows
+        self._pending = deque()
+        self._retry_at = 0.0
+        self._database = None
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        atexit.register(self.flush, final=True)
+
+    def put(self, item):
+        self._database = _default_database()
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.warning(f"{self.name} buffer is full, flushing in the calling thread")
+            self.flush()
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                logger.warning(f"{self.name} buffer is still full, dropping the row")
+                return
+
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def pending(self):
+        return self._queue.qsize() + sum(len(batch) for batch, _ in self._pending)
+
+    def flush(self, final=False):
+        # One drainer at a time, so batches keep their order
+        with self._flush_lock:
+            if final and self._database is not None and self._database != _default_database():
+                if self.pending():
+                    logger.warning(f"{self.name} dropping {self.pending()} rows at exit: they were queued for "
+                                   f"{self._database}, the default database is now {_default_database()}")
+                return
+            extra = list(self.collect(final)) if self.collect else []
+            for start in range(0, len(extra), self.batch_size):
+                self._pending.append((extra[start:start + self.batch_size], 0))
+            while True:
+                batch, attempts = self._pending.popleft() if self._pending else (self._take_batch(), 0)
+                if not batch:
+                    return
+                if not self._write(batch, attempts, final):
+                    # Back at the front, the rest waits for the retry so the order is kept
+                    return
+
+    def _write(self, batch, attempts, final):
+        try:
+            self.write_batch(batch)
+        except Exception as exc:
+            attempts += 1
+            if final or attempts >= self.max_attempts:
+                logger.warning(f"{self.name} dropped {len(batch)} rows after {attempts} failed attempts: {exc}")
+                return True
+            delay = self.retry_backoff * 2 ** (attempts - 1)
+            self._pending.appendleft((batch, attempts))
+            self._retry_at = time.monotonic() + delay
+            logger.error(f"{self.name} failed to write {len(batch)} rows (attempt {attempts}/{self.max_attempts}), "
+                         f"retrying in {delay:g}s: {exc}")
+            return False
+        return True
+
+    def _take_batch(self):
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f'{self.name}-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        from django.db import close_old_connections
+
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if (not self.pending() and self.collect is None) or time.monotonic() < self._retry_at:
+                continue
+            close_old_connections()
+            self.flush()
+
+
+def _default_database():
+    from django.db import DEFAULT_DB_ALIAS, connections
+
+    return connections[DEFAULT_DB_ALIAS].settings_dict['NAME']
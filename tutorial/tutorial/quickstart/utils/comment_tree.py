@@ -0,0 +1,61 @@
+from django.db.models import Count, Prefetch, Q
+from quickstart.models.blog_models import BlogPostCommentModel, ReplyCommentModel
+from quickstart.serializers.blog_post_serializer import CommentSerializer, ReplySerializer
+
+"""
+Builds the comment -> replies tree for any number of blogs with a fixed number of queries:
+one for the comments of all the blogs and one (prefetch) for all their replies,
+the grouping per blog is then done in memory.
+"""
+
+
+def load_comment_trees(blog_ids, count_reactions=False):
+    """
+    Returns {blog_id: [comment_data, ...]} with every requested blog present.
+
+    With count_reactions=True likes/dislikes are counted from the reaction tables
+    (as the detail page does) instead of read from the stored counters.
+    """
+    blog_ids = list(blog_ids)
+    trees = {blog_id: [] for blog_id in blog_ids}
+    if not blog_ids:
+        return trees
+
+    replies = ReplyCommentModel.objects.select_related('user').order_by('created', 'id')
+    comments = (
+        BlogPostCommentModel.objects
+        .filter(blog_id__in=blog_ids)
+        .select_related('user')
+        .order_by('created', 'id')
+    )
+    if count_reactions:
+        replies = replies.annotate(
+            like_count=Count('reply_reactions', filter=Q(reply_reactions__reaction='like')),
+            dislike_count=Count('reply_reactions', filter=Q(reply_reactions__reaction='dislike')),
+        )
+        comments = comments.annotate(
+            like_count=Count('comment_reactions', filter=Q(comment_reactions__reaction='like')),
+            dislike_count=Count('comment_reactions', filter=Q(comment_reactions__reaction='dislike')),
+        )
+    comments = comments.prefetch_related(
+        Prefetch('replycommentmodel_set', queryset=replies, to_attr='ordered_replies')
+    )
+
+    for comment in comments:
+        comment_data = CommentSerializer(comment).data.copy()
+        replies_data = []
+
+        for reply in comment.ordered_replies:
+            reply_data = ReplySerializer(reply).data.copy()
+            if count_reactions:
+                reply_data['likes'] = reply.like_count
+                reply_data['dislikes'] = reply.dislike_count
+            replies_data.append(reply_data)
+
+        if count_reactions:
+            comment_data['likes'] = comment.like_count
+            comment_data['dislikes'] = comment.dislike_count
+        comment_data['replies'] = replies_data
+        trees[comment.blog_id].append(comment_data)
+
+    return trees
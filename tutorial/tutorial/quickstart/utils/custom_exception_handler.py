@@ -1,5 +1,6 @@
 from rest_framework.views import exception_handler
 from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated, PermissionDenied
+from quickstart.permissions.roles import RoleDenied
 from quickstart.utils.response_handler import ResponseHandler
 from quickstart.utils.logger import log_error
 
@@ -15,6 +16,15 @@ def custom_exception_handler(exc, context):
             code=-1,
             errors=str(exc)
         )
+    if isinstance(exc, RoleDenied):
+        permission = exc.permission
+        if permission.log_message:
+            log_error(request, permission.log_message, 200)
+        return ResponseHandler.error(
+            message=permission.message,
+            code=permission.code,
+            errors=permission.errors
+        )
     if isinstance(exc, PermissionDenied):
         log_error(request, "Dont have permission to perform action", 200)
         return ResponseHandler.error(
@@ -0,0 +1,152 @@
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.permissions import SAFE_METHODS
+
+"""
+Read replica routing with read-your-writes.
+
+Writes always go to the primary ('default'). Reads go to READ_REPLICA_ALIAS only inside the GET (HEAD, OPTIONS)
+handlers of the views using ReplicaReadMixin (blog list, blog detail, profile): the mixin sets the read alias
+of the current request once the user is authenticated and the router hands it out (AsyncAPIView does
+the same for the async endpoints).
+
+A replica is behind the primary, so a user who just wrote would not see their own change there.
+ReadYourWritesMiddleware notices any write made while handling a request (the router sees every one of them)
+and pins the user to the primary for READ_REPLICA_PIN_SECONDS with a key in READ_REPLICA_CACHE_ALIAS, which has
+to be a cache shared by the workers (settings.py refuses the local memory cache when a replica is configured).
+Pinned users read from the primary in the mixin views too.
+
+READ_REPLICA_ALIAS = '' (the default) turns all of it off: everything reads from the primary.
+"""
+
+PRIMARY = 'default'
+
+# Alias the current request reads from: None (router has no opinion), PRIMARY (pinned) or the replica
+_read_alias = ContextVar('read_alias', default=None)
+# Writes seen while handling the current request (set by ReadYourWritesMiddleware)
+_request_writes = ContextVar('request_writes', default=None)
+
+
+class RequestWrites:
+    def __init__(self):
+        self.happened = False
+
+
+def get_replica_alias():
+    return getattr(settings, 'READ_REPLICA_ALIAS', '') or None
+
+
+def current_read_alias():
+    return _read_alias.get()
+
+
+def set_read_alias(alias):
+    """Returns the token reset_read_alias needs"""
+    return _read_alias.set(alias)
+
+
+def reset_read_alias(token):
+    _read_alias.reset(token)
+
+
+def get_pin_cache():
+    return caches[getattr(settings, 'READ_REPLICA_CACHE_ALIAS', 'default')]
+
+
+def _pin_key(user_id):
+    return f'db_pin:{user_id}'
+
+
+def pin_to_primary(user_id):
+    get_pin_cache().set(_pin_key(user_id), True, getattr(settings, 'READ_REPLICA_PIN_SECONDS', 5))
+
+
+def is_pinned_to_primary(user_id):
+    return bool(get_pin_cache().get(_pin_key(user_id)))
+
+
+def choose_read_alias(user):
+    replica = get_replica_alias()
+    if replica is None:
+        return None
+    if user is not None and user.is_authenticated and is_pinned_to_primary(user.id):
+        return PRIMARY
+    return replica
+
+
+class ReadReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        writes = _request_writes.get()
+        if writes is not None:
+            writes.happened = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Same data on both sides, an object read from the replica may point at one from the primary
+        if {obj1._state.db, obj2._state.db} <= {PRIMARY, get_replica_alias()}:
+            return True
+        return None
+
+
+class ReplicaReadMixin:
+    """For APIViews: safe requests read from the replica, unless the user is pinned to the primary"""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS:
+            alias = choose_read_alias(request.user)
+            if alias is not None:
+                self._read_alias_token = set_read_alias(alias)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_read_alias_token', None)
+        if token is not None:
+            reset_read_alias(token)
+            self._read_alias_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class ReadYourWritesMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        writes = RequestWrites()
+        token = _request_writes.set(writes)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_writes.reset(token)
+        if writes.happened and get_replica_alias():
+            self.pin_writer(request)
+        return response
+
+    async def __acall__(self, request):
+        writes = RequestWrites()
+        token = _request_writes.set(writes)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_writes.reset(token)
+        if writes.happened and get_replica_alias():
+            # request.user may still be the lazy session user, resolving it queries the database
+            await sync_to_async(self.pin_writer)(request)
+        return response
+
+    def pin_writer(self, request):
+        # DRF sets the authenticated user back on the Django request
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            pin_to_primary(user.id)
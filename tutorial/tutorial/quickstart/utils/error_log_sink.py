@@ -0,0 +1,104 @@
+import threading
+import time
+from django.conf import settings
+from quickstart.models.signals_model import ErrorLog
+from quickstart.utils.buffered_writer import BufferedBulkWriter
+
+"""
+Error log sink behind log_error().
+
+Rows are buffered and written with bulk_create on a size or time threshold instead of one INSERT per
+rejected request. Identical errors (same path, method and message) are sampled: within each window
+only the first ERROR_LOG_SAMPLE_BURST are written as they come, the rest are folded into one summary
+row whose `occurrences` carries how many were dropped, so Sum('occurrences') is still the real total.
+    ERROR_LOG_MODE = 'thread'  -> buffered, background writer thread (default)
+    ERROR_LOG_MODE = 'sync'    -> admitted rows (and summaries of closed windows) are written straight away, for tests
+"""
+
+
+def get_error_log_mode():
+    return getattr(settings, 'ERROR_LOG_MODE', 'thread')
+
+
+class ErrorSampler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._closed = []
+
+    def admit(self, row, now=None):
+        """
+        Returns True when the row should be written as it is,
+        otherwise it is counted into the summary of its window
+        """
+        burst = getattr(settings, 'ERROR_LOG_SAMPLE_BURST', 20)
+        window = getattr(settings, 'ERROR_LOG_SAMPLE_WINDOW', 60)
+        if burst <= 0:
+            return True
+
+        now = time.monotonic() if now is None else now
+        key = (row['path'], row['method'], row['message'])
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None or now - state['started'] >= window:
+                if state and state['summary']:
+                    # Summary of the window that just closed is picked up by the next collect()
+                    self._closed.append(state['summary'])
+                state = {'started': now, 'seen': 0, 'summary': None}
+                self._windows[key] = state
+
+            state['seen'] += 1
+            if state['seen'] <= burst:
+                return True
+
+            if state['summary'] is None:
+                state['summary'] = dict(row, occurrences=0)
+            state['summary']['occurrences'] += 1
+            return False
+
+    def collect(self, final=False, now=None):
+        """Pop the summaries of closed windows (all of them when final)"""
+        window = getattr(settings, 'ERROR_LOG_SAMPLE_WINDOW', 60)
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            summaries, self._closed = self._closed, []
+            for key, state in list(self._windows.items()):
+                if final or now - state['started'] >= window:
+                    del self._windows[key]
+                    if state['summary']:
+                        summaries.append(state['summary'])
+        return summaries
+
+
+def write_error_batch(rows):
+    ErrorLog.objects.bulk_create([ErrorLog(**row) for row in rows])
+
+
+class ErrorLogSink:
+    def __init__(self):
+        self.sampler = ErrorSampler()
+        self.writer = BufferedBulkWriter(
+            name='error-log',
+            write_batch=write_error_batch,
+            batch_size=getattr(settings, 'ERROR_LOG_BATCH_SIZE', 200),
+            max_queue=getattr(settings, 'ERROR_LOG_MAX_QUEUE', 10000),
+            flush_interval=getattr(settings, 'ERROR_LOG_FLUSH_INTERVAL', 2.0),
+            collect=self.sampler.collect,
+        )
+
+    def record(self, row):
+        admitted = self.sampler.admit(row)
+        if get_error_log_mode() == 'sync':
+            # No writer thread collects the summaries here, the closed windows go out with this row
+            rows = self.sampler.collect() + ([row] if admitted else [])
+            if rows:
+                write_error_batch(rows)
+            return
+        if admitted:
+            self.writer.put(row)
+
+    def flush(self, final=False):
+        self.writer.flush(final=final)
+
+
+error_log_sink = ErrorLogSink()
@@ -1,11 +1,12 @@
-from quickstart.models.signals_model import ErrorLog
+from quickstart.utils.error_log_sink import error_log_sink
 
 def log_error(request, message, status_code=None):
     user = request.user if request.user.is_authenticated else None
-    ErrorLog.objects.create(
-        user=user,
-        path=request.path,
-        method=request.method,
-        message= message,
-        status_code=status_code
-    )
+    # Buffered and sampled, see quickstart/utils/error_log_sink.py
+    error_log_sink.record({
+        'user_id': user.id if user else None,
+        'path': request.path,
+        'method': request.method,
+        'message': message,
+        'status_code': status_code
+    })
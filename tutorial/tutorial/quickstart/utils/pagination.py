@@ -0,0 +1,84 @@
+import base64
+import json
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+"""
+Keyset (cursor) pagination on (created, id) for the blog feed.
+The cursor is an opaque url-safe token carrying the position of the last row of
+the previous page, so every page is a single indexed range scan however deep we go.
+            /api/blog/?page_size=20&cursor=<next from previous page>
+"""
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created, pk):
+    raw = json.dumps([created.isoformat(), pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_raw, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created = parse_datetime(created_raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor('Malformed cursor')
+
+    if created is None or not isinstance(pk, int):
+        raise InvalidCursor('Malformed cursor')
+    return created, pk
+
+
+def get_page_size(raw_page_size):
+    default_size = getattr(settings, 'BLOG_PAGE_SIZE', 20)
+    max_size = getattr(settings, 'BLOG_MAX_PAGE_SIZE', 100)
+
+    if raw_page_size in (None, ''):
+        return default_size
+    try:
+        page_size = int(raw_page_size)
+    except (TypeError, ValueError):
+        return default_size
+    if page_size < 1:
+        return default_size
+    # Hard cap so nobody can ask for the whole table in one page
+    return min(page_size, max_size)
+
+
+def _page_queryset(queryset, cursor, page_size):
+    queryset = queryset.order_by('created', 'id')
+    if cursor:
+        created, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(created__gt=created) | Q(created=created, id__gt=pk))
+    # One extra row tells us whether another page exists without a COUNT
+    return queryset[:page_size + 1]
+
+
+def _split_page(rows, page_size):
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(last.created, last.id)
+
+
+def paginate_by_cursor(queryset, cursor=None, page_size=None):
+    """
+    Returns (rows, next_cursor). next_cursor is None on the last page.
+    Raises InvalidCursor when the cursor can't be decoded.
+    """
+    page_size = page_size or get_page_size(None)
+    rows = list(_page_queryset(queryset, cursor, page_size))
+    return _split_page(rows, page_size)
+
+
+async def apaginate_by_cursor(queryset, cursor=None, page_size=None):
+    """paginate_by_cursor for async views"""
+    page_size = page_size or get_page_size(None)
+    rows = [row async for row in _page_queryset(queryset, cursor, page_size)]
+    return _split_page(rows, page_size)
@@ -1,4 +1,5 @@
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import F
 from quickstart.utils.response_handler import ResponseHandler
 """
 Below is my Custom Logic for the Likes, Dislikes,of every blog, comment or reply
@@ -18,46 +19,48 @@ def handle_reaction_logic(current_user, target_object, action, reaction_model, r
         reaction_field_name: target_object
     }
 
-    reaction, created = reaction_model.objects.get_or_create(
-        **reaction_filter,
-        defaults={'reaction': action}
-    )
-    if not created:
-        if reaction.reaction == action:
-            # User is removing their reaction
-            reaction.delete()
-            message = f"Your {action} has been removed from this {object_name}."
+    with transaction.atomic():
+        reaction, created = reaction_model.objects.select_for_update().get_or_create(
+            **reaction_filter,
+            defaults={'reaction': action}
+        )
+        if not created:
+            if reaction.reaction == action:
+                # User is removing their reaction
+                reaction.delete()
+                deltas = {action: -1}
+                message = f"Your {action} has been removed from this {object_name}."
+            else:
+                # User is changing their reaction
+                deltas = {action: 1, reaction.reaction: -1}
+                reaction.reaction = action
+                reaction.save()
+                message = f"Your reaction has been changed to {action} for this {object_name}."
         else:
-            # User is changing their reaction
-            reaction.reaction = action
-            reaction.save()
-            message = f"Your reaction has been changed to {action} for this {object_name}."
-    else:
-        message = f"You have {action}d this {object_name}."
-    # Update the target object's like/dislike counts
-    update_reaction_counts(target_object, reaction_model, reaction_field_name)
+            deltas = {action: 1}
+            message = f"You have {action}d this {object_name}."
+        # Update the target object's like/dislike counts
+        counts = apply_reaction_deltas(target_object, deltas)
 
     return ResponseHandler.success(
         message=message,
-        code=0
+        code=0,
+        data=counts
     )
 
-def update_reaction_counts(target_object, reaction_model, reaction_field_name):
+def apply_reaction_deltas(target_object, deltas):
     """
-    Update the like/dislike counts on the target object based on actual reactions
+    Move the like/dislike counters of the target by the given deltas ({'like': 1, 'dislike': -1})
+    with a single UPDATE using F() expressions, so concurrent reactions never overwrite each other
     """
-    # Count actual reactions of users
-    reaction_filter = {reaction_field_name: target_object}
+    updates = {f'{reaction}s': F(f'{reaction}s') + delta for reaction, delta in deltas.items()}
+    type(target_object).objects.filter(pk=target_object.pk).update(**updates)
 
-    reaction_counts = reaction_model.objects.filter(**reaction_filter).aggregate(
-        likes=Count('id', filter=Q(reaction='like')),
-        dislikes=Count('id', filter=Q(reaction='dislike'))
-    )
-
-    # Update the target object
-    target_object.likes = reaction_counts['likes'] or 0
-    target_object.dislikes = reaction_counts['dislikes'] or 0
-    target_object.save(update_fields=['likes', 'dislikes'])
+    target_object.refresh_from_db(fields=['likes', 'dislikes'])
+    return {
+        'likes': target_object.likes,
+        'dislikes': target_object.dislikes
+    }
 
 def extract_action_from_path(request_path):
     parts = request_path.strip('/').split('/')
@@ -0,0 +1,132 @@
+import json
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.serializers.json import DjangoJSONEncoder
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.renderers import BaseRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+"""
+Encoders behind ResponseHandler and the DRF views.
+
+JSON goes through orjson when it is installed (falls back to the stdlib encoder). Datetimes, decimals, lazy strings etc.
+are still handed to DjangoJSONEncoder, so the output is the same as JsonResponse gave, only faster.
+MessagePack is opt-in: clients that send `Accept: application/msgpack` get it when msgpack is installed.
+
+ResponseHandler.success/error return an EnvelopeResponse that is encoded only once the format is known:
+ContentNegotiationMiddleware picks the format from the Accept header, Django renders it right after the view.
+"""
+
+JSON_MEDIA_TYPE = 'application/json'
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def _default(obj):
+    return _django_encoder.default(obj)
+
+
+def dumps_json(data):
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+def dumps_msgpack(data):
+    if msgpack is None:
+        raise RuntimeError('msgpack is not installed')
+    return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+def msgpack_available():
+    return msgpack is not None
+
+
+def negotiate_media_type(request):
+    """MessagePack only when the client asks for it (and prefers it over JSON), JSON otherwise"""
+    if msgpack is None:
+        return JSON_MEDIA_TYPE
+    preferred = request.get_preferred_type([JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE])
+    return MSGPACK_MEDIA_TYPE if preferred == MSGPACK_MEDIA_TYPE else JSON_MEDIA_TYPE
+
+
+class EnvelopeResponse(SimpleTemplateResponse):
+    """Response that keeps the payload and encodes it at render time, in JSON unless negotiated otherwise"""
+
+    def __init__(self, payload, status=200):
+        super().__init__(template=None, content_type=JSON_MEDIA_TYPE, status=status)
+        self.payload = payload
+        self.media_type = JSON_MEDIA_TYPE
+
+    def use_media_type(self, media_type):
+        self.media_type = media_type
+        self['Content-Type'] = media_type
+
+    @property
+    def rendered_content(self):
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return dumps_msgpack(self.payload)
+        return dumps_json(self.payload)
+
+    @property
+    def content(self):
+        # Reading the content of a response that has not gone through the handler yet renders it as JSON
+        if not self._is_rendered:
+            self.render()
+        return super().content
+
+    @content.setter
+    def content(self, value):
+        SimpleTemplateResponse.content.fset(self, value)
+
+
+class ContentNegotiationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_template_response(self, request, response):
+        if isinstance(response, EnvelopeResponse):
+            response.use_media_type(negotiate_media_type(request))
+            patch_vary_headers(response, ['Accept'])
+        return response
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = JSON_MEDIA_TYPE
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps_json(data)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = MSGPACK_MEDIA_TYPE
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps_msgpack(data)
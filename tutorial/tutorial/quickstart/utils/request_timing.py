@@ -0,0 +1,229 @@
+import json
+import logging
+import math
+import os
+import threading
+from collections import deque
+from contextvars import ContextVar
+from time import perf_counter
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+"""
+Per-request timing: query count, DB time, view time, render time and total time.
+
+RequestTimingMiddleware (first in MIDDLEWARE, sync or async) puts a QueryTimer in a context variable for
+the request; every database connection gets an execute wrapper feeding the current timer, so the queries
+async views run through sync_to_async (in another thread, on another connection) are counted too.
+
+The view time ends when the view returns its (template) response, and the render time is what
+encoding the response costs after that. Everything the view does internally is in the view time:
+auth, role lookup, ORM, serializers, log_error and signal receivers. For streamed responses
+(the blog export) the body is produced after the middleware, so that part is not measured.
+
+The timings go to
+    - the Server-Timing header (ms): db;dur=..;desc="N queries", view;dur=.., render;dur=.., total;dur=..
+    - the 'quickstart.performance' logger, one JSON line per request (INFO, or WARNING above
+      REQUEST_TIMING_SLOW_MS)
+    - with REQUEST_TIMING_SUMMARY_DIR set, a rolling window of the last REQUEST_TIMING_WINDOW requests
+      per view. Each process rewrites its own file in that directory every REQUEST_TIMING_FLUSH_EVERY
+      requests, and manage.py request_timing_summary merges the files into p50/p90/p99.
+"""
+
+logger = logging.getLogger('quickstart.performance')
+
+METRICS = ('total', 'view', 'render', 'db', 'queries')
+
+
+class QueryTimer:
+    """Query count and time of the current request"""
+
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0.0
+
+
+_query_timer = ContextVar('query_timer', default=None)
+
+
+def timed_execute(execute, sql, params, many, context):
+    timer = _query_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.queries += 1
+        timer.duration += perf_counter() - started
+
+
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    if timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(timed_execute)
+
+
+class TimingWindow:
+    """Last `size` timings per view of this process, written to `path` as JSON"""
+
+    def __init__(self, path, size, flush_every):
+        self.path = path
+        self.size = size
+        self.flush_every = flush_every
+        self.views = {}
+        self.pending = 0
+        self.lock = threading.Lock()
+
+    def add(self, view, timing):
+        with self.lock:
+            window = self.views.setdefault(view, deque(maxlen=self.size))
+            window.append([timing[metric] for metric in METRICS])
+            self.pending += 1
+            if self.pending < self.flush_every:
+                return
+            self.pending = 0
+            snapshot = {view: list(rows) for view, rows in self.views.items()}
+        self.write(snapshot)
+
+    def write(self, snapshot):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump({'metrics': METRICS, 'views': snapshot}, file)
+        os.replace(temporary, self.path)
+
+
+_windows = {}
+_windows_lock = threading.Lock()
+
+
+def get_timing_window():
+    directory = getattr(settings, 'REQUEST_TIMING_SUMMARY_DIR', '')
+    if not directory:
+        return None
+    path = os.path.join(directory, f'timing-{os.getpid()}.json')
+    with _windows_lock:
+        if path not in _windows:
+            _windows[path] = TimingWindow(
+                path,
+                size=getattr(settings, 'REQUEST_TIMING_WINDOW', 1000),
+                flush_every=getattr(settings, 'REQUEST_TIMING_FLUSH_EVERY', 100)
+            )
+        return _windows[path]
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    index = max(0, min(len(values) - 1, math.ceil(fraction * len(values)) - 1))
+    return values[index]
+
+
+def load_timing_summary(directory):
+    """Merges the window files of every process into {view: {'requests': n, metric: {p50, p90, p99, max}}}"""
+    rows_per_view = {}
+    if os.path.isdir(directory):
+        for name in sorted(os.listdir(directory)):
+            if not (name.startswith('timing-') and name.endswith('.json')):
+                continue
+            with open(os.path.join(directory, name)) as file:
+                data = json.load(file)
+            for view, rows in data['views'].items():
+                rows_per_view.setdefault(view, []).extend(rows)
+
+    summary = {}
+    for view, rows in sorted(rows_per_view.items()):
+        summary[view] = {'requests': len(rows)}
+        for position, metric in enumerate(METRICS):
+            values = sorted(row[position] for row in rows)
+            summary[view][metric] = {
+                'p50': percentile(values, 0.5),
+                'p90': percentile(values, 0.9),
+                'p99': percentile(values, 0.99),
+                'max': values[-1],
+            }
+    return summary
+
+
+def server_timing_header(timing):
+    return (
+        f'db;dur={timing["db"]:.1f};desc="{timing["queries"]} queries", '
+        f'view;dur={timing["view"]:.1f}, '
+        f'render;dur={timing["render"]:.1f}, '
+        f'total;dur={timing["total"]:.1f}'
+    )
+
+
+class RequestTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer, token, started = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _query_timer.reset(token)
+        return self.finish(request, response, timer, started)
+
+    async def __acall__(self, request):
+        timer, token, started = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _query_timer.reset(token)
+        return self.finish(request, response, timer, started)
+
+    def start(self, request):
+        request._timing_view_started = request._timing_view_ended = None
+        timer = QueryTimer()
+        return timer, _query_timer.set(timer), perf_counter()
+
+    def finish(self, request, response, timer, started):
+        ended = perf_counter()
+        view_started = request._timing_view_started or started
+        view_ended = request._timing_view_ended or ended
+        timing = {
+            'total': (ended - started) * 1000,
+            'view': (view_ended - view_started) * 1000,
+            'render': (ended - view_ended) * 1000,
+            'db': timer.duration * 1000,
+            'queries': timer.queries,
+        }
+        response['Server-Timing'] = server_timing_header(timing)
+        self.record(request, response, timing)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._timing_view_started = perf_counter()
+
+    def process_template_response(self, request, response):
+        # Called right after the view returned, only the other middlewares' hooks run before it
+        request._timing_view_ended = perf_counter()
+        return response
+
+    def record(self, request, response, timing):
+        match = request.resolver_match
+        view = f'{request.method} {match.view_name if match else request.path}'
+        slow = timing['total'] >= getattr(settings, 'REQUEST_TIMING_SLOW_MS', 500)
+        level = logging.WARNING if slow else logging.INFO
+        if logger.isEnabledFor(level):
+            logger.log(level, json.dumps({
+                'route': view,
+                'path': request.path,
+                'status': response.status_code,
+                **{metric: round(value, 2) for metric, value in timing.items()},
+            }))
+
+        window = get_timing_window()
+        if window is not None:
+            window.add(view, timing)
@@ -1,17 +1,19 @@
 from rest_framework.response import Response
-from django.http import JsonResponse
+from quickstart.utils.renderers import EnvelopeResponse
 class ResponseHandler:
     @staticmethod
-    def success(data=None, message="Success", code=0, status_code=200):
-        return JsonResponse({
+    def success(data=None, message="Success", code=0, status_code=200, **extra):
+        # extra keys (e.g. the "next" cursor of a paginated list) sit next to data in the envelope
+        return EnvelopeResponse({
             "code": code,
             "status": "success",
             "message": message,
-            "data": data
+            "data": data,
+            **extra
         }, status=status_code)
     @staticmethod
     def error(message="Error", errors=None, code=1, status_code=200):
-        return JsonResponse({
+        return EnvelopeResponse({
             "code": code,
             "status": "error",
             "message": message,
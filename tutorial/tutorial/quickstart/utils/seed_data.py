@@ -0,0 +1,184 @@
+"""
+Synthetic data for load testing (manage.py seed_blog_data).
+
+Every table is filled with bulk_create in batches, inside one transaction per table, so no model
+signal runs (no activity logs, notification mails or cache bumps per row). The password is hashed
+once and shared by every seeded user, and the like/dislike columns and the subscription counters
+are written from the generated reactions and subscriptions so they agree with the tables.
+
+Popularity follows a Zipf-like law with exponent `skew`: a few authors write most of the blogs
+and a few blogs get most of the comments and reactions (skew=0 spreads everything evenly).
+The same seed always produces the same dataset.
+"""
+import random
+from collections import Counter
+from itertools import accumulate, islice
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel, ReplyCommentModel
+from quickstart.models.reaction_models import BlogReactionModel, CommentReactionModel, ReplyReactionModel
+from quickstart.models.subscription_models import SubscribeTable
+from quickstart.utils.subscription_counters import rebuild_subscription_counters
+
+WORDS = (
+    'python django query index cache latency budget stream worker replica async batch signal '
+    'reader writer blog comment reply like subscribe profile export token feed cursor page'
+).split()
+
+
+def zipf_cum_weights(size, skew):
+    return list(accumulate(1 / (rank + 1) ** skew for rank in range(size)))
+
+
+def spread(rng, total, size, skew, cap=None):
+    """Splits `total` items over `size` buckets by Zipf popularity, each bucket holding at most `cap`"""
+    if not size:
+        return [0] * size
+    cum_weights = zipf_cum_weights(size, skew)
+    # Popularity ranks are shuffled so the viral buckets are not simply the first ids
+    ranks = list(range(size))
+    rng.shuffle(ranks)
+    counts = Counter(rng.choices(ranks, cum_weights=cum_weights, k=total))
+    return [min(counts[bucket], cap) if cap is not None else counts[bucket] for bucket in range(size)]
+
+
+def sentence(rng, words):
+    return ' '.join(rng.choices(WORDS, k=words)).capitalize()
+
+
+def bulk_insert(model, objects, batch_size):
+    """Inserts the objects batch by batch and returns their primary keys"""
+    pks = []
+    objects = iter(objects)
+    with transaction.atomic():
+        while True:
+            batch = list(islice(objects, batch_size))
+            if not batch:
+                return pks
+            model.objects.bulk_create(batch, batch_size=batch_size)
+            pks.extend(obj.pk for obj in batch)
+
+
+def reactions_for(rng, target_ids, counts, user_ids):
+    """
+    Yields (user_id, target_id, reaction) with distinct users per target, about 4 likes for 1 dislike.
+    A target gets at most one reaction per user, however large its count
+    """
+    for target_id, count in zip(target_ids, counts):
+        for user_id in rng.sample(user_ids, min(count, len(user_ids))):
+            yield user_id, target_id, 'like' if rng.random() < 0.8 else 'dislike'
+
+
+def tally(reactions):
+    likes, dislikes = Counter(), Counter()
+    for _, target_id, reaction in reactions:
+        (likes if reaction == 'like' else dislikes)[target_id] += 1
+    return likes, dislikes
+
+
+def seed_blog_data(users, writers, blogs, comments_per_blog, replies_per_comment, reactions_per_blog,
+                   reactions_per_comment, subscriptions_per_user, skew=1.0, seed=0, batch_size=1000,
+                   prefix='seed', password='seedpass123', log=None):
+    """Creates the dataset and returns {table: rows created}"""
+    rng = random.Random(seed)
+    log = log or (lambda message: None)
+    created = {}
+    writers = min(writers, users)
+    password_hash = make_password(password)
+
+    user_ids = bulk_insert(User, (
+        User(username=f'{prefix}{i}', email=f'{prefix}{i}@example.com', password=password_hash)
+        for i in range(users)
+    ), batch_size)
+    bulk_insert(User_Data, (
+        User_Data(user_id=user_id, role='writer' if i < writers else 'viewer', mobile_number='0000000000',
+                  email_address=f'{prefix}{i}@example.com')
+        for i, user_id in enumerate(user_ids)
+    ), batch_size)
+    writer_ids = user_ids[:writers]
+    created['users'] = len(user_ids)
+    log(f'{len(user_ids)} users ({writers} writers)')
+
+    # Blogs: a few viral authors write most of them
+    blog_authors = []
+    for writer_id, count in zip(writer_ids, spread(rng, blogs if writer_ids else 0, writers, skew)):
+        blog_authors.extend([writer_id] * count)
+    rng.shuffle(blog_authors)
+
+    # Comments and blog reactions: a few viral blogs get most of them
+    comment_counts = spread(rng, len(blog_authors) * comments_per_blog, len(blog_authors), skew)
+    reaction_counts = spread(rng, len(blog_authors) * reactions_per_blog, len(blog_authors), skew, cap=users)
+    blog_reactions = list(reactions_for(rng, range(len(blog_authors)), reaction_counts, user_ids))
+    blog_likes, blog_dislikes = tally(blog_reactions)
+
+    blog_ids = bulk_insert(BlogModel, (
+        BlogModel(user_id=author_id, title=sentence(rng, 5), content=sentence(rng, 40),
+                  likes=blog_likes[i], dislikes=blog_dislikes[i])
+        for i, author_id in enumerate(blog_authors)
+    ), batch_size)
+    created['blogs'] = len(blog_ids)
+    created['blog_reactions'] = len(bulk_insert(BlogReactionModel, (
+        BlogReactionModel(user_id=user_id, blog_id=blog_ids[i], reaction=reaction)
+        for user_id, i, reaction in blog_reactions
+    ), batch_size))
+    log(f"{created['blogs']} blogs, {created['blog_reactions']} blog reactions")
+
+    comment_blogs = [blog_ids[i] for i, count in enumerate(comment_counts) for _ in range(count)]
+    comment_reactions = list(reactions_for(
+        rng, range(len(comment_blogs)),
+        [rng.randint(0, 2 * reactions_per_comment) for _ in comment_blogs],
+        user_ids
+    ))
+    comment_likes, comment_dislikes = tally(comment_reactions)
+    comment_ids = bulk_insert(BlogPostCommentModel, (
+        BlogPostCommentModel(user_id=rng.choice(user_ids), blog_id=blog_id, comment=sentence(rng, 12),
+                             likes=comment_likes[i], dislikes=comment_dislikes[i])
+        for i, blog_id in enumerate(comment_blogs)
+    ), batch_size)
+    created['comments'] = len(comment_ids)
+    created['comment_reactions'] = len(bulk_insert(CommentReactionModel, (
+        CommentReactionModel(user_id=user_id, comment_id=comment_ids[i], reaction=reaction)
+        for user_id, i, reaction in comment_reactions
+    ), batch_size))
+    log(f"{created['comments']} comments, {created['comment_reactions']} comment reactions")
+
+    reply_comments = [
+        comment_id for comment_id in comment_ids for _ in range(rng.randint(0, 2 * replies_per_comment))
+    ]
+    reply_reactions = list(reactions_for(
+        rng, range(len(reply_comments)),
+        [rng.randint(0, reactions_per_comment) for _ in reply_comments],
+        user_ids
+    ))
+    reply_likes, reply_dislikes = tally(reply_reactions)
+    reply_ids = bulk_insert(ReplyCommentModel, (
+        ReplyCommentModel(user_id=rng.choice(user_ids), comment_id=comment_id, reply=sentence(rng, 8),
+                          likes=reply_likes[i], dislikes=reply_dislikes[i])
+        for i, comment_id in enumerate(reply_comments)
+    ), batch_size)
+    created['replies'] = len(reply_ids)
+    created['reply_reactions'] = len(bulk_insert(ReplyReactionModel, (
+        ReplyReactionModel(user_id=user_id, reply_id=reply_ids[i], reaction=reaction)
+        for user_id, i, reaction in reply_reactions
+    ), batch_size))
+    log(f"{created['replies']} replies, {created['reply_reactions']} reply reactions")
+
+    # Subscriptions: the viral authors gather most of the subscribers
+    author_weights = zipf_cum_weights(len(writer_ids), skew)
+    per_user = min(subscriptions_per_user, len(writer_ids))
+
+    def subscriptions():
+        for user_id in user_ids:
+            # Bounded draws: with a strong skew the tail authors may never come up
+            draws = dict.fromkeys(rng.choices(writer_ids, cum_weights=author_weights, k=4 * per_user))
+            authors = set(islice(draws, per_user))
+            authors.discard(user_id)
+            for author_id in sorted(authors):
+                yield SubscribeTable(subscriber_id=user_id, author_id=author_id)
+
+    created['subscriptions'] = len(bulk_insert(SubscribeTable, subscriptions(), batch_size))
+    rebuild_subscription_counters(batch_size=batch_size)
+    log(f"{created['subscriptions']} subscriptions")
+    return created
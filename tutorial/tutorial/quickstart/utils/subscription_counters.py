@@ -0,0 +1,52 @@
+from django.db import transaction
+from django.db.models import Count, F, Q
+from quickstart.models.subscription_models import AuthorSubscriptionStats, SubscribeTable
+
+"""
+Keeps AuthorSubscriptionStats in step with SubscribeTable.
+adjust_subscription_counters must be called inside the transaction that changes the subscription,
+rebuild_subscription_counters recomputes everything from the tables (manage.py rebuild_subscription_counters).
+"""
+
+
+def adjust_subscription_counters(author_id, active_delta=0, total_delta=0):
+    AuthorSubscriptionStats.objects.get_or_create(author_id=author_id)
+    AuthorSubscriptionStats.objects.filter(author_id=author_id).update(
+        active_subscribers=F('active_subscribers') + active_delta,
+        total_subscriptions_ever=F('total_subscriptions_ever') + total_delta
+    )
+
+
+def _counters_query(author_id):
+    return AuthorSubscriptionStats.objects.filter(author_id=author_id).values(
+        'active_subscribers', 'total_subscriptions_ever'
+    )
+
+
+def get_subscription_counters(author_id):
+    stats = _counters_query(author_id).first()
+    return stats or {'active_subscribers': 0, 'total_subscriptions_ever': 0}
+
+
+async def aget_subscription_counters(author_id):
+    stats = await _counters_query(author_id).afirst()
+    return stats or {'active_subscribers': 0, 'total_subscriptions_ever': 0}
+
+
+def rebuild_subscription_counters(batch_size=1000):
+    rows = SubscribeTable.objects.values('author_id').annotate(
+        active=Count('id', filter=Q(is_active=True)),
+        total=Count('id')
+    )
+    stats = [
+        AuthorSubscriptionStats(
+            author_id=row['author_id'],
+            active_subscribers=row['active'],
+            total_subscriptions_ever=row['total']
+        )
+        for row in rows
+    ]
+    with transaction.atomic():
+        AuthorSubscriptionStats.objects.all().delete()
+        AuthorSubscriptionStats.objects.bulk_create(stats, batch_size=batch_size)
+    return len(stats)
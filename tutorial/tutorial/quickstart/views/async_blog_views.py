@@ -0,0 +1,96 @@
+import asyncio
+from asgiref.sync import sync_to_async
+from quickstart.models.blog_models import BlogModel
+from quickstart.permissions.roles import READER, WRITER
+from quickstart.utils.async_api import AsyncAPIView, alog_error, arequest_role
+from quickstart.utils.blog_cache import get_blog_payloads, with_user_fields
+from quickstart.utils.pagination import InvalidCursor, apaginate_by_cursor, get_page_size
+from quickstart.utils.response_handler import ResponseHandler
+from quickstart.utils.subscription_resolver import SubscriptionResolver
+
+"""
+Async versions of GET /api/blog/ and GET /api/blog/<pk>/ for ASGI deployments, same responses as the DRF views.
+The blog payloads (cache + comment trees) and the subscription fields of the page are awaited together with
+asyncio.gather. Both go through thread-sensitive sync_to_async (the async ORM does too), so their queries still
+run one after the other on one thread: what ASGI gains is that the event loop serves other requests meanwhile.
+"""
+
+aget_blog_payloads = sync_to_async(get_blog_payloads)
+
+
+class AsyncBlogPostView(AsyncAPIView):
+
+    async def get(self, request):
+        if await arequest_role(request) not in (READER, WRITER):
+            await alog_error(request, 'Other Roles are trying to fetch blogs', 200)
+            return ResponseHandler.error(
+                message='No other Roles are Allowed',
+                code=-1
+            )
+
+        try:
+            blogs, next_cursor = await apaginate_by_cursor(
+                BlogModel.objects.select_related('user'),
+                cursor=request.GET.get('cursor'),
+                page_size=get_page_size(request.GET.get('page_size')),
+            )
+        except InvalidCursor:
+            await alog_error(request, 'Invalid pagination cursor', 200)
+            return ResponseHandler.error(
+                message='Invalid cursor',
+                code=1
+            )
+
+        payloads, subscriptions = await asyncio.gather(
+            aget_blog_payloads(blogs),
+            SubscriptionResolver(request.user).aresolve(blog.user_id for blog in blogs)
+        )
+        data_with_authors = [
+            with_user_fields(
+                payloads[blog.id],
+                is_subscribed=subscriptions.is_subscribed(blog.user_id),
+                author_subscribers_count=subscriptions.active_subscriber_count(blog.user_id)
+            )
+            for blog in blogs
+        ]
+        return ResponseHandler.success(
+            code=0,
+            message="Blog Post Successfully Fetched",
+            data=data_with_authors,
+            next=next_cursor
+        )
+
+
+class AsyncDetailBlogPost(AsyncAPIView):
+
+    async def get(self, request, pk):
+        if await arequest_role(request) not in (READER, WRITER):
+            await alog_error(request, 'Other roles trying to fetch blogs', 200)
+            return ResponseHandler.error(
+                code=-1,
+                message='No other Roles Allowed',
+                errors="NONE"
+            )
+
+        try:
+            specific_blog = await BlogModel.objects.select_related('user').aget(pk=pk)
+        except BlogModel.DoesNotExist:
+            await alog_error(request, f'No blog exist with id {pk}', 200)
+            return ResponseHandler.error(
+                message='Blog not found',
+                code=-1,
+            )
+
+        payloads, subscriptions = await asyncio.gather(
+            aget_blog_payloads([specific_blog], count_reactions=True),
+            SubscriptionResolver(request.user).aresolve([specific_blog.user_id])
+        )
+        response_data = with_user_fields(
+            payloads[specific_blog.id],
+            is_subscribed=subscriptions.is_subscribed(specific_blog.user_id),
+            author_subscribers_count=subscriptions.active_subscriber_count(specific_blog.user_id)
+        )
+        return ResponseHandler.success(
+            message='Blog Post Successfully Fetched',
+            data=response_data
+        )
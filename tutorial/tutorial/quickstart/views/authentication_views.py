@@ -3,10 +3,11 @@ from rest_framework import viewsets
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from quickstart.models.authentication_models import User_Data
-from quickstart.models.signals_model import ActivityLog
+from quickstart.permissions.roles import ROLE_CLAIM
 from quickstart.serializers.user_data_serializer import User_Data_Serializer, LoginSerializer
 from datetime import datetime
 
+from quickstart.utils.activity_pipeline import record_activity
 from quickstart.utils.logger import log_error
 
 
@@ -30,7 +31,7 @@ class LoginViewSet(viewsets.ViewSet):
                 now = datetime.now()
                 pretty = now.strftime("%B %d, %Y at %I:%M %p")
 
-                ActivityLog.objects.create(
+                record_activity(
                     user=user,
                     action='User logged in',
                     model_name='User',
@@ -47,6 +48,8 @@ class LoginViewSet(viewsets.ViewSet):
                     )
 
                 refresh = RefreshToken.for_user(user)
+                # Role travels in the tokens (the access token copies it), role checks don't need the profile row
+                refresh[ROLE_CLAIM] = user_profile.role.lower()
                 user_data = {
                     "id": user.id,
                     "username": user.username,
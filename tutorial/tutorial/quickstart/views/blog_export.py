@@ -0,0 +1,94 @@
+from itertools import islice
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+from quickstart.models.blog_models import BlogModel
+from quickstart.permissions.roles import IsReaderOrWriter
+from quickstart.utils.blog_cache import build_blog_payloads, with_user_fields
+from quickstart.utils.logger import log_error
+from quickstart.utils.renderers import dumps_json
+from quickstart.utils.response_handler import ResponseHandler
+from quickstart.utils.subscription_resolver import SubscriptionResolver
+
+"""
+Whole-corpus export for internal consumers (search indexer, analytics jobs).
+
+Blogs are read with .iterator() and handled BLOG_EXPORT_BATCH_SIZE at a time: comment trees and subscription
+fields are loaded per batch and every batch is encoded and sent before the next one is read,
+so memory stays flat whatever the number of blogs. Items have the same shape as GET /api/blog/.
+    GET /api/blog/export/               -> one JSON array
+    GET /api/blog/export/?output=ndjson -> one blog per line
+"""
+
+OUTPUT_FORMATS = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def iter_blog_batches(batch_size):
+    blogs = BlogModel.objects.select_related('user').order_by('created', 'id').iterator(chunk_size=batch_size)
+    while True:
+        batch = list(islice(blogs, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_export_items(user, batch_size):
+    for blogs in iter_blog_batches(batch_size):
+        payloads = build_blog_payloads(blogs)
+        # Fresh resolver per batch, so nothing accumulates over the export
+        subscriptions = SubscriptionResolver(user).resolve(blog.user_id for blog in blogs)
+        yield [
+            with_user_fields(
+                payloads[blog.id],
+                is_subscribed=subscriptions.is_subscribed(blog.user_id),
+                author_subscribers_count=subscriptions.active_subscriber_count(blog.user_id)
+            )
+            for blog in blogs
+        ]
+
+
+def stream_json_array(batches):
+    yield b'['
+    first = True
+    for items in batches:
+        chunk = b','.join(dumps_json(item) for item in items)
+        if not first:
+            chunk = b',' + chunk
+        first = False
+        yield chunk
+    yield b']'
+
+
+def stream_ndjson(batches):
+    for items in batches:
+        yield b''.join(dumps_json(item) + b'\n' for item in items)
+
+
+class BlogExportAPIView(APIView):
+    permission_classes = [IsAuthenticated, IsReaderOrWriter]
+
+    def get(self, request):
+        output = request.query_params.get('output', 'json').lower()
+        if output not in OUTPUT_FORMATS:
+            log_error(request, f'Unknown export output {output}', 200)
+            return ResponseHandler.error(
+                message='Output must be json or ndjson',
+                code=1
+            )
+
+        batches = iter_export_items(request.user, getattr(settings, 'BLOG_EXPORT_BATCH_SIZE', 500))
+        stream = stream_ndjson(batches) if output == 'ndjson' else stream_json_array(batches)
+        return StreamingHttpResponse(stream, content_type=OUTPUT_FORMATS[output])
+
+    def http_method_not_allowed(self, request, *args, **kwargs):
+        log_error(request, 'Other than GET is used on export', 200)
+
+        return ResponseHandler.error(
+            message='No other Methods Allowed',
+            code=-1,
+            errors="NONE"
+        )
@@ -1,27 +1,30 @@
+from django.db import transaction
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
-from quickstart.models.blog_models import BlogPostCommentModel, ReplyCommentModel, BlogModel
-from quickstart.models.subscription_models import SubscribeTable
-from quickstart.serializers.blog_post_serializer import BlogPostSerializer, CommentSerializer, ReplySerializer
+from quickstart.models.blog_models import BlogModel
+from quickstart.permissions.roles import IsReaderOrWriter, IsWriter, MethodRolePermission
+from quickstart.serializers.blog_post_serializer import BlogPostSerializer
+from quickstart.utils.blog_cache import get_blog_payloads, with_user_fields
+from quickstart.utils.db_router import ReplicaReadMixin
 from quickstart.utils.logger import log_error
+from quickstart.utils.pagination import InvalidCursor, get_page_size, paginate_by_cursor
 from quickstart.utils.response_handler import ResponseHandler
-from quickstart.tasks.email_tasks import send_blog_notification_email
+from quickstart.utils.subscription_resolver import get_subscription_resolver
+from quickstart.tasks.email_tasks import fan_out_blog_notification
 
 
-class BlogPostAPIView(APIView):
-    permission_classes = [IsAuthenticated]
+class BlogPostAPIView(ReplicaReadMixin, APIView):
+    permission_classes = [IsAuthenticated, MethodRolePermission]
+    role_permissions = {
+        'GET': IsReaderOrWriter(log_message='Other Roles are trying to fetch blogs'),
+        'POST': IsWriter(
+            message='Only Writers are allowed to post', code=0, log_message='Other than writer trying to post blog'
+        ),
+    }
+
     def post(self, request):
         current_user = request.user
 
-        if current_user.profile.role.lower() != 'writer':
-            log_error(request, 'Other than writer trying to post blog', 200)
-
-            return ResponseHandler.error(
-                message='Only Writers are allowed to post',
-                code=0,
-                errors=None
-            )
-
         post_data = request.data
         allowed_fields = {'title', 'content'}
         extra_fields = set(post_data.keys()) - allowed_fields
@@ -37,19 +40,18 @@ class BlogPostAPIView(APIView):
         serializer = BlogPostSerializer(data=post_data)
         if serializer.is_valid():
             serializer.save(user=current_user)
-            blog_title = serializer.data.get('title', 'Untitled')
 
             response_data = serializer.data.copy()
             response_data['author'] = current_user.username
             response_data['author_id'] = current_user.id
 
-            # Fetch subscribers' emails
-            subscribers = SubscribeTable.objects.filter(author=current_user, is_active=True).select_related('subscriber')
-            subscribers_emails = [sub.subscriber.email for sub in subscribers if sub.subscriber.email]
-
-            # Below function is doing all the celery jobs needed for scheduling
-
-            send_blog_notification_email.delay(current_user.username, blog_title, subscribers_emails)
+            # Below function is doing all the celery jobs needed for scheduling,
+            # only the ids travel through the broker, the worker streams the subscribers itself
+            author_id, blog_id = current_user.id, serializer.instance.id
+            transaction.on_commit(
+                lambda: fan_out_blog_notification.delay(author_id, blog_id),
+                robust=True
+            )
 
             return ResponseHandler.success(
                 message="Blog created and notifications sent.",
@@ -69,75 +71,40 @@ class BlogPostAPIView(APIView):
     def get(self, request):
         current_user = request.user
 
-        if current_user.profile.role.lower() == 'viewer' or current_user.profile.role.lower() == 'writer':
-            # Viewer sees all blog posts with author information
-            blogs = BlogModel.objects.select_related('user').all().order_by('id')
-            serializer = BlogPostSerializer(blogs, many=True)
-
-            data_with_authors = []
-            for i, blog in enumerate(blogs):
-                blog_data = serializer.data[i].copy()
-                blog_data['author'] = blog.user.username
-                blog_data['author_id'] = blog.user.id
-                # Add subscription status using separate tables
-                blog_data['is_subscribed'] = self.check_subscription_status(current_user, blog.user)
-
-                # Add active subscriber count for the author
-                blog_data['author_subscribers_count'] = self.get_active_subscriber_count(blog.user)
-                blog_data['comments'] = self.get_comments_with_replies(blog, current_user)
-                data_with_authors.append(blog_data)
-            return ResponseHandler.success(
-                code = 0,
-                message = "Blog Post Successfully Fetched",
-                data = data_with_authors
+        # Viewer sees blog posts page by page (keyset on created, id) with author information
+        try:
+            blogs, next_cursor = paginate_by_cursor(
+                BlogModel.objects.select_related('user'),
+                cursor=request.query_params.get('cursor'),
+                page_size=get_page_size(request.query_params.get('page_size')),
             )
-        else:
-            log_error(request, 'Other Roles are trying to fetch blogs', 200)
+        except InvalidCursor:
+            log_error(request, 'Invalid pagination cursor', 200)
             return ResponseHandler.error(
-                message='No other Roles are Allowed',
-                code=-1
+                message='Invalid cursor',
+                code=1
             )
-
-    def check_subscription_status(self, current_user, author):
-        if current_user == author:
-            return None
-
-        return SubscribeTable.objects.filter(
-            subscriber=current_user,
-            author=author,
-            is_active=True
-        ).exists()
-
-    def get_active_subscriber_count(self, author):
-        return SubscribeTable.objects.filter(
-            author=author,
-            is_active=True
-        ).count()
-
-    def get_comments_with_replies(self, blog, current_user):
-        comments = BlogPostCommentModel.objects.filter(blog=blog).order_by('created')
-        comments_data = []
-
-        for comment in comments:
-            # Get comment data - now includes likes/dislikes from database
-            comment_serializer = CommentSerializer(comment)
-            comment_data = comment_serializer.data.copy()
-
-            # Get replies for this comment
-            replies = ReplyCommentModel.objects.filter(comment=comment).order_by('created')
-            replies_data = []
-
-            for reply in replies:
-                reply_serializer = ReplySerializer(reply)
-                reply_data = reply_serializer.data.copy()
-                # Now includes likes/dislikes from database fields
-                replies_data.append(reply_data)
-
-            comment_data['replies'] = replies_data
-            comments_data.append(comment_data)
-
-        return comments_data
-
+        # Blog fields, author and comment tree come from the versioned cache,
+        # only the blogs that changed since they were cached are rebuilt
+        payloads = get_blog_payloads(blogs)
+
+        # Subscription status and subscriber counts for every author on the page in two queries
+        subscriptions = get_subscription_resolver(request).resolve(blog.user_id for blog in blogs)
+
+        data_with_authors = [
+            with_user_fields(
+                payloads[blog.id],
+                is_subscribed=subscriptions.is_subscribed(blog.user_id),
+                author_subscribers_count=subscriptions.active_subscriber_count(blog.user_id)
+            )
+            for blog in blogs
+        ]
+        return ResponseHandler.success(
+            code = 0,
+            message = "Blog Post Successfully Fetched",
+            data = data_with_authors,
+            next = next_cursor
+        )
 
     def http_method_not_allowed(self, request, *args, **kwargs):
         log_error(request, 'Other than POST and GET are used', 200)
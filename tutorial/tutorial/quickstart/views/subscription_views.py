@@ -1,11 +1,12 @@
 from django.contrib.auth.models import User
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from quickstart.models.subscription_models import SubscribeTable, UnsubscribeTable
 from quickstart.serializers.subscription_serializers import SubscribeSerializer, UnsubscribeSerializer
 from quickstart.utils.logger import log_error
 from quickstart.utils.response_handler import ResponseHandler
+from quickstart.utils.subscription_counters import adjust_subscription_counters
 
 
 class SubscribeView(APIView):
@@ -36,26 +37,22 @@ class SubscribeView(APIView):
                 code=1
             )
 
-        existing_active_subscriber = SubscribeTable.objects.filter(
-            subscriber=current_user,
-            author=to_be_subscribed,
-            is_active=True
-        ).first()
-
-        if existing_active_subscriber:
+        # One INSERT; the unique_active_subscription constraint decides between concurrent clicks
+        try:
+            with transaction.atomic():
+                subscription = SubscribeTable.objects.create(
+                    subscriber=current_user,
+                    author=to_be_subscribed,
+                    is_active=True
+                )
+                adjust_subscription_counters(to_be_subscribed.id, active_delta=1, total_delta=1)
+        except IntegrityError:
             log_error(request, 'Already subscribed', 200)
             return ResponseHandler.error(
                 message=f'You are already subscribed to {to_be_subscribed.username}',
                 code=1
             )
 
-        # Create subscription
-        subscription = SubscribeTable.objects.create(
-            subscriber=current_user,
-            author=to_be_subscribed,
-            is_active=True
-        )
-
         serializer = SubscribeSerializer(subscription)
         return ResponseHandler.success(
             message=f'Successfully subscribed to {to_be_subscribed.username}',
@@ -86,29 +83,36 @@ class UnsubscribeView(APIView):
                 code=1
             )
 
-        active_subscription = SubscribeTable.objects.filter(
-            subscriber=current_user,
-            author=to_be_unsubscribed,
-            is_active=True
-        ).first()
-
-        if not active_subscription:
+        with transaction.atomic():
+            # One conditional UPDATE decides: only the request that actually flips the row goes on,
+            # a concurrent unsubscribe that lost the race updates 0 rows and is told to subscribe first
+            deactivated = SubscribeTable.objects.filter(
+                subscriber=current_user,
+                author=to_be_unsubscribed,
+                is_active=True
+            ).update(is_active=False)
+
+            if deactivated:
+                # At most one row was active, so it is the newest one of the pair
+                active_subscription = SubscribeTable.objects.filter(
+                    subscriber=current_user,
+                    author=to_be_unsubscribed
+                ).order_by('-id').first()
+
+                # Create Unsubscribe record
+                unsubscribe_record = UnsubscribeTable.objects.create(
+                    subscriber=current_user,
+                    author=to_be_unsubscribed,
+                    original_subscription=active_subscription,
+                )
+                adjust_subscription_counters(to_be_unsubscribed.id, active_delta=-1)
+
+        if not deactivated:
             log_error(request, 'First subscribe', 200)
             return ResponseHandler.error(
                 message=f'You are not subscribed to {to_be_unsubscribed.username}. First Subscribe',
                 code=1
             )
-        with transaction.atomic():
-            # Mark old subscription inactive
-            active_subscription.is_active = False
-            active_subscription.save()
-
-            # Create Unsubscribe record
-            unsubscribe_record = UnsubscribeTable.objects.create(
-                subscriber=current_user,
-                author=to_be_unsubscribed,
-                original_subscription=active_subscription,
-            )
 
         serializer = UnsubscribeSerializer(unsubscribe_record)
         return ResponseHandler.success(
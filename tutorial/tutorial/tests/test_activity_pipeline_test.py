@@ -0,0 +1,133 @@
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel
+from quickstart.models.signals_model import ActivityLog
+from quickstart.utils.activity_pipeline import activity_writer
+from quickstart.utils.buffered_writer import BufferedBulkWriter
+
+User = get_user_model()
+
+
+@override_settings(ACTIVITY_LOG_MODE='thread')
+@patch.object(activity_writer, '_ensure_thread')
+class ActivityPipelineTest(APITestCase):
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.viewer = User.objects.create_user(username='viewer', password='testpass456')
+        User_Data.objects.create(user=self.writer, role='writer')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+        self.blog = BlogModel.objects.create(user=self.writer, title='Test Blog', content='Content')
+        activity_writer.flush()
+        ActivityLog.objects.all().delete()
+
+    def test_reaction_is_logged_after_commit_not_in_request(self, _):
+        self.client.force_authenticate(user=self.viewer)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/blog/like/{self.blog.id}/')
+        self.assertEqual(ActivityLog.objects.count(), 0)
+        self.assertEqual(activity_writer.pending(), 1)
+
+        activity_writer.flush()
+        log = ActivityLog.objects.get()
+        self.assertEqual(log.action, 'Blog liked')
+        self.assertEqual(log.user, self.viewer)
+        self.assertEqual(log.blog_id, self.blog.id)
+
+    def test_events_are_dropped_with_rolled_back_transaction(self, _):
+        # Without the commit callbacks running nothing reaches the buffer
+        BlogModel.objects.create(user=self.writer, title='Not committed', content='Content')
+        self.assertEqual(activity_writer.pending(), 0)
+
+    def test_logs_of_deleted_blog_are_stored_as_deleted(self, _):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.blog.title = 'Edited'
+            self.blog.save()
+            self.blog.delete()
+        activity_writer.flush()
+        self.assertEqual(
+            sorted(ActivityLog.objects.values_list('action', 'status')),
+            [('Blog deleted', 2), ('Blog updated', 2)]
+        )
+
+    @override_settings(ACTIVITY_LOG_MODE='sync')
+    def test_sync_mode_writes_immediately(self, _):
+        BlogModel.objects.create(user=self.writer, title='Sync Blog', content='Content')
+        self.assertEqual(ActivityLog.objects.get().action, 'Blog created')
+        self.assertEqual(activity_writer.pending(), 0)
+
+    @override_settings(ACTIVITY_LOG_MODE='sync')
+    def test_blog_deletion_marks_its_logs_deleted(self, _):
+        other_blog = BlogModel.objects.create(user=self.writer, title='Other Blog', content='Content')
+        self.blog.title = 'Edited'
+        self.blog.save()
+        self.blog.delete()
+
+        self.assertEqual(
+            sorted(ActivityLog.objects.filter(status=2).values_list('action', flat=True)),
+            ['Blog deleted', 'Blog updated']
+        )
+        self.assertEqual(ActivityLog.objects.get(blog_id=other_blog.id).status, 1)
+
+
+class BufferedBulkWriterTest(TestCase):
+    def test_full_queue_is_drained_by_caller(self):
+        written = []
+        writer = BufferedBulkWriter('test', written.extend, batch_size=2, max_queue=3)
+        with patch.object(writer, '_ensure_thread'):
+            for i in range(7):
+                writer.put(i)
+        writer.flush()
+        self.assertEqual(written, list(range(7)))
+
+    def test_failed_batch_is_retried_in_order(self):
+        written, failures = [], [RuntimeError('database table is locked')]
+
+        def write(batch):
+            if failures:
+                raise failures.pop()
+            written.extend(batch)
+
+        writer = BufferedBulkWriter('test', write, batch_size=2, retry_backoff=0)
+        with patch.object(writer, '_ensure_thread'):
+            for i in range(4):
+                writer.put(i)
+        with self.assertLogs('quickstart.utils.buffered_writer', 'ERROR'):
+            writer.flush()
+        self.assertEqual(written, [])
+        self.assertEqual(writer.pending(), 4)
+        writer.flush()
+        self.assertEqual(written, [0, 1, 2, 3])
+
+    def test_batch_is_dropped_after_max_attempts(self):
+        written = []
+
+        def write(batch):
+            if 0 in batch:
+                raise RuntimeError('boom')
+            written.extend(batch)
+
+        writer = BufferedBulkWriter('test', write, batch_size=2, max_attempts=2, retry_backoff=0)
+        with patch.object(writer, '_ensure_thread'):
+            for i in range(4):
+                writer.put(i)
+        writer.flush()
+        with self.assertLogs('quickstart.utils.buffered_writer', 'WARNING') as logs:
+            writer.flush()
+        self.assertIn('dropped 2 rows after 2 failed attempts', logs.output[0])
+        self.assertEqual(written, [2, 3])
+
+    def test_final_flush_skips_a_database_that_is_gone(self):
+        written = []
+        writer = BufferedBulkWriter('test', written.extend, batch_size=2)
+        with patch.object(writer, '_ensure_thread'):
+            writer.put(0)
+        with patch('quickstart.utils.buffered_writer._default_database', return_value='db.sqlite3'), \
+                self.assertLogs('quickstart.utils.buffered_writer', 'WARNING'):
+            writer.flush(final=True)
+        self.assertEqual(written, [])
+        # Back on the database the row was queued for
+        writer.flush(final=True)
+        self.assertEqual(written, [0])
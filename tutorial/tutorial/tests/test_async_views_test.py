@@ -0,0 +1,111 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel, ReplyCommentModel
+from quickstart.models.subscription_models import SubscribeTable
+from quickstart.permissions.roles import ROLE_CLAIM
+from quickstart.utils.subscription_counters import rebuild_subscription_counters
+
+
+class AsyncViewsTest(APITestCase):
+    """The async endpoints answer exactly like the DRF views they mirror"""
+
+    def setUp(self):
+        cache.clear()
+        self.writer = self.make_user('writer', 'writer', email='writer@example.com')
+        self.viewer = self.make_user('viewer', 'viewer', email='viewer@example.com')
+        self.blogs = [
+            BlogModel.objects.create(user=self.writer, title=f'Blog {i}', content='Content') for i in range(3)
+        ]
+        comment = BlogPostCommentModel.objects.create(user=self.viewer, blog=self.blogs[0], comment='Comment')
+        ReplyCommentModel.objects.create(user=self.writer, comment=comment, reply='Reply')
+        SubscribeTable.objects.create(subscriber=self.viewer, author=self.writer)
+        rebuild_subscription_counters()
+
+    def make_user(self, username, role, email=''):
+        user = User.objects.create_user(username=username, password='testpass123', email=email)
+        User_Data.objects.create(user=user, role=role, mobile_number='123')
+        return user
+
+    def authorization(self, user):
+        refresh = RefreshToken.for_user(user)
+        refresh[ROLE_CLAIM] = user.profile.role
+        return f'Bearer {refresh.access_token}'
+
+    def get_both(self, user, sync_url, async_url):
+        self.client.credentials(HTTP_AUTHORIZATION=self.authorization(user))
+        sync_response = self.client.get(sync_url)
+        async_response = self.client.get(async_url)
+        self.client.credentials()
+        return sync_response.json(), async_response.json()
+
+    def test_blog_list(self):
+        sync_data, async_data = self.get_both(self.viewer, '/api/blog/', '/api/async/blog/')
+        self.assertEqual(len(async_data['data']), 3)
+        self.assertEqual(sync_data, async_data)
+
+    def test_blog_list_pages(self):
+        sync_data, async_data = self.get_both(self.viewer, '/api/blog/?page_size=2', '/api/async/blog/?page_size=2')
+        self.assertEqual(sync_data, async_data)
+        cursor = async_data['next']
+        sync_data, async_data = self.get_both(
+            self.viewer, f'/api/blog/?cursor={cursor}', f'/api/async/blog/?cursor={cursor}'
+        )
+        self.assertEqual([blog['title'] for blog in async_data['data']], ['Blog 2'])
+        self.assertEqual(sync_data, async_data)
+
+    def test_blog_list_invalid_cursor(self):
+        sync_data, async_data = self.get_both(self.viewer, '/api/blog/?cursor=nope', '/api/async/blog/?cursor=nope')
+        self.assertEqual(async_data['message'], 'Invalid cursor')
+        self.assertEqual(sync_data, async_data)
+
+    def test_blog_detail(self):
+        blog_id = self.blogs[0].id
+        sync_data, async_data = self.get_both(self.viewer, f'/api/blog/{blog_id}/', f'/api/async/blog/{blog_id}/')
+        self.assertTrue(async_data['data']['is_subscribed'])
+        self.assertEqual(sync_data, async_data)
+
+    def test_blog_detail_not_found(self):
+        sync_data, async_data = self.get_both(self.viewer, '/api/blog/999/', '/api/async/blog/999/')
+        self.assertEqual(async_data['message'], 'Blog not found')
+        self.assertEqual(sync_data, async_data)
+
+    def test_profile(self):
+        sync_data, async_data = self.get_both(self.writer, '/profile_api/profile/', '/profile_api/async/profile/')
+        self.assertEqual(async_data['user']['subscribers_emails'], ['viewer@example.com'])
+        self.assertEqual(sync_data, async_data)
+
+    def test_profile_without_blogs(self):
+        writer = self.make_user('new_writer', 'writer')
+        sync_data, async_data = self.get_both(writer, '/profile_api/profile/', '/profile_api/async/profile/')
+        self.assertEqual(async_data['blog_details']['blogs'], "No Blogs You haven't Posted yet")
+        self.assertEqual(sync_data, async_data)
+
+    def test_profile_is_for_writers(self):
+        sync_data, async_data = self.get_both(self.viewer, '/profile_api/profile/', '/profile_api/async/profile/')
+        self.assertEqual(async_data['message'], 'You are not a writer user')
+        self.assertEqual(sync_data, async_data)
+
+    def test_authentication_required(self):
+        response = self.client.get('/api/async/blog/')
+        self.assertEqual(response.json()['code'], -1)
+        self.assertEqual(response.json()['message'], 'Authentication credentials are missing or invalid.')
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer not-a-token')
+        response = self.client.get('/api/async/blog/')
+        self.assertEqual(response.json()['code'], -1)
+
+    def test_only_get_allowed(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.authorization(self.viewer))
+        response = self.client.post('/api/async/blog/', {'title': 'No', 'content': 'No'})
+        self.assertEqual(response.json()['message'], 'No other Methods Allowed')
+
+    async def test_served_by_the_async_handler(self):
+        authorization = await sync_to_async(self.authorization)(self.viewer)
+        response = await self.async_client.get('/api/async/blog/', headers={'Authorization': authorization})
+        self.assertEqual(len(response.json()['data']), 3)
+        # Queries run in sync_to_async threads are in the request timing too
+        self.assertNotIn('desc="0 queries"', response['Server-Timing'])
@@ -0,0 +1,80 @@
+import json
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel
+
+User = get_user_model()
+
+
+@override_settings(BLOG_EXPORT_BATCH_SIZE=2)
+class BlogExportTest(APITestCase):
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.viewer = User.objects.create_user(username='viewer', password='testpass456')
+        self.other = User.objects.create_user(username='other', password='testpass789')
+        User_Data.objects.create(user=self.writer, role='writer')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+        User_Data.objects.create(user=self.other, role='admin')
+        for i in range(5):
+            blog = BlogModel.objects.create(user=self.writer, title=f'Blog {i}', content='Content')
+            BlogPostCommentModel.objects.create(user=self.viewer, blog=blog, comment=f'Comment {i}')
+        self.url = '/api/blog/export/'
+
+    def export(self, **params):
+        response = self.client.get(self.url, params)
+        return response, b''.join(response.streaming_content)
+
+    def test_json_array_export(self):
+        self.client.force_authenticate(user=self.viewer)
+        response, body = self.export()
+        self.assertEqual(response['Content-Type'], 'application/json')
+        blogs = json.loads(body)
+        self.assertEqual([blog['title'] for blog in blogs], [f'Blog {i}' for i in range(5)])
+        self.assertEqual(blogs[0]['comments'][0]['comment'], 'Comment 0')
+        self.assertEqual(blogs[0]['author'], 'writer')
+        self.assertFalse(blogs[0]['is_subscribed'])
+
+    def test_ndjson_export(self):
+        self.client.force_authenticate(user=self.writer)
+        response, body = self.export(output='ndjson')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = body.decode().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(json.loads(lines[4])['title'], 'Blog 4')
+
+    def test_export_is_sent_batch_by_batch(self):
+        self.client.force_authenticate(user=self.viewer)
+        response = self.client.get(self.url, {'output': 'ndjson'})
+        chunks = list(response.streaming_content)
+        # 5 blogs in batches of 2
+        self.assertEqual([chunk.count(b'\n') for chunk in chunks], [2, 2, 1])
+
+    def test_queries_grow_with_batches_not_blogs(self):
+        self.client.force_authenticate(user=self.viewer)
+        with CaptureQueriesContext(connection) as five_blogs:
+            self.export()
+        for i in range(4):
+            BlogModel.objects.create(user=self.writer, title=f'More {i}', content='Content')
+        with override_settings(BLOG_EXPORT_BATCH_SIZE=100):
+            with CaptureQueriesContext(connection) as nine_blogs:
+                self.export()
+        self.assertLessEqual(len(nine_blogs), len(five_blogs))
+
+    def test_empty_export_is_valid_json(self):
+        BlogModel.objects.all().delete()
+        self.client.force_authenticate(user=self.viewer)
+        self.assertEqual(json.loads(self.export()[1]), [])
+
+    def test_other_roles_cannot_export(self):
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()['message'], 'No other Roles are Allowed')
+
+    def test_unknown_output_rejected(self):
+        self.client.force_authenticate(user=self.viewer)
+        response = self.client.get(self.url, {'output': 'xml'})
+        self.assertEqual(response.json()['message'], 'Output must be json or ndjson')
@@ -1,8 +1,11 @@
 from rest_framework.test import APITestCase, APIClient
+from django.test import override_settings
 from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.tokens import AccessToken
 from quickstart.models.blog_models import BlogModel
+from quickstart.models.subscription_models import SubscribeTable
 from quickstart.models.authentication_models import User_Data
+from quickstart.utils.subscription_counters import rebuild_subscription_counters
 
 User = get_user_model()
 
@@ -64,4 +67,55 @@ class BlogPostTest(APITestCase):
         self.authenticate(self.writer)
         response = self.client.put(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json()['message'], 'No other Methods Allowed')
\ No newline at end of file
+        self.assertEqual(response.json()['message'], 'No other Methods Allowed')
+
+    def test_blogs_are_paginated_with_cursor(self):
+        for i in range(5):
+            BlogModel.objects.create(user=self.writer, title=f'Blog {i}', content='Content')
+        self.authenticate(self.viewer)
+
+        response = self.client.get(self.url, {'page_size': 2})
+        first_page = response.json()
+        self.assertEqual([blog['title'] for blog in first_page['data']], ['Blog 0', 'Blog 1'])
+        self.assertIsNotNone(first_page['next'])
+
+        seen = [blog['title'] for blog in first_page['data']]
+        cursor = first_page['next']
+        while cursor:
+            page = self.client.get(self.url, {'page_size': 2, 'cursor': cursor}).json()
+            seen.extend(blog['title'] for blog in page['data'])
+            cursor = page['next']
+        self.assertEqual(seen, [f'Blog {i}' for i in range(5)])
+
+    @override_settings(BLOG_MAX_PAGE_SIZE=3)
+    def test_page_size_is_capped(self):
+        for i in range(5):
+            BlogModel.objects.create(user=self.writer, title=f'Blog {i}', content='Content')
+        self.authenticate(self.viewer)
+        response = self.client.get(self.url, {'page_size': 1000})
+        self.assertEqual(len(response.json()['data']), 3)
+
+    def test_invalid_cursor_rejected(self):
+        self.authenticate(self.viewer)
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.json()['message'], 'Invalid cursor')
+
+    def test_subscription_fields_resolved_for_whole_page(self):
+        other_writer = User.objects.create_user(username='other_writer', password='testpass789')
+        User_Data.objects.create(user=other_writer, role='writer')
+        BlogModel.objects.create(user=self.writer, title='Writer Blog', content='Content')
+        BlogModel.objects.create(user=other_writer, title='Other Blog', content='Content')
+        SubscribeTable.objects.create(subscriber=self.viewer, author=self.writer)
+        SubscribeTable.objects.create(subscriber=self.writer, author=self.writer, is_active=False)
+        rebuild_subscription_counters()
+
+        self.authenticate(self.viewer)
+        blogs = {blog['title']: blog for blog in self.client.get(self.url).json()['data']}
+        self.assertTrue(blogs['Writer Blog']['is_subscribed'])
+        self.assertEqual(blogs['Writer Blog']['author_subscribers_count'], 1)
+        self.assertFalse(blogs['Other Blog']['is_subscribed'])
+        self.assertEqual(blogs['Other Blog']['author_subscribers_count'], 0)
+
+        self.authenticate(self.writer)
+        blogs = {blog['title']: blog for blog in self.client.get(self.url).json()['data']}
+        self.assertIsNone(blogs['Writer Blog']['is_subscribed'])
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+from django.conf import settings
+from django.test import SimpleTestCase
+from tutorial.celery import app
+from quickstart.tasks import (
+    fan_out_blog_notification, ingest_activity_logs, refresh_subscription_counters, send_blog_notification_email
+)
+
+
+class CeleryRoutingTest(SimpleTestCase):
+    def queue_of(self, task):
+        return app.amqp.router.route({}, task.name)['queue'].name
+
+    def test_tasks_have_their_own_queues(self):
+        self.assertEqual(self.queue_of(fan_out_blog_notification), 'notifications')
+        self.assertEqual(self.queue_of(send_blog_notification_email), 'notifications')
+        self.assertEqual(self.queue_of(ingest_activity_logs), 'activity')
+        self.assertEqual(self.queue_of(refresh_subscription_counters), 'maintenance')
+
+    def test_unrouted_tasks_use_the_default_queue(self):
+        self.assertEqual(app.amqp.router.route({}, 'tutorial.celery.debug_task')['queue'].name, 'celery')
+
+    def test_fire_and_forget_tasks_store_no_result(self):
+        for task in (fan_out_blog_notification, send_blog_notification_email, ingest_activity_logs,
+                     refresh_subscription_counters):
+            self.assertTrue(task.ignore_result, task.name)
+
+    def test_worker_profile_is_applied(self):
+        profile = settings.CELERY_WORKER_PROFILES[settings.CELERY_WORKER_PROFILE]
+        self.assertEqual(app.conf.worker_pool, profile['pool'])
+        self.assertEqual(app.conf.task_acks_late, profile['acks_late'])
+        self.assertEqual(refresh_subscription_counters.acks_late, profile['acks_late'])
+
+    def test_non_idempotent_tasks_are_not_redelivered(self):
+        # A redelivered chunk would mail its recipients twice, a redelivered batch would insert its rows twice
+        self.assertFalse(fan_out_blog_notification.acks_late)
+        self.assertFalse(send_blog_notification_email.acks_late)
+        self.assertFalse(ingest_activity_logs.acks_late)
+
+    def test_unknown_worker_profile_is_rejected(self):
+        env = dict(os.environ, CELERY_WORKER_PROFILE='prefrok', EMAIL_HOST_USER='x', EMAIL_HOST_PASSWORD='y')
+        result = subprocess.run(
+            [sys.executable, '-c', 'import tutorial.settings'],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True
+        )
+        self.assertIn('ImproperlyConfigured: CELERY_WORKER_PROFILE must be one of threads, prefork, solo', result.stderr)
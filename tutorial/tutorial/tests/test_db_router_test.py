@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel
+from quickstart.utils.db_router import PRIMARY, ReadReplicaRouter, _read_alias, is_pinned_to_primary
+
+
+@skipUnless('replica' in settings.DATABASES, 'needs the replica alias, defined by the test settings')
+@override_settings(READ_REPLICA_ALIAS='replica', READ_REPLICA_PIN_SECONDS=30)
+class ReadReplicaRouterTest(APITestCase):
+    """
+    Two SQLite databases: 'default' is the primary, 'replica' only gets what replicate() copies over,
+    so anything not replicated yet stands for replication lag.
+    """
+
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        cache.clear()
+        self.writer = self.make_user('writer', 'writer')
+        self.viewer = self.make_user('viewer', 'viewer')
+        self.blog = BlogModel.objects.create(user=self.writer, title='Replicated', content='Content')
+        self.replicate(self.blog)
+
+    def make_user(self, username, role):
+        user = User.objects.create_user(username=username, password='testpass123')
+        profile = User_Data.objects.create(user=user, role=role)
+        self.replicate(user, profile)
+        return user
+
+    def replicate(self, *objects):
+        for obj in objects:
+            obj.save(using='replica')
+            # The test keeps using the instance as the primary's
+            obj._state.db = 'default'
+
+    def titles(self, user):
+        self.client.force_authenticate(user=user)
+        response = self.client.get('/api/blog/')
+        self.client.force_authenticate(user=None)
+        return [blog['title'] for blog in response.json()['data']]
+
+    def create_blog(self, user, title):
+        self.client.force_authenticate(user=user)
+        self.client.post('/api/blog/', {'title': title, 'content': 'Content'})
+        self.client.force_authenticate(user=None)
+        return BlogModel.objects.get(title=title)
+
+    def test_reads_come_from_the_replica(self):
+        # Written to the primary only: the replica lags behind
+        lagging = BlogModel.objects.create(user=self.writer, title='Lagging', content='Content')
+        self.assertEqual(self.titles(self.viewer), ['Replicated'])
+
+        self.replicate(lagging)
+        self.assertEqual(self.titles(self.viewer), ['Replicated', 'Lagging'])
+
+    def test_writes_go_to_the_primary(self):
+        blog = self.create_blog(self.writer, 'New')
+        self.assertFalse(BlogModel.objects.using('replica').filter(pk=blog.pk).exists())
+
+        token = _read_alias.set('replica')
+        try:
+            self.assertEqual(ReadReplicaRouter().db_for_write(BlogModel), PRIMARY)
+        finally:
+            _read_alias.reset(token)
+
+    def test_writer_reads_their_own_write(self):
+        self.create_blog(self.writer, 'Fresh')
+        self.assertTrue(is_pinned_to_primary(self.writer.id))
+
+        # Pinned to the primary: sees it though the replica does not have it yet
+        self.assertEqual(self.titles(self.writer), ['Replicated', 'Fresh'])
+        # Everybody else still reads the lagging replica
+        self.assertEqual(self.titles(self.viewer), ['Replicated'])
+
+    def comments(self, user):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(f'/api/blog/{self.blog.id}/')
+        self.client.force_authenticate(user=None)
+        return [comment['comment'] for comment in response.json()['data']['comments']]
+
+    def test_pinned_reader_skips_payloads_cached_from_the_replica(self):
+        self.client.force_authenticate(user=self.viewer)
+        self.client.post('/api/comment/', {'blog': self.blog.id, 'comment': 'First!'})
+        self.client.force_authenticate(user=None)
+
+        # Built from the lagging replica and cached under the blog's new version
+        self.assertEqual(self.comments(self.writer), [])
+        # The commenter is pinned: not served that entry
+        self.assertEqual(self.comments(self.viewer), ['First!'])
+
+    def test_pin_expires(self):
+        self.create_blog(self.writer, 'Fresh')
+        cache.clear()  # the pin window is over
+        self.assertEqual(self.titles(self.writer), ['Replicated'])
+
+    def test_reads_alone_do_not_pin(self):
+        self.titles(self.viewer)
+        self.assertFalse(is_pinned_to_primary(self.viewer.id))
+
+    @override_settings(READ_REPLICA_ALIAS='')
+    def test_without_replica_everything_reads_the_primary(self):
+        BlogModel.objects.create(user=self.writer, title='Primary only', content='Content')
+        self.assertEqual(self.titles(self.viewer), ['Replicated', 'Primary only'])
+
+
+class ReplicaSettingsTest(SimpleTestCase):
+    def test_replica_needs_a_shared_pin_cache(self):
+        env = dict(os.environ, DATABASE_REPLICA_NAME='replica.sqlite3', EMAIL_HOST_USER='x', EMAIL_HOST_PASSWORD='y',
+                   CACHE_BACKEND='django.core.cache.backends.locmem.LocMemCache')
+        result = subprocess.run(
+            [sys.executable, '-c', 'import tutorial.settings'],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True
+        )
+        self.assertIn('ImproperlyConfigured: DATABASE_REPLICA_NAME needs a cache shared by the workers', result.stderr)
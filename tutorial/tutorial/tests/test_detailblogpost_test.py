@@ -1,7 +1,11 @@
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
-from quickstart.models.blog_models import BlogModel
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel, ReplyCommentModel
+from quickstart.models.reaction_models import CommentReactionModel, ReplyReactionModel
 from quickstart.models.authentication_models import User_Data
+from quickstart.utils.blog_cache import cache_stats
 
 User = get_user_model()
 
@@ -107,4 +111,72 @@ class DetailBlogPostTest(APITestCase):
         response = self.client.delete(f'{self.url}{self.blog1.id}/')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()['message'], 'You are Viewer you are not allowed to change Delete blog')
-        self.assertTrue(BlogModel.objects.filter(id=self.blog1.id).exists())
\ No newline at end of file
+        self.assertTrue(BlogModel.objects.filter(id=self.blog1.id).exists())
+
+    def _add_comments(self, count):
+        for i in range(count):
+            comment = BlogPostCommentModel.objects.create(user=self.viewer, blog=self.blog1, comment=f'Comment {i}')
+            ReplyCommentModel.objects.create(user=self.writer1, comment=comment, reply=f'Reply {i}')
+            CommentReactionModel.objects.create(user=self.writer2, comment=comment, reaction='like')
+
+    def test_comment_tree_counts_reactions(self):
+        self._add_comments(1)
+        reply = ReplyCommentModel.objects.get()
+        ReplyReactionModel.objects.create(user=self.viewer, reply=reply, reaction='dislike')
+
+        self.authenticate(self.viewer)
+        data = self.client.get(f'{self.url}{self.blog1.id}/').json()['data']
+        self.assertEqual(len(data['comments']), 1)
+        comment = data['comments'][0]
+        self.assertEqual(comment['comment'], 'Comment 0')
+        self.assertEqual(comment['user'], 'viewer')
+        self.assertEqual((comment['likes'], comment['dislikes']), (1, 0))
+        self.assertEqual(comment['replies'][0]['reply'], 'Reply 0')
+        self.assertEqual((comment['replies'][0]['likes'], comment['replies'][0]['dislikes']), (0, 1))
+
+    def test_comment_tree_query_count_does_not_grow_with_comments(self):
+        self.authenticate(self.viewer)
+        self._add_comments(1)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(f'{self.url}{self.blog1.id}/')
+        self._add_comments(10)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(f'{self.url}{self.blog1.id}/')
+        self.assertEqual(len(response.json()['data']['comments']), 11)
+        self.assertEqual(len(few), len(many))
+
+    def test_second_fetch_is_served_from_cache(self):
+        self.authenticate(self.viewer)
+        self._add_comments(3)
+        self.client.get(f'{self.url}{self.blog1.id}/')
+        stats = cache_stats()
+        with CaptureQueriesContext(connection) as cached:
+            response = self.client.get(f'{self.url}{self.blog1.id}/')
+        self.assertEqual(len(response.json()['data']['comments']), 3)
+        self.assertEqual(cache_stats()['hits'], stats['hits'] + 1)
+        self.assertFalse([q for q in cached if 'quickstart_blogpostcommentmodel' in q['sql']])
+
+    def test_new_comment_invalidates_cached_blog(self):
+        self.authenticate(self.viewer)
+        self.client.get(f'{self.url}{self.blog1.id}/')
+        self._add_comments(1)
+        data = self.client.get(f'{self.url}{self.blog1.id}/').json()['data']
+        self.assertEqual(len(data['comments']), 1)
+
+    def test_reaction_changes_invalidate_cached_blog(self):
+        self._add_comments(1)
+        self.authenticate(self.viewer)
+        self.client.get(f'{self.url}{self.blog1.id}/')
+
+        CommentReactionModel.objects.get().delete()
+        comment = self.client.get(f'{self.url}{self.blog1.id}/').json()['data']['comments'][0]
+        self.assertEqual(comment['likes'], 0)
+
+        self.client.post(f'/api/blog/like/{self.blog1.id}/')
+        self.assertEqual(self.client.get(f'{self.url}{self.blog1.id}/').json()['data']['likes'], 1)
+
+    def test_user_fields_are_not_shared_through_cache(self):
+        self.authenticate(self.writer1)
+        self.assertIsNone(self.client.get(f'{self.url}{self.blog1.id}/').json()['data']['is_subscribed'])
+        self.authenticate(self.viewer)
+        self.assertFalse(self.client.get(f'{self.url}{self.blog1.id}/').json()['data']['is_subscribed'])
@@ -0,0 +1,131 @@
+import smtplib
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel
+from quickstart.models.subscription_models import SubscribeTable
+from quickstart.tasks.email_tasks import (
+    fan_out_blog_notification, iter_subscriber_email_chunks, send_blog_notification_email
+)
+
+User = get_user_model()
+
+
+class CountingBackend(EmailBackend):
+    """locmem backend that counts connections and drops the first send of the run"""
+    opened = 0
+    dropped = False
+
+    def open(self):
+        CountingBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        if not CountingBackend.dropped:
+            CountingBackend.dropped = True
+            raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        return super().send_messages(messages)
+
+
+class RefusingBackend(CountingBackend):
+    """Counting backend whose server refuses one recipient"""
+
+    def send_messages(self, messages):
+        if messages[0].to == ['refused@example.com']:
+            raise smtplib.SMTPRecipientsRefused({'refused@example.com': (550, b'No such user')})
+        return super().send_messages(messages)
+
+
+@override_settings(EMAIL_BATCH_SIZE=2)
+class BlogNotificationEmailTest(SimpleTestCase):
+    def setUp(self):
+        CountingBackend.opened = 0
+        CountingBackend.dropped = True
+
+    def test_every_subscriber_gets_one_message(self):
+        emails = [f'reader{i}@example.com' for i in range(5)]
+        result = send_blog_notification_email.apply(args=('writer', 'Title', emails)).get()
+
+        self.assertEqual(result['successful_emails'], 5)
+        self.assertEqual(result['failed_emails'], 0)
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), sorted(emails))
+        self.assertEqual(mail.outbox[0].subject, 'New Blog Post by writer')
+
+    @override_settings(EMAIL_BACKEND='tests.test_email_tasks_test.CountingBackend')
+    def test_one_connection_per_chunk(self):
+        emails = [f'reader{i}@example.com' for i in range(5)]
+        send_blog_notification_email.apply(args=('writer', 'Title', emails)).get()
+        self.assertEqual(CountingBackend.opened, 3)
+
+    @override_settings(EMAIL_BACKEND='tests.test_email_tasks_test.CountingBackend')
+    def test_reconnects_when_server_drops_connection(self):
+        CountingBackend.dropped = False
+        result = send_blog_notification_email.apply(args=('writer', 'Title', ['a@example.com', 'b@example.com'])).get()
+        self.assertEqual(result['successful_emails'], 2)
+        self.assertEqual(CountingBackend.opened, 2)
+        self.assertEqual(len(mail.outbox), 2)
+
+    @override_settings(EMAIL_BACKEND='tests.test_email_tasks_test.RefusingBackend')
+    def test_refused_recipient_fails_without_reconnecting(self):
+        result = send_blog_notification_email.apply(args=('writer', 'Title', ['refused@example.com', 'b@example.com'])).get()
+        self.assertEqual(result['successful_emails'], 1)
+        self.assertEqual(result['details']['failed'][0]['email'], 'refused@example.com')
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+
+@override_settings(NOTIFICATION_FANOUT_CHUNK_SIZE=2)
+class BlogNotificationFanOutTest(APITestCase):
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.blog = BlogModel.objects.create(user=self.writer, title='Fresh Post', content='Content')
+        for i in range(5):
+            reader = User.objects.create_user(username=f'reader{i}', email=f'reader{i}@example.com')
+            SubscribeTable.objects.create(subscriber=reader, author=self.writer)
+        no_email = User.objects.create_user(username='no_email')
+        SubscribeTable.objects.create(subscriber=no_email, author=self.writer)
+        gone = User.objects.create_user(username='gone', email='gone@example.com')
+        SubscribeTable.objects.create(subscriber=gone, author=self.writer, is_active=False)
+
+    def test_streams_active_subscribers_in_chunks(self):
+        chunks = list(iter_subscriber_email_chunks(self.writer.id, 2))
+        self.assertEqual([len(chunk) for _, chunk in chunks], [2, 2, 1])
+
+        # Resuming after the first chunk's last subscription
+        resumed = list(iter_subscriber_email_chunks(self.writer.id, 2, after_id=chunks[0][0]))
+        self.assertEqual(resumed, chunks[1:])
+
+    def dispatched(self, delay, failed=()):
+        return [call.args for i, call in enumerate(delay.call_args_list) if i not in failed]
+
+    def test_fan_out_notifies_every_active_subscriber_once(self):
+        with patch.object(send_blog_notification_email, 'delay') as delay:
+            fan_out_blog_notification.apply(args=(self.writer.id, self.blog.id)).get()
+        subtasks = self.dispatched(delay)
+        self.assertEqual(len(subtasks), 3)
+
+        # Run the delivery subtasks that would have been sent to the workers
+        for args in subtasks:
+            send_blog_notification_email.apply(args=args).get()
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), [f'reader{i}@example.com' for i in range(5)])
+        self.assertIn('Fresh Post', mail.outbox[0].body)
+
+    def test_retry_resumes_after_the_dispatched_chunks(self):
+        broker_down = [None, ConnectionError('broker'), None, None]
+        with patch.object(send_blog_notification_email, 'delay', side_effect=broker_down) as delay:
+            fan_out_blog_notification.apply(args=(self.writer.id, self.blog.id))
+        recipients = [email for _, _, chunk in self.dispatched(delay, failed={1}) for email in chunk]
+        self.assertEqual(recipients, [f'reader{i}@example.com' for i in range(5)])
+
+    def test_blog_post_request_only_enqueues_ids(self):
+        User_Data.objects.create(user=self.writer, role='writer')
+        self.client.force_authenticate(user=self.writer)
+        with patch.object(fan_out_blog_notification, 'delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post('/api/blog/', {'title': 'Another', 'content': 'Content'})
+        blog = BlogModel.objects.get(title='Another')
+        delay.assert_called_once_with(self.writer.id, blog.id)
@@ -0,0 +1,80 @@
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.db.models import Sum
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.signals_model import ErrorLog
+from quickstart.utils.error_log_sink import ErrorSampler, error_log_sink
+
+User = get_user_model()
+
+ROW = {'user_id': None, 'path': '/api/blog/', 'method': 'PUT', 'message': 'Nope', 'status_code': 200}
+
+
+@override_settings(ERROR_LOG_SAMPLE_BURST=2, ERROR_LOG_SAMPLE_WINDOW=60)
+class ErrorSamplerTest(TestCase):
+    def test_identical_errors_past_the_burst_are_counted(self):
+        sampler = ErrorSampler()
+        admitted = [sampler.admit(ROW, now=0) for _ in range(5)]
+        self.assertEqual(admitted, [True, True, False, False, False])
+
+        # Window still open, nothing to collect yet
+        self.assertEqual(sampler.collect(now=10), [])
+        summary, = sampler.collect(final=True)
+        self.assertEqual(summary['occurrences'], 3)
+        self.assertEqual(summary['message'], 'Nope')
+
+    def test_window_rollover_releases_summary(self):
+        sampler = ErrorSampler()
+        for _ in range(3):
+            sampler.admit(ROW, now=0)
+        self.assertTrue(sampler.admit(ROW, now=61))
+        summary, = sampler.collect(now=62)
+        self.assertEqual(summary['occurrences'], 1)
+
+    def test_different_errors_are_sampled_separately(self):
+        sampler = ErrorSampler()
+        for _ in range(2):
+            sampler.admit(ROW, now=0)
+        self.assertTrue(sampler.admit(dict(ROW, message='Other'), now=0))
+
+
+@override_settings(ERROR_LOG_MODE='thread', ERROR_LOG_SAMPLE_BURST=2)
+@patch.object(error_log_sink.writer, '_ensure_thread')
+class ErrorLogSinkTest(APITestCase):
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        User_Data.objects.create(user=self.writer, role='writer')
+        error_log_sink.flush(final=True)
+        ErrorLog.objects.all().delete()
+
+    def test_rejected_requests_are_buffered_and_totals_kept(self, _):
+        self.client.force_authenticate(user=self.writer)
+        for _ in range(5):
+            self.client.put('/api/blog/')
+        self.assertEqual(ErrorLog.objects.count(), 0)
+
+        error_log_sink.flush(final=True)
+        self.assertEqual(ErrorLog.objects.count(), 3)
+        self.assertEqual(ErrorLog.objects.aggregate(total=Sum('occurrences'))['total'], 5)
+        self.assertEqual(set(ErrorLog.objects.values_list('user', flat=True)), {self.writer.id})
+
+
+@override_settings(ERROR_LOG_MODE='sync', ERROR_LOG_SAMPLE_BURST=1, ERROR_LOG_SAMPLE_WINDOW=60)
+class SyncErrorLogSinkTest(TestCase):
+    def setUp(self):
+        error_log_sink.flush(final=True)
+        ErrorLog.objects.all().delete()
+
+    @patch('quickstart.utils.error_log_sink.time.monotonic')
+    def test_summaries_are_written_once_the_window_closes(self, monotonic):
+        monotonic.return_value = 0
+        for _ in range(3):
+            error_log_sink.record(dict(ROW))
+        self.assertEqual(ErrorLog.objects.count(), 1)
+
+        monotonic.return_value = 61
+        error_log_sink.record(dict(ROW))
+        self.assertEqual(ErrorLog.objects.count(), 3)
+        self.assertEqual(ErrorLog.objects.aggregate(total=Sum('occurrences'))['total'], 4)
@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from quickstart.models.authentication_models import User_Data
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTest(APITestCase):
+    def setUp(self):
+        self.viewer = User.objects.create_user(username='viewer', password='testpass123')
+        self.profile = User_Data.objects.create(user=self.viewer, role='viewer')
+        token = RefreshToken.for_user(self.viewer).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = '/api/blog/'
+
+    def user_queries(self, queries):
+        return [q['sql'] for q in queries if 'FROM "auth_user"' in q['sql'] or 'FROM "quickstart_user_data"' in q['sql']]
+
+    def test_warm_request_does_no_user_queries(self):
+        with CaptureQueriesContext(connection) as cold:
+            response = self.client.get(self.url)
+        self.assertEqual(response.json()['message'], 'Blog Post Successfully Fetched')
+        # User and profile are loaded together
+        self.assertEqual(len(self.user_queries(cold)), 1)
+
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(self.url)
+        self.assertEqual(response.json()['message'], 'Blog Post Successfully Fetched')
+        self.assertEqual(self.user_queries(warm), [])
+
+    def test_profile_change_evicts_cached_user(self):
+        self.client.get(self.url)
+        self.profile.role = 'admin'
+        self.profile.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()['message'], 'No other Roles are Allowed')
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get(self.url)
+        self.viewer.is_active = False
+        self.viewer.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()['message'], 'Authentication credentials are missing or invalid.')
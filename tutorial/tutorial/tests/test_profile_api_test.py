@@ -0,0 +1,77 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel
+from quickstart.models.subscription_models import SubscribeTable
+from quickstart.utils.subscription_counters import rebuild_subscription_counters
+
+User = get_user_model()
+
+
+class ProfileAPIViewTest(APITestCase):
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.viewer = User.objects.create_user(username='viewer', password='testpass456', email='viewer@example.com')
+        User_Data.objects.create(user=self.writer, role='writer')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+        self.url = '/profile_api/profile/'
+
+    def get_profile(self):
+        # Fresh user object, so the profile is not already cached on it
+        self.client.force_authenticate(user=User.objects.get(pk=self.writer.pk))
+        return self.client.get(self.url).json()
+
+    def test_writer_stats(self):
+        first = BlogModel.objects.create(user=self.writer, title='First', content='Content', likes=3, dislikes=1)
+        BlogModel.objects.create(user=self.writer, title='Second', content='Content', likes=2)
+        BlogPostCommentModel.objects.create(user=self.viewer, blog=first, comment='One')
+        BlogPostCommentModel.objects.create(user=self.viewer, blog=first, comment='Two')
+        SubscribeTable.objects.create(subscriber=self.viewer, author=self.writer, is_active=True)
+        rebuild_subscription_counters()
+
+        data = self.get_profile()
+        self.assertEqual(data['blog_details']['blogs'], [
+            {'title': 'First', 'likes': 3, 'dislikes': 1, 'comments_count': 2},
+            {'title': 'Second', 'likes': 2, 'dislikes': 0, 'comments_count': 0},
+        ])
+        self.assertEqual(data['blog_details']['total_blog_likes'], 5)
+        self.assertEqual(data['blog_details']['total_blog_dislikes'], 1)
+        self.assertEqual(data['blog_details']['total_comments_received'], 2)
+        self.assertEqual(data['user']['total_blogs_count'], 2)
+        self.assertEqual(data['user']['total_subscribers_count'], 1)
+        self.assertEqual(data['user']['subscribers_emails'], ['viewer@example.com'])
+
+    def test_blogs_are_listed_oldest_first(self):
+        titles = ['Third', 'First', 'Fourth', 'Second']
+        blogs = [BlogModel.objects.create(user=self.writer, title=title, content='Content') for title in titles]
+        start = timezone.now()
+        for blog in blogs:
+            # Creation order differs from the id order
+            position = ['First', 'Second', 'Third', 'Fourth'].index(blog.title)
+            BlogModel.objects.filter(pk=blog.pk).update(created=start + timedelta(minutes=position))
+        BlogPostCommentModel.objects.create(user=self.viewer, blog=blogs[0], comment='One')
+
+        data = self.get_profile()
+        self.assertEqual([blog['title'] for blog in data['blog_details']['blogs']], ['First', 'Second', 'Third', 'Fourth'])
+
+    def test_writer_without_blogs(self):
+        data = self.get_profile()
+        self.assertEqual(data['user']['total_blogs_count'], 0)
+        self.assertEqual(data['blog_details']['blogs'], "No Blogs You haven't Posted yet")
+
+    def test_query_count_is_constant_for_1000_posts(self):
+        blogs = BlogModel.objects.bulk_create(
+            BlogModel(user=self.writer, title=f'Blog {i}', content='Content', likes=i % 5) for i in range(1000)
+        )
+        BlogPostCommentModel.objects.bulk_create(
+            BlogPostCommentModel(user=self.viewer, blog=blog, comment='Comment') for blog in blogs[::10]
+        )
+        self.client.force_authenticate(user=User.objects.get(pk=self.writer.pk))
+        # profile, blog totals, subscription counters, per-blog rows, subscriber emails
+        with self.assertNumQueries(5):
+            data = self.client.get(self.url).json()
+        self.assertEqual(len(data['blog_details']['blogs']), 1000)
+        self.assertEqual(data['blog_details']['total_comments_received'], 100)
+        self.assertEqual(data['blog_details']['total_blog_likes'], 2000)
@@ -0,0 +1,202 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel, ReplyCommentModel
+from quickstart.models.reaction_models import BlogReactionModel, CommentReactionModel, ReplyReactionModel
+from quickstart.models.subscription_models import SubscribeTable
+
+User = get_user_model()
+
+# Data sizes every endpoint is measured at: its query count must be the same at each of them
+SIZES = (1, 4, 12)
+
+# Declared query budget of every endpoint (cold cache, request already authenticated).
+# Raising one of these must be a deliberate change, not something a refactor slips in.
+BUDGETS = {
+    'register': 4,
+    'login': 3,
+    'blog-list': 6,
+    'blog-create': 4,
+    'blog-export': 6,
+    'blog-detail': 6,
+    'blog-update': 5,
+    'blog-delete': 17,
+    'blog-like': 11,
+    'comment-create': 6,
+    'comment-like': 12,
+    'reply-create': 5,
+    'reply-like': 11,
+    'subscribe': 7,
+    'unsubscribe': 8,
+    'profile': 5,
+}
+
+
+# Seeding creates a few hundred users, the default hasher would make that take minutes
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class QueryBudgetTest(APITestCase):
+    """
+    Every endpoint of quickstart/urls.py and profile_api/urls.py is called at growing data sizes:
+    the number of queries must not grow with the data (no N+1) and must stay within its budget.
+    """
+
+    def setUp(self):
+        self.writer = self.make_user('writer', 'writer')
+        self.viewer = self.make_user('viewer', 'viewer')
+        self.blog = BlogModel.objects.create(user=self.writer, title='Main Blog', content='Content')
+        self.comment = BlogPostCommentModel.objects.create(user=self.viewer, blog=self.blog, comment='Main comment')
+        self.reply = ReplyCommentModel.objects.create(user=self.writer, comment=self.comment, reply='Main reply')
+        self.users = 0
+
+    def make_user(self, username, role, password='testpass123'):
+        user = User.objects.create_user(username=username, password=password, email=f'{username}@example.com')
+        User_Data.objects.create(user=user, role=role)
+        return user
+
+    def new_viewer(self):
+        self.users += 1
+        return self.make_user(f'reader{self.users}', 'viewer')
+
+    def count_queries(self, user, method, url, data=None):
+        cache.clear()
+        # Fresh instance, so nothing (e.g. the profile) is already cached on it
+        self.client.force_authenticate(user=User.objects.get(pk=user.pk) if user else None)
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data)
+            if response.streaming:
+                b''.join(response.streaming_content)
+        self.client.force_authenticate(user=None)
+        self.assertLess(response.status_code, 500)
+        return len(queries)
+
+    def assertQueryBudget(self, name, grow, request):
+        """grow(n) brings the data to size n, request() performs the call and returns its query count"""
+        counts = []
+        for size in SIZES:
+            self.size = size
+            grow(size)
+            counts.append(request())
+        self.assertEqual(len(set(counts)), 1, f'{name}: queries grow with the data {dict(zip(SIZES, counts))}')
+        self.assertLessEqual(counts[0], BUDGETS[name], f'{name}: {counts[0]} queries, budget {BUDGETS[name]}')
+
+    # --- data growers ---
+
+    def grow_blogs(self, size):
+        """size blogs by the writer, each with size comments carrying a reply and reactions"""
+        while BlogModel.objects.count() < size:
+            BlogModel.objects.create(user=self.writer, title='Blog', content='Content')
+        for blog in BlogModel.objects.all():
+            self.grow_comments(size, blog)
+
+    def grow_comments(self, size, blog=None):
+        blog = blog or self.blog
+        while blog.comments.count() < size:
+            commenter = self.new_viewer()
+            comment = BlogPostCommentModel.objects.create(user=commenter, blog=blog, comment='Comment')
+            reply = ReplyCommentModel.objects.create(user=self.writer, comment=comment, reply='Reply')
+            CommentReactionModel.objects.create(user=self.writer, comment=comment, reaction='like')
+            ReplyReactionModel.objects.create(user=commenter, reply=reply, reaction='dislike')
+            BlogReactionModel.objects.create(user=commenter, blog=blog, reaction='like')
+
+    def grow_subscribers(self, size):
+        while SubscribeTable.objects.filter(author=self.writer, is_active=True).count() < size:
+            self.client.force_authenticate(user=self.new_viewer())
+            self.client.post(f'/api/subscribe/{self.writer.username}/')
+        self.client.force_authenticate(user=None)
+
+    # --- quickstart/urls.py ---
+
+    def test_register(self):
+        def register():
+            self.users += 1
+            return self.count_queries(None, 'post', '/api/register/', {
+                'username': f'new{self.users}', 'password': 'TestPass123!', 'email': 'new@example.com',
+                'role': 'viewer', 'mobile_number': '123', 'first_name': 'New', 'last_name': 'User'
+            })
+        self.assertQueryBudget('register', self.grow_blogs, register)
+
+    def test_login(self):
+        self.assertQueryBudget('login', self.grow_subscribers, lambda: self.count_queries(
+            None, 'post', '/api/login/', {'username': 'viewer', 'password': 'testpass123'}
+        ))
+
+    def test_blog_list(self):
+        self.assertQueryBudget('blog-list', self.grow_blogs, lambda: self.count_queries(
+            self.viewer, 'get', '/api/blog/'
+        ))
+
+    def test_blog_create(self):
+        self.assertQueryBudget('blog-create', self.grow_subscribers, lambda: self.count_queries(
+            self.writer, 'post', '/api/blog/', {'title': 'New', 'content': 'Content'}
+        ))
+
+    def test_blog_export(self):
+        self.assertQueryBudget('blog-export', self.grow_blogs, lambda: self.count_queries(
+            self.viewer, 'get', '/api/blog/export/'
+        ))
+
+    def test_blog_detail(self):
+        self.assertQueryBudget('blog-detail', self.grow_comments, lambda: self.count_queries(
+            self.viewer, 'get', f'/api/blog/{self.blog.id}/'
+        ))
+
+    def test_blog_update(self):
+        self.assertQueryBudget('blog-update', self.grow_comments, lambda: self.count_queries(
+            self.writer, 'patch', f'/api/blog/{self.blog.id}/', {'title': 'Edited'}
+        ))
+
+    def test_blog_delete(self):
+        def delete():
+            # A blog with as many comments (replies, reactions) as the current size
+            blog = BlogModel.objects.create(user=self.writer, title='To delete', content='Content')
+            self.grow_comments(self.size, blog)
+            return self.count_queries(self.writer, 'delete', f'/api/blog/{blog.id}/')
+        self.assertQueryBudget('blog-delete', lambda size: None, delete)
+
+    def test_blog_like(self):
+        self.assertQueryBudget('blog-like', self.grow_comments, lambda: self.count_queries(
+            self.new_viewer(), 'post', f'/api/blog/like/{self.blog.id}/'
+        ))
+
+    def test_comment_create(self):
+        self.assertQueryBudget('comment-create', self.grow_comments, lambda: self.count_queries(
+            self.new_viewer(), 'post', '/api/comment/', {'blog': self.blog.id, 'comment': 'New comment'}
+        ))
+
+    def test_comment_like(self):
+        self.assertQueryBudget('comment-like', self.grow_comments, lambda: self.count_queries(
+            self.new_viewer(), 'post', f'/api/comment/like/{self.comment.id}/'
+        ))
+
+    def test_reply_create(self):
+        self.assertQueryBudget('reply-create', self.grow_comments, lambda: self.count_queries(
+            self.new_viewer(), 'post', '/api/reply/', {'comment': self.comment.id, 'reply': 'New reply'}
+        ))
+
+    def test_reply_like(self):
+        self.assertQueryBudget('reply-like', self.grow_comments, lambda: self.count_queries(
+            self.new_viewer(), 'post', f'/api/reply/like/{self.reply.id}/'
+        ))
+
+    def test_subscribe(self):
+        self.assertQueryBudget('subscribe', self.grow_subscribers, lambda: self.count_queries(
+            self.new_viewer(), 'post', f'/api/subscribe/{self.writer.username}/'
+        ))
+
+    def test_unsubscribe(self):
+        def unsubscribe():
+            subscriber = self.new_viewer()
+            SubscribeTable.objects.create(subscriber=subscriber, author=self.writer)
+            return self.count_queries(subscriber, 'post', f'/api/unsubscribe/{self.writer.username}/')
+        self.assertQueryBudget('unsubscribe', self.grow_subscribers, unsubscribe)
+
+    # --- profile_api/urls.py ---
+
+    def test_profile(self):
+        self.assertQueryBudget('profile', self.grow_blogs, lambda: self.count_queries(
+            self.writer, 'get', '/profile_api/profile/'
+        ))
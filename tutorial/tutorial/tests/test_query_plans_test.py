@@ -0,0 +1,98 @@
+import re
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel, ReplyCommentModel
+from quickstart.models.reaction_models import BlogReactionModel, CommentReactionModel, ReplyReactionModel
+from quickstart.models.signals_model import ActivityLog, ErrorLog
+from quickstart.models.subscription_models import SubscribeTable
+from quickstart.tasks.email_tasks import iter_subscriber_email_chunks
+from quickstart.utils.comment_tree import load_comment_trees
+from quickstart.utils.pagination import encode_cursor, paginate_by_cursor
+from quickstart.utils.subscription_resolver import SubscriptionResolver
+
+User = get_user_model()
+
+# "SCAN <table>" without "USING ... INDEX" is SQLite reading the whole table
+FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+class QueryPlanTest(TestCase):
+    """EXPLAIN QUERY PLAN of every hot query: none of them may fall back to a full table scan"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = User.objects.create_user(username='writer', password='testpass123')
+        cls.viewer = User.objects.create_user(username='viewer', password='testpass456')
+        User_Data.objects.create(user=cls.writer, role='writer')
+        User_Data.objects.create(user=cls.viewer, role='viewer')
+        cls.blog = BlogModel.objects.create(user=cls.writer, title='Blog', content='Content')
+        cls.comment = BlogPostCommentModel.objects.create(user=cls.viewer, blog=cls.blog, comment='Comment')
+        cls.reply = ReplyCommentModel.objects.create(user=cls.writer, comment=cls.comment, reply='Reply')
+        SubscribeTable.objects.create(subscriber=cls.viewer, author=cls.writer)
+
+    def plan(self, sql, params=()):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[3] for row in cursor.fetchall()]
+
+    def assertNoFullScan(self, sql, params=()):
+        plan = self.plan(sql, params)
+        scans = [step for step in plan if FULL_SCAN.match(step)]
+        self.assertFalse(scans, f'Full table scan in\n{sql}\nplan: {plan}')
+        return plan
+
+    def assertQuerysetUsesIndex(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        return self.assertNoFullScan(sql, params)
+
+    def assertCodePathUsesIndexes(self, run):
+        with CaptureQueriesContext(connection) as queries:
+            run()
+        self.assertTrue(queries.captured_queries)
+        for query in queries.captured_queries:
+            if query['sql'].startswith('SELECT'):
+                self.assertNoFullScan(query['sql'])
+
+    def test_blog_feed_pages(self):
+        queryset = BlogModel.objects.select_related('user')
+        cursor = encode_cursor(self.blog.created, self.blog.id)
+        self.assertCodePathUsesIndexes(lambda: paginate_by_cursor(queryset, page_size=20))
+        self.assertCodePathUsesIndexes(lambda: paginate_by_cursor(queryset, cursor=cursor, page_size=20))
+
+    def test_comment_trees(self):
+        self.assertCodePathUsesIndexes(lambda: load_comment_trees([self.blog.id]))
+        self.assertCodePathUsesIndexes(lambda: load_comment_trees([self.blog.id], count_reactions=True))
+
+    def test_subscription_resolver(self):
+        self.assertCodePathUsesIndexes(lambda: SubscriptionResolver(self.viewer).resolve([self.writer.id]))
+
+    def test_subscription_lookups(self):
+        plan = self.assertQuerysetUsesIndex(
+            SubscribeTable.objects.filter(author=self.writer, is_active=True)
+        )
+        self.assertTrue(any('sub_author_active_idx' in step for step in plan), plan)
+        plan = self.assertQuerysetUsesIndex(
+            SubscribeTable.objects.filter(subscriber=self.viewer, author=self.writer, is_active=True)
+        )
+        # The partial unique index of the active rows serves it as well
+        self.assertTrue(any(
+            'sub_subscriber_author_idx' in step or 'unique_active_subscription' in step for step in plan
+        ), plan)
+
+    def test_notification_recipients(self):
+        self.assertCodePathUsesIndexes(lambda: list(iter_subscriber_email_chunks(self.writer.id, 100)))
+
+    def test_reaction_counts(self):
+        self.assertQuerysetUsesIndex(BlogReactionModel.objects.filter(blog=self.blog, reaction='like'))
+        self.assertQuerysetUsesIndex(CommentReactionModel.objects.filter(comment=self.comment, reaction='like'))
+        self.assertQuerysetUsesIndex(ReplyReactionModel.objects.filter(reply=self.reply, reaction='dislike'))
+
+    def test_logs_by_time(self):
+        since = timezone.now() - timedelta(days=1)
+        self.assertQuerysetUsesIndex(ActivityLog.objects.filter(timestamp__gte=since).order_by('-timestamp'))
+        self.assertQuerysetUsesIndex(ErrorLog.objects.filter(created__gte=since).order_by('-created'))
@@ -144,6 +144,29 @@ class ReactionViewsTest(APITestCase):
         self.assertTrue(
             BlogReactionModel.objects.filter(user=self.other_user, blog=self.blog, reaction='dislike').exists())
 
+    def test_reaction_returns_updated_counts(self):
+        self.authenticate(self.other_user)
+
+        response = self.client.post(self.blog_like_url)
+        self.assertEqual(response.json()['data'], {'likes': 1, 'dislikes': 0})
+
+        # Switching moves the count from likes to dislikes
+        response = self.client.post(self.blog_dislike_url)
+        self.assertEqual(response.json()['data'], {'likes': 0, 'dislikes': 1})
+
+        # Same reaction again removes it
+        response = self.client.post(self.blog_dislike_url)
+        self.assertEqual(response.json()['data'], {'likes': 0, 'dislikes': 0})
+
+        self.authenticate(self.owner)
+        self.client.post(self.comment_like_url)
+        self.authenticate(self.other_user)
+        response = self.client.post(self.comment_like_url)
+        self.assertEqual(response.json()['data'], {'likes': 2, 'dislikes': 0})
+
+        self.comment.refresh_from_db()
+        self.assertEqual((self.comment.likes, self.comment.dislikes), (2, 0))
+
     def test_blog_not_found(self):
         self.authenticate(self.other_user)
         response = self.client.post('/api/blog/like/999/')
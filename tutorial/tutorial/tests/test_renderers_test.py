@@ -0,0 +1,60 @@
+import json
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import SimpleTestCase
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel
+from quickstart.utils import renderers
+from quickstart.utils.response_handler import ResponseHandler
+
+User = get_user_model()
+
+
+class RenderersTest(SimpleTestCase):
+    def test_json_matches_django_encoder(self):
+        payload = {
+            'created': datetime(2024, 5, 1, 10, 30, 15, 123456, tzinfo=timezone.utc),
+            'price': Decimal('1.50'),
+            1: 'non string key',
+            'nested': [{'title': 'Blog', 'likes': 3}],
+        }
+        self.assertEqual(
+            json.loads(renderers.dumps_json(payload)),
+            json.loads(json.dumps(payload, cls=DjangoJSONEncoder))
+        )
+
+    def test_envelope_renders_json_outside_the_handler(self):
+        response = ResponseHandler.success(data={'id': 1}, message='Done')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content)['data'], {'id': 1})
+
+
+class ContentNegotiationTest(APITestCase):
+    def setUp(self):
+        self.viewer = User.objects.create_user(username='viewer', password='testpass123')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+        BlogModel.objects.create(user=self.viewer, title='Blog', content='Content')
+        self.client.force_authenticate(user=self.viewer)
+
+    def test_json_by_default(self):
+        response = self.client.get('/api/blog/')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('Accept', response['Vary'])
+        self.assertEqual(response.json()['data'][0]['title'], 'Blog')
+
+    @unittest.skipUnless(renderers.msgpack_available(), 'msgpack is not installed')
+    def test_msgpack_when_accepted(self):
+        json_body = self.client.get('/api/blog/').json()
+        response = self.client.get('/api/blog/', HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(renderers.msgpack.unpackb(response.content), json_body)
+
+    @unittest.skipIf(renderers.msgpack_available(), 'msgpack is installed')
+    def test_json_is_used_when_msgpack_is_not_installed(self):
+        response = self.client.get('/api/blog/', HTTP_ACCEPT='application/msgpack, application/json;q=0.5')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()['data'][0]['title'], 'Blog')
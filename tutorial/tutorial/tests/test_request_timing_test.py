@@ -0,0 +1,70 @@
+import re
+import tempfile
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.blog_models import BlogModel
+from quickstart.utils.request_timing import load_timing_summary, percentile
+
+SERVER_TIMING = re.compile(
+    r'^db;dur=(?P<db>[\d.]+);desc="(?P<queries>\d+) queries", view;dur=(?P<view>[\d.]+), '
+    r'render;dur=(?P<render>[\d.]+), total;dur=(?P<total>[\d.]+)$'
+)
+
+
+class RequestTimingTest(APITestCase):
+
+    def setUp(self):
+        self.viewer = User.objects.create_user(username='viewer', password='testpass123')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+        writer = User.objects.create_user(username='writer', password='testpass123')
+        BlogModel.objects.create(user=writer, title='Blog', content='Content')
+        self.client.force_authenticate(user=self.viewer)
+
+    def timing(self, response):
+        match = SERVER_TIMING.match(response['Server-Timing'])
+        self.assertIsNotNone(match, response['Server-Timing'])
+        return {name: float(value) for name, value in match.groupdict().items()}
+
+    def test_server_timing_header(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/blog/')
+        timing = self.timing(response)
+        self.assertEqual(timing['queries'], len(queries))
+        self.assertLessEqual(timing['view'] + timing['render'], timing['total'] + 0.1)
+        self.assertLessEqual(timing['db'], timing['total'] + 0.1)
+
+    def test_header_on_plain_responses(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get('/api/login/')
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+    def test_structured_log(self):
+        with self.assertLogs('quickstart.performance', level='INFO') as logs:
+            self.client.get('/api/blog/')
+        self.assertIn('"route": "GET blogpost"', logs.output[0])
+        self.assertIn('"status": 200', logs.output[0])
+
+    def test_rolling_summary_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(REQUEST_TIMING_SUMMARY_DIR=directory, REQUEST_TIMING_FLUSH_EVERY=3):
+                for _ in range(3):
+                    self.client.get('/api/blog/')
+                summary = load_timing_summary(directory)
+                out = StringIO()
+                call_command('request_timing_summary', stdout=out)
+
+        self.assertEqual(summary['GET blogpost']['requests'], 3)
+        self.assertLessEqual(summary['GET blogpost']['total']['p50'], summary['GET blogpost']['total']['p99'])
+        self.assertIn('GET blogpost', out.getvalue())
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.9), 7)
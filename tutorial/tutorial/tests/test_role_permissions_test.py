@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.signals_model import ErrorLog
+from quickstart.permissions.roles import IsReaderOrWriter, IsWriter, RoleDenied, get_request_role
+
+User = get_user_model()
+
+
+class RoleClaimTest(APITestCase):
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.viewer = User.objects.create_user(username='viewer', password='testpass456')
+        User_Data.objects.create(user=self.writer, role='Writer')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+
+    def request_for(self, user, claims=None):
+        return SimpleNamespace(user=user, auth=claims)
+
+    def test_login_puts_role_in_access_token(self):
+        response = self.client.post('/api/login/', {'username': 'writer', 'password': 'testpass123'})
+        access = AccessToken(response.json()['data']['tokens']['access'])
+        self.assertEqual(access['role'], 'writer')
+
+    def test_role_is_read_from_claims_without_queries(self):
+        user = User(id=self.writer.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_request_role(self.request_for(user, {'role': 'writer'})), 'writer')
+
+    def test_tokens_without_role_fall_back_to_profile(self):
+        user = User.objects.get(id=self.writer.id)
+        self.assertEqual(get_request_role(self.request_for(user, {})), 'writer')
+
+    def test_permission_classes(self):
+        writer_request = self.request_for(self.writer, {'role': 'writer'})
+        viewer_request = self.request_for(self.viewer, {'role': 'viewer'})
+        self.assertTrue(IsWriter().has_permission(writer_request, None))
+        with self.assertRaises(RoleDenied):
+            IsWriter().has_permission(viewer_request, None)
+        self.assertTrue(IsReaderOrWriter().has_permission(viewer_request, None))
+        with self.assertRaises(RoleDenied):
+            IsReaderOrWriter().has_permission(self.request_for(self.viewer, {'role': 'admin'}), None)
+
+    def test_denied_role_gets_the_views_error_envelope(self):
+        self.client.force_authenticate(user=self.viewer)
+        response = self.client.delete('/api/blog/1/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['code'], -1)
+        self.assertEqual(response.json()['message'], 'You are Viewer you are not allowed to change Delete blog')
+        self.assertEqual(ErrorLog.objects.get().message, 'Viewer is trying to delete blog')
+
+    def test_views_authorize_from_the_token_claim(self):
+        refresh = RefreshToken.for_user(self.viewer)
+        refresh['role'] = 'viewer'
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        response = self.client.post('/api/blog/', {'title': 'Title', 'content': 'Content'})
+        self.assertEqual(response.json()['message'], 'Only Writers are allowed to post')
@@ -0,0 +1,70 @@
+from io import StringIO
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count, Q
+from django.test import TestCase
+from quickstart.models.signals_model import ActivityLog
+from quickstart.models.blog_models import BlogModel, BlogPostCommentModel
+from quickstart.models.subscription_models import AuthorSubscriptionStats, SubscribeTable
+
+
+class SeedBlogDataTest(TestCase):
+
+    def seed(self, **options):
+        options = {'users': 40, 'blogs': 60, 'comments_per_blog': 4, 'reactions_per_blog': 3, 'seed': 7, **options}
+        call_command('seed_blog_data', stdout=StringIO(), **options)
+
+    def snapshot(self, prefix):
+        blogs = BlogModel.objects.filter(user__username__startswith=prefix).order_by('id')
+        return [(blog.user.username[len(prefix):], blog.title, blog.likes, blog.comments.count()) for blog in blogs]
+
+    def test_creates_every_table_without_signals(self):
+        self.seed()
+        self.assertEqual(User.objects.count(), 40)
+        self.assertEqual(User.objects.filter(profile__role='writer').count(), 4)
+        self.assertEqual(BlogModel.objects.count(), 60)
+        self.assertEqual(BlogPostCommentModel.objects.count(), 240)
+        self.assertTrue(SubscribeTable.objects.exists())
+        # bulk_create: the per-row signal handlers did not log anything
+        self.assertFalse(ActivityLog.objects.exists())
+
+    def test_counters_match_the_tables(self):
+        self.seed()
+        blogs = BlogModel.objects.annotate(
+            reaction_likes=Count('blogreactionmodel', filter=Q(blogreactionmodel__reaction='like'))
+        )
+        for blog in blogs:
+            self.assertEqual(blog.likes, blog.reaction_likes)
+        for stats in AuthorSubscriptionStats.objects.all():
+            self.assertEqual(
+                stats.active_subscribers,
+                SubscribeTable.objects.filter(author=stats.author, is_active=True).count()
+            )
+
+    def test_same_seed_same_dataset(self):
+        self.seed(prefix='a')
+        self.seed(prefix='b')
+        self.seed(prefix='c', seed=8)
+        self.assertEqual(self.snapshot('a'), self.snapshot('b'))
+        self.assertNotEqual(self.snapshot('a'), self.snapshot('c'))
+
+    def test_skew_concentrates_blogs_on_few_authors(self):
+        self.seed(users=200, blogs=400, skew=1.5)
+        per_author = sorted(BlogModel.objects.values('user').annotate(n=Count('id')).values_list('n', flat=True))
+        # 20 writers: an even spread would give each of them 20 blogs
+        self.assertGreater(per_author[-1], 4 * 20)
+
+    def test_seeded_users_can_log_in(self):
+        self.seed(users=5, blogs=2)
+        self.assertIsNotNone(authenticate(username='seed0', password='seedpass123'))
+
+    def test_more_reactions_than_users(self):
+        self.seed(users=1, blogs=3, reactions_per_comment=3)
+        self.assertEqual(BlogPostCommentModel.objects.count(), 12)
+
+    def test_refuses_existing_prefix(self):
+        self.seed(users=5, blogs=2)
+        with self.assertRaises(CommandError):
+            self.seed(users=5, blogs=2)
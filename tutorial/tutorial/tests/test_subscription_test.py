@@ -0,0 +1,144 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.test import APIClient, APITestCase
+from quickstart.models.authentication_models import User_Data
+from quickstart.models.subscription_models import AuthorSubscriptionStats, SubscribeTable, UnsubscribeTable
+
+User = get_user_model()
+
+
+class SubscriptionTest(APITestCase):
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.viewer = User.objects.create_user(username='viewer', password='testpass456')
+        self.other_viewer = User.objects.create_user(username='other_viewer', password='testpass789')
+
+        User_Data.objects.create(user=self.writer, role='writer')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+        User_Data.objects.create(user=self.other_viewer, role='viewer')
+
+        self.subscribe_url = f'/api/subscribe/{self.writer.username}/'
+        self.unsubscribe_url = f'/api/unsubscribe/{self.writer.username}/'
+
+    def authenticate(self, user):
+        self.client.force_authenticate(user=user)
+
+    def counters(self):
+        stats = AuthorSubscriptionStats.objects.get(author=self.writer)
+        return stats.active_subscribers, stats.total_subscriptions_ever
+
+    def test_subscribe_and_unsubscribe_update_counters(self):
+        self.authenticate(self.viewer)
+        response = self.client.post(self.subscribe_url)
+        self.assertEqual(response.json()['message'], 'Successfully subscribed to writer')
+        self.assertEqual(self.counters(), (1, 1))
+
+        self.authenticate(self.other_viewer)
+        self.client.post(self.subscribe_url)
+        self.assertEqual(self.counters(), (2, 2))
+
+        response = self.client.post(self.unsubscribe_url)
+        self.assertEqual(response.json()['message'], 'Successfully unsubscribed from writer.')
+        self.assertEqual(self.counters(), (1, 2))
+
+    def test_rejected_subscription_leaves_counters_alone(self):
+        self.authenticate(self.viewer)
+        self.client.post(self.subscribe_url)
+        response = self.client.post(self.subscribe_url)
+        self.assertEqual(response.json()['message'], 'You are already subscribed to writer')
+        self.assertEqual(self.counters(), (1, 1))
+
+    def test_rebuild_command_recomputes_counters(self):
+        SubscribeTable.objects.create(subscriber=self.viewer, author=self.writer)
+        SubscribeTable.objects.create(subscriber=self.other_viewer, author=self.writer, is_active=False)
+        AuthorSubscriptionStats.objects.create(author=self.writer, active_subscribers=99)
+
+        call_command('rebuild_subscription_counters', stdout=StringIO())
+        self.assertEqual(self.counters(), (1, 2))
+
+
+class ConcurrentSubscriptionTest(TransactionTestCase):
+    """Several threads clicking subscribe / unsubscribe for the same pair at the same time"""
+
+    threads = 8
+
+    @classmethod
+    def setUpClass(cls):
+        # The threads need real SQLite locking, which the in-memory test database does not have:
+        # this case runs on a file copy of it
+        cls.memory_name = connection.settings_dict['NAME']
+        # Holds the in-memory database open while the default connection points at the file
+        cls.memory = sqlite3.connect(cls.memory_name, uri=True)
+        cls.directory = tempfile.mkdtemp(prefix='concurrency-test-')
+        file_database = sqlite3.connect(os.path.join(cls.directory, 'test.sqlite3'))
+        cls.memory.backup(file_database)
+        file_database.close()
+        connection.settings_dict['NAME'] = os.path.join(cls.directory, 'test.sqlite3')
+        connection.close()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connection.close()
+        connection.settings_dict['NAME'] = cls.memory_name
+        connection.ensure_connection()
+        cls.memory.close()
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.writer = User.objects.create_user(username='writer', password='testpass123')
+        self.viewer = User.objects.create_user(username='viewer', password='testpass456')
+        User_Data.objects.create(user=self.writer, role='writer')
+        User_Data.objects.create(user=self.viewer, role='viewer')
+
+    def hammer(self, url):
+        barrier = threading.Barrier(self.threads)
+        messages = []
+
+        def click():
+            client = APIClient()
+            client.force_authenticate(user=self.viewer)
+            try:
+                barrier.wait()
+                messages.append(client.post(url).json()['message'])
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=click) for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return messages
+
+    def counters(self):
+        stats = AuthorSubscriptionStats.objects.get(author=self.writer)
+        return stats.active_subscribers, stats.total_subscriptions_ever
+
+    def test_concurrent_subscribes_create_one_active_subscription(self):
+        messages = self.hammer(f'/api/subscribe/{self.writer.username}/')
+
+        self.assertEqual(messages.count('Successfully subscribed to writer'), 1)
+        self.assertEqual(messages.count('You are already subscribed to writer'), self.threads - 1)
+        self.assertEqual(SubscribeTable.objects.filter(is_active=True).count(), 1)
+        self.assertEqual(self.counters(), (1, 1))
+
+    def test_concurrent_unsubscribes_deactivate_once(self):
+        client = APIClient()
+        client.force_authenticate(user=self.viewer)
+        client.post(f'/api/subscribe/{self.writer.username}/')
+
+        messages = self.hammer(f'/api/unsubscribe/{self.writer.username}/')
+
+        self.assertEqual(messages.count('Successfully unsubscribed from writer.'), 1)
+        self.assertEqual(UnsubscribeTable.objects.count(), 1)
+        self.assertEqual(self.counters(), (0, 1))
@@ -7,11 +7,21 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 EMAIL_HOST_USER = config('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD')
 import os
+import sys
+from importlib.util import find_spec
+from django.core.exceptions import ImproperlyConfigured
+
+# True under `manage.py test`, other runners load tutorial/test_settings.py instead
+TESTING = sys.argv[1:2] == ['test']
 
 EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = os.getenv('EMAIL_HOST', 'smtp.gmail.com')
 EMAIL_PORT = int(os.getenv('EMAIL_PORT', 587))
 EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True') == 'True'
+# Recipients sent over one SMTP connection in send_blog_notification_email
+EMAIL_BATCH_SIZE = int(os.getenv('EMAIL_BATCH_SIZE', 100))
+# Recipients per delivery subtask dispatched by fan_out_blog_notification
+NOTIFICATION_FANOUT_CHUNK_SIZE = int(os.getenv('NOTIFICATION_FANOUT_CHUNK_SIZE', 500))
 
 
 # SECURITY WARNING: keep the secret key used in production secret!
@@ -30,10 +40,41 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 CELERY_TASK_ALWAYS_EAGER = False  # Set to True for testing without Celery worker
-# Windows-specific settings
-CELERY_WORKER_POOL = 'solo'  # or 'eventlet' or 'gevent'
-CELERY_WORKER_CONCURRENCY = 1
-CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Every kind of task has its own queue, so a big notification fan-out does not hold up the activity logs
+# or the maintenance jobs. Run a worker per queue, e.g.
+#     CELERY_WORKER_PROFILE=threads celery -A tutorial worker -Q notifications
+#     CELERY_WORKER_PROFILE=prefork celery -A tutorial worker -Q activity,maintenance,celery
+CELERY_TASK_DEFAULT_QUEUE = 'celery'
+CELERY_TASK_ROUTES = {
+    'quickstart.tasks.email_tasks.*': {'queue': 'notifications'},
+    'quickstart.tasks.activity_tasks.*': {'queue': 'activity'},
+    'quickstart.tasks.maintenance_tasks.*': {'queue': 'maintenance'},
+}
+# Worker pool settings by CELERY_WORKER_PROFILE:
+#   threads: notification delivery, mostly waiting on SMTP, so many threads in one process
+#   prefork: database bound work (activity logs, maintenance), a process per core
+#   solo:    Windows (no prefork there) and debugging
+# acks_late: a task is only taken off the queue once it is done, so a worker dying mid-task means that task
+# runs again. Only the idempotent maintenance jobs rely on it (prefork), the notification and activity log
+# tasks would send or insert twice and turn it off for themselves, so threads leaves it off. A prefetch of 1
+# keeps a busy notification worker from hoarding tasks an idle one could run.
+CELERY_WORKER_PROFILES = {
+    'threads': {'pool': 'threads', 'concurrency': 20, 'prefetch_multiplier': 1, 'acks_late': False},
+    'prefork': {'pool': 'prefork', 'concurrency': os.cpu_count() or 1, 'prefetch_multiplier': 4, 'acks_late': True},
+    'solo': {'pool': 'solo', 'concurrency': 1, 'prefetch_multiplier': 1, 'acks_late': False},
+}
+CELERY_WORKER_PROFILE = os.getenv('CELERY_WORKER_PROFILE', 'solo' if os.name == 'nt' else 'prefork')
+if CELERY_WORKER_PROFILE not in CELERY_WORKER_PROFILES:
+    raise ImproperlyConfigured(
+        f"CELERY_WORKER_PROFILE must be one of {', '.join(CELERY_WORKER_PROFILES)}, not {CELERY_WORKER_PROFILE!r}"
+    )
+_worker_profile = CELERY_WORKER_PROFILES[CELERY_WORKER_PROFILE]
+CELERY_WORKER_POOL = _worker_profile['pool']
+CELERY_WORKER_CONCURRENCY = int(os.getenv('CELERY_WORKER_CONCURRENCY', _worker_profile['concurrency']))
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(
+    os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', _worker_profile['prefetch_multiplier'])
+)
+CELERY_TASK_ACKS_LATE = _worker_profile['acks_late']
 
 
 INSTALLED_APPS = [
@@ -53,6 +94,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'quickstart.utils.request_timing.RequestTimingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -61,6 +103,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'quickstart.utils.renderers.ContentNegotiationMiddleware',
+    'quickstart.utils.db_router.ReadYourWritesMiddleware',
 ]
 CORS_ALLOW_ALL_ORIGINS = True
 ROOT_URLCONF = 'tutorial.urls'
@@ -84,11 +128,78 @@ TEMPLATES = [
 REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'quickstart.utils.custom_exception_handler.custom_exception_handler',
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+        'quickstart.utils.authentication.CachedJWTAuthentication',
+    ),
+    # orjson for JSON, MessagePack for clients that send Accept: application/msgpack (see quickstart/utils/renderers.py)
+    'DEFAULT_RENDERER_CLASSES': [
+        'quickstart.utils.renderers.ORJSONRenderer',
+        *(['quickstart.utils.renderers.MessagePackRenderer'] if find_spec('msgpack') else []),
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ]
 }
 WSGI_APPLICATION = 'tutorial.wsgi.application'
 
+# Activity log pipeline (see quickstart/utils/activity_pipeline.py): 'thread', 'celery' or 'sync'.
+# Tests write straight away ('sync') so they can assert on the rows
+ACTIVITY_LOG_MODE = os.getenv('ACTIVITY_LOG_MODE', 'sync' if TESTING else 'thread')
+ACTIVITY_LOG_BATCH_SIZE = int(os.getenv('ACTIVITY_LOG_BATCH_SIZE', 200))
+ACTIVITY_LOG_MAX_QUEUE = int(os.getenv('ACTIVITY_LOG_MAX_QUEUE', 10000))
+ACTIVITY_LOG_FLUSH_INTERVAL = float(os.getenv('ACTIVITY_LOG_FLUSH_INTERVAL', 1.0))
+
+# Error log sink (see quickstart/utils/error_log_sink.py): 'thread' or 'sync', 'sync' in tests as above
+ERROR_LOG_MODE = os.getenv('ERROR_LOG_MODE', 'sync' if TESTING else 'thread')
+ERROR_LOG_BATCH_SIZE = int(os.getenv('ERROR_LOG_BATCH_SIZE', 200))
+ERROR_LOG_MAX_QUEUE = int(os.getenv('ERROR_LOG_MAX_QUEUE', 10000))
+ERROR_LOG_FLUSH_INTERVAL = float(os.getenv('ERROR_LOG_FLUSH_INTERVAL', 2.0))
+# Identical (path, method, message) errors: first BURST per WINDOW seconds are kept, the rest are counted
+ERROR_LOG_SAMPLE_BURST = int(os.getenv('ERROR_LOG_SAMPLE_BURST', 20))
+ERROR_LOG_SAMPLE_WINDOW = float(os.getenv('ERROR_LOG_SAMPLE_WINDOW', 60))
+
+# Blog feed pagination (cursor based, see quickstart/utils/pagination.py)
+BLOG_PAGE_SIZE = int(os.getenv('BLOG_PAGE_SIZE', 20))
+BLOG_MAX_PAGE_SIZE = int(os.getenv('BLOG_MAX_PAGE_SIZE', 100))
+# Blogs read, encoded and streamed at a time by the export (see quickstart/views/blog_export.py)
+BLOG_EXPORT_BATCH_SIZE = int(os.getenv('BLOG_EXPORT_BATCH_SIZE', 500))
+
+# Caches: local memory by default, which is per process. Point CACHE_BACKEND / CACHE_LOCATION at redis or memcached
+# when running several workers, otherwise a worker keeps serving a blog payload another one changed for up to
+# BLOG_CACHE_TIMEOUT seconds
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'blog-api'),
+    }
+}
+# Versioned blog payload cache (see quickstart/utils/blog_cache.py)
+BLOG_CACHE_ALIAS = 'default'
+BLOG_CACHE_TIMEOUT = int(os.getenv('BLOG_CACHE_TIMEOUT', 300))
+# User + profile loaded by the JWT authentication (see quickstart/utils/authentication.py), 0 disables it
+AUTH_USER_CACHE_ALIAS = 'default'
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_CACHE_TIMEOUT', 60))
+
+# Request timings (see quickstart/utils/request_timing.py): requests slower than REQUEST_TIMING_SLOW_MS
+# are logged as WARNING, set REQUEST_TIMING_LOG_LEVEL=INFO to log every request
+REQUEST_TIMING_SLOW_MS = float(os.getenv('REQUEST_TIMING_SLOW_MS', 500))
+# Directory of the per-view rolling windows read by manage.py request_timing_summary, empty disables them
+REQUEST_TIMING_SUMMARY_DIR = os.getenv('REQUEST_TIMING_SUMMARY_DIR', '')
+REQUEST_TIMING_WINDOW = int(os.getenv('REQUEST_TIMING_WINDOW', 1000))
+REQUEST_TIMING_FLUSH_EVERY = int(os.getenv('REQUEST_TIMING_FLUSH_EVERY', 100))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'quickstart.performance': {
+            'handlers': ['console'],
+            'level': os.getenv('REQUEST_TIMING_LOG_LEVEL', 'WARNING'),
+            'propagate': False,
+        },
+    },
+}
+
 
 from datetime import timedelta
 
@@ -112,6 +223,60 @@ DATABASES = {
     }
 }
 
+# Opt-in SQLite tuning for serving traffic (SQLITE_PRODUCTION=1), the pragmas run on every new connection.
+# WAL lets readers go on while one connection writes, and IMMEDIATE transactions take the write lock when they
+# begin (waiting up to SQLITE_BUSY_TIMEOUT_MS for it) instead of failing with "database is locked" when a
+# read inside the transaction has to be upgraded to a write. benchmarks/sqlite_concurrency.py compares both.
+SQLITE_PRODUCTION = os.getenv('SQLITE_PRODUCTION', '') == '1'
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+SQLITE_PRODUCTION_OPTIONS = {
+    'transaction_mode': 'IMMEDIATE',
+    'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000,
+    'init_command': ';'.join([
+        'PRAGMA journal_mode=WAL',
+        # Durable at every checkpoint rather than every commit, safe against corruption in WAL mode
+        'PRAGMA synchronous=NORMAL',
+        f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}',
+        f"PRAGMA mmap_size={int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))}",
+        # Negative: in KiB instead of pages
+        f"PRAGMA cache_size=-{int(os.getenv('SQLITE_CACHE_SIZE_KB', 64 * 1024))}",
+        'PRAGMA temp_store=MEMORY',
+    ]),
+}
+if SQLITE_PRODUCTION:
+    DATABASES['default']['OPTIONS'] = SQLITE_PRODUCTION_OPTIONS
+    # Keep connections (and their pragmas / page cache) between requests
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Read replica (see quickstart/utils/db_router.py): with DATABASE_REPLICA_NAME set, the GETs of the blog list,
+# blog detail and profile read from it, everything else uses default
+DATABASE_REPLICA_NAME = os.getenv('DATABASE_REPLICA_NAME', '')
+if DATABASE_REPLICA_NAME:
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': DATABASE_REPLICA_NAME,
+        'OPTIONS': DATABASES['default'].get('OPTIONS', {}),
+    }
+elif TESTING:
+    # tests/test_db_router_test.py turns the read routing on over this alias (in-memory in the test run, and
+    # only created when that test case runs), the other tests keep reading from default
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'replica.sqlite3',
+    }
+DATABASE_ROUTERS = ['quickstart.utils.db_router.ReadReplicaRouter']
+READ_REPLICA_ALIAS = 'replica' if DATABASE_REPLICA_NAME else ''
+# Seconds a user reads from default after one of their writes, should cover the replication lag
+READ_REPLICA_PIN_SECONDS = int(os.getenv('READ_REPLICA_PIN_SECONDS', 5))
+# The pins are written by the worker that handled the write and read by any worker, so the cache has to be shared
+READ_REPLICA_CACHE_ALIAS = 'default'
+if DATABASE_REPLICA_NAME and CACHES[READ_REPLICA_CACHE_ALIAS]['BACKEND'].endswith('.LocMemCache'):
+    raise ImproperlyConfigured(
+        'DATABASE_REPLICA_NAME needs a cache shared by the workers (CACHE_BACKEND), the local memory cache would '
+        'keep the read-your-writes pins to the worker that set them'
+    )
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
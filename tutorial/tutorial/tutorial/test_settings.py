@@ -0,0 +1,20 @@
+"""
+Settings for the test suite under a runner other than `manage.py test` (which tutorial/settings.py
+recognises by itself):
+
+    DJANGO_SETTINGS_MODULE=tutorial.test_settings
+"""
+from tutorial.settings import *  # noqa: F401,F403
+from tutorial.settings import BASE_DIR, DATABASES
+
+TESTING = True
+
+# Audit rows are written straight away instead of by the background writers, so tests can assert on them
+ACTIVITY_LOG_MODE = 'sync'
+ERROR_LOG_MODE = 'sync'
+
+# Same alias as settings.py defines under `manage.py test`, see tests/test_db_router_test.py
+DATABASES.setdefault('replica', {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': BASE_DIR / 'replica.sqlite3',
+})